@@ -0,0 +1,341 @@
+#!/usr/bin/python
+from array import array
+
+
+class ArenaLinkedList(object):
+    """ Implementation of a Linked List stored as parallel arrays.
+
+        Every item is a slot: its value lives in `values[slot]`, and its links
+        are the slot numbers in `next[slot]` and `prev[slot]`, both typed
+        array('l'). No per-item python object is created.
+
+        Slot 0 is the head. As in LinkedList, it is always referenced by the
+        final item, and it references itself when the list is empty. Slots of
+        removed items are chained into a free list, through `next`, and reused
+        by the following inserts.
+
+        Items have no element of their own, so unlike LinkedList, `get`, `pop`,
+        indexing and iteration hand back the values themselves.
+    """
+
+    def __init__(self):
+        """ creates the head slot, sets length to 0 """
+        self.__next = array('l', [0])
+        self.__prev = array('l', [0])
+        self.__values = [-1]
+        self.__length = 0
+        self.__free = 0 # first free slot, 0 when there are none
+
+        # index and slot of the last requested index
+        self.__cache_index = -1
+        self.__cache_slot = 0
+
+    ################
+    ## Properties ##
+    ################
+    @property
+    def length(self):
+        """ number of items in the list """
+        return self.__length
+
+    @property
+    def capacity(self):
+        """ number of slots allocated, excluding the head """
+        return len(self.__values) - 1
+
+    ##############################
+    ## Private / helper methods ##
+    ##############################
+    def _get_nth_slot(self, indx):
+        """ slot of the `indx`th item, walking from whichever of the head, the
+            tail and the cached slot is closest
+
+            indx of -1 == head slot, 0
+        """
+        if (not isinstance(indx, int)):
+            raise TypeError("index must be type {}, you passed {}".format(int, type(indx)))
+
+        elif (indx < -1 or indx >= self.__length):
+            raise IndexError("index out of range")
+
+        # start at the head...
+        i = -1
+        slot = 0
+        distance = indx + 1
+
+        # ...unless the tail...
+        if (self.__length - 1 - indx < distance):
+            i = self.__length - 1
+            slot = self.__prev[0]
+            distance = i - indx
+
+        # ...or the cached slot is closer
+        if (abs(indx - self.__cache_index) < distance):
+            i = self.__cache_index
+            slot = self.__cache_slot
+
+        nxt = self.__next
+        while (i < indx):
+            slot = nxt[slot]
+            i += 1
+
+        prv = self.__prev
+        while (i > indx):
+            slot = prv[slot]
+            i -= 1
+
+        self.__cache_index = indx
+        self.__cache_slot = slot
+        return slot
+
+    def _insert_after(self, value, indx):
+        """ store `value` in a free slot and link it after the `indx`th item """
+        prev_slot = self._get_nth_slot(indx)
+
+        # take a slot off the free list, or grow the arena
+        slot = self.__free
+        if (slot):
+            self.__free = self.__next[slot]
+            self.__values[slot] = value
+        else:
+            slot = len(self.__values)
+            self.__values.append(value)
+            self.__next.append(0)
+            self.__prev.append(0)
+
+        next_slot = self.__next[prev_slot]
+        self.__next[slot] = next_slot
+        self.__prev[slot] = prev_slot
+        self.__next[prev_slot] = slot
+        self.__prev[next_slot] = slot
+
+        self.__length += 1
+
+    def _pop_after(self, indx):
+        """ unlink the item after the `indx`th, free its slot and return its value """
+        prev_slot = self._get_nth_slot(indx)
+        slot = self.__next[prev_slot]
+        if (slot == 0):
+            raise IndexError("index out of range")
+
+        next_slot = self.__next[slot]
+        self.__next[prev_slot] = next_slot
+        self.__prev[next_slot] = prev_slot
+
+        value = self.__values[slot]
+        self.__values[slot] = None
+        self.__next[slot] = self.__free
+        self.__free = slot
+
+        self.__length -= 1
+        return value
+
+    def _free_slots(self, slots):
+        """ unlink every slot in `slots` and put it on the free list """
+        nxt = self.__next
+        prv = self.__prev
+        for slot in slots:
+            nxt[prv[slot]] = nxt[slot]
+            prv[nxt[slot]] = prv[slot]
+            self.__values[slot] = None
+            nxt[slot] = self.__free
+            self.__free = slot
+            self.__length -= 1
+
+        self.__cache_index = -1
+        self.__cache_slot = 0
+
+    def _slice_positions(self, slice_k):
+        """ (first index, number of items, step) covered by slice_k, walking forwards """
+        start, stop, step = slice_k.indices(self.__length)
+        if (step > 0):
+            count = max(0, (stop - start + step - 1) // step)
+        else:
+            count = max(0, (start - stop - step - 1) // -step)
+
+        if (step < 0 and count):
+            # walk the same positions forwards
+            start = start + step * (count - 1)
+            step = -step
+        return start, count, step
+
+    def _slice_slots(self, slice_k):
+        """ slots covered by slice_k, in the slice's order """
+        start, count, step = self._slice_positions(slice_k)
+        slots = []
+        if (count):
+            nxt = self.__next
+            slot = self._get_nth_slot(start)
+            slots.append(slot)
+            while (len(slots) < count):
+                for i in range(step):
+                    slot = nxt[slot]
+                slots.append(slot)
+
+        if (slice_k.step is not None and slice_k.step < 0):
+            slots.reverse()
+        return slots
+
+    ############################
+    ## Public Methods         ##
+    ############################
+
+    ### Write ###
+    def append(self, value):
+        """ Akin to list's append
+
+            value - @type - any
+                  - @param - stored in a free slot linked before the head
+        """
+        self._insert_after(value, self.__length - 1)
+
+    def prepend(self, value):
+        """ Push to the beginning of an ArenaLinkedList
+
+            value - @type - any
+                  - @param - stored in a free slot linked after the head
+        """
+        self._insert_after(value, -1)
+
+    def pop(self):
+        """ Remove and return the final value in a list """
+        return self._pop_after(self.__length - 2)
+
+    def insert(self, indx, value):
+        """ insert a value btwn ArenaLinkedList[indx - 1] and ArenaLinkedList[indx] """
+        self._insert_after(value, indx - 1)
+
+    def compact(self):
+        """ move every item to slots 1..length in list order and release the
+            free slots, so the arrays are as small and as sequential as they can be
+        """
+        values = [-1]
+        values.extend(self)
+        self.__values = values
+        self.__next = array('l', range(1, len(values) + 1))
+        self.__next[-1] = 0
+        self.__prev = array('l', range(-1, len(values) - 1))
+        self.__prev[0] = len(values) - 1
+        self.__free = 0
+        self.__cache_index = -1
+        self.__cache_slot = 0
+
+    ### Read ###
+    def get(self, indx):
+        """ Same as ArenaLinkedList[indx]
+
+            indx - @type - int
+                 - @param - value to get. If < 0, get `indx`th value from the end of list
+        """
+        if (isinstance(indx, int) and indx < 0):
+            indx = self.__length + indx
+
+        if (indx == -1):
+            raise IndexError("index out of range")
+
+        return self.__values[self._get_nth_slot(indx)]
+
+    ###########################
+    ### Container type methods
+    ### Enables things like len() and iteration
+    ### https://docs.python.org/2/reference/datamodel.html#emulating-container-types
+    ###########################
+    def __iter__(self):
+        """ Iterate through values following the slot links """
+        nxt = self.__next
+        values = self.__values
+        slot = nxt[0]
+        while (slot):
+            yield values[slot]
+            slot = nxt[slot]
+
+    def __len__(self):
+        return self.__length
+
+    def __getitem__(self, key):
+        """ implements self[key] evaluation
+
+            key - @type - int or slice
+                - @param - the nth item you want, or the slice of items you want
+        """
+        if (isinstance(key, slice)):
+            L = type(self)()
+            values = self.__values
+            for slot in self._slice_slots(key):
+                L.append(values[slot])
+            return L
+
+        elif (isinstance(key, int)):
+            return self.get(key)
+
+        else:
+            raise TypeError("Type of {} was passed to __getitem__. Only {} and {} are accepted".format(type(key), slice, int))
+
+    def __setitem__(self, key, value):
+        """ supports self[key] assignment.
+
+            key - @type - slice or int
+                - @param - the indices to replace. As with list, a slice with
+                           a step of 1 can be given any number of values, any
+                           other step one value per index
+
+            value - @type - any or iterable
+                  - @param - the value, or for a slice the values
+        """
+        if (isinstance(key, int)):
+            if (key < 0):
+                key = self.__length + key
+            if (key == -1):
+                raise IndexError("index out of range")
+            self.__values[self._get_nth_slot(key)] = value
+
+        elif (isinstance(key, slice) and hasattr(value, "__iter__")):
+            values = list(value)
+            slots = self._slice_slots(key)
+            if (len(values) != len(slots) and key.step not in (None, 1)):
+                raise ValueError("attempt to assign sequence of size {} to extended slice of size {}".format(len(values), len(slots)))
+
+            for slot, new_value in zip(slots, values):
+                self.__values[slot] = new_value
+
+            if (len(slots) > len(values)):
+                self._free_slots(slots[len(values):])
+            elif (len(values) > len(slots)):
+                # the rest go in after the slots written, one after another
+                indx = self._slice_positions(key)[0] + len(slots) - 1
+                for new_value in values[len(slots):]:
+                    self._insert_after(new_value, indx)
+                    indx += 1
+
+        elif (isinstance(key, slice)):
+            raise TypeError("Tried to assign {} to slice of {}. Only iterables accepted".format(type(value), type(self)))
+
+        else:
+            raise TypeError("Type of {} was passed to __setitem__. Only {} and {} are accepted".format(type(key), slice, int))
+
+    def __delitem__(self, key):
+        """ support for `del self[key]`
+
+            key - @type - int or slice
+                - @param - a index or slice of indices to delete
+        """
+        if (isinstance(key, slice)):
+            self._free_slots(self._slice_slots(key))
+
+        elif (isinstance(key, int)):
+            if (key < 0):
+                key = self.__length + key
+            self._pop_after(key - 1)
+
+        else:
+            raise TypeError("Type of {} was passed to __delitem__. Only {} and {} are accepted".format(type(key), slice, int))
+
+    def __contains__(self, value):
+        """ Is value in self? """
+        for item in self:
+            if (value == item):
+                return True
+        return False
+
+    def __repr__(self):
+        return "[" + ", ".join("{}".format(value) for value in self) + "]"
@@ -0,0 +1,238 @@
+#!/usr/bin/python
+""" An asyncio queue storing its items in a LinkedList.
+
+    Needs python 3.5 or later, for async/await. Nothing else in the package
+    imports this module.
+"""
+import asyncio
+from collections import deque
+from .linkedlist import LinkedList
+
+
+class AsyncLinkedQueue(object):
+    """ A FIFO queue for asyncio producers and consumers, akin to
+        asyncio.Queue, whose items are the values of a LinkedList.
+
+        Waiting is done on futures that are only created when a coroutine
+        has to wait, so `put` into a queue with room and `get` from a queue
+        holding items cost a LinkedList append or pop and nothing more.
+
+        `get_batch` drains up to n items at once by cutting the front of the
+        chain off with LinkedList.split_at and handing it over as a LinkedList,
+        rather than popping the items one by one.
+
+        As with asyncio.Queue, every item put counts as unfinished until
+        `task_done` is called for it, and `join` waits until none are left.
+    """
+
+    def __init__(self, maxsize=0, pool_size=0):
+        """ maxsize - @type - int
+                    - @param - `put` waits while the queue holds this many
+                               items. 0 or less never waits
+
+            pool_size - @type - int
+                      - @param - how many LinkElements taken by `get` to keep
+                                 for reuse by later puts. See LinkedList
+        """
+        if (not isinstance(maxsize, int)):
+            raise TypeError("maxsize must be type {}, you passed {}".format(int, type(maxsize)))
+
+        self.__maxsize = maxsize
+        self.__items = LinkedList(pool_size=pool_size)
+        self.__getters = deque()
+        self.__putters = deque()
+        self.__unfinished = 0
+        self.__finished = None
+
+    ################
+    ## Properties ##
+    ################
+    @property
+    def maxsize(self):
+        """ number of items `put` waits at, 0 or less for no limit """
+        return self.__maxsize
+
+    @property
+    def unfinished(self):
+        """ number of items put that `task_done` has not been called for """
+        return self.__unfinished
+
+    @property
+    def pooled(self):
+        """ number of LinkElements waiting to be reused by puts """
+        return self.__items.pooled
+
+    ##############################
+    ## Private / helper methods ##
+    ##############################
+    def _wakeup_next(self, waiters, n=1):
+        """ wake the first `n` waiters still waiting """
+        while (waiters and n):
+            waiter = waiters.popleft()
+            if (not waiter.done()):
+                waiter.set_result(None)
+                n -= 1
+
+    async def _wait(self, waiters, timeout=None):
+        """ wait to be woken through `waiters`, or for `timeout` seconds.
+            Returns False if the timeout elapsed first
+        """
+        waiter = _loop().create_future()
+        waiters.append(waiter)
+        try:
+            if (timeout is None):
+                await waiter
+            else:
+                await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            self._drop_waiter(waiters, waiter)
+            return False
+        except BaseException:
+            self._drop_waiter(waiters, waiter)
+            raise
+        return True
+
+    def _drop_waiter(self, waiters, waiter):
+        """ forget a waiter that gave up. If it had already been woken, pass
+            the wake-up on so it is not lost
+        """
+        woken = waiter.done() and not waiter.cancelled()
+        waiter.cancel()
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            pass
+        if (woken):
+            self._wakeup_next(waiters)
+
+    def _put(self, item):
+        self.__items.append(item)
+        self.__unfinished += 1
+        if (self.__finished is not None and self.__finished.done()):
+            self.__finished = None
+        self._wakeup_next(self.__getters)
+
+    ############################
+    ## Public Methods         ##
+    ############################
+
+    ### Write ###
+    async def put(self, item):
+        """ add `item` to the back of the queue, first waiting for room if
+            the queue is full
+        """
+        while (self.full()):
+            await self._wait(self.__putters)
+        self._put(item)
+
+    def put_nowait(self, item):
+        """ add `item` to the back of the queue. Raises asyncio.QueueFull if
+            there is no room
+        """
+        if (self.full()):
+            raise asyncio.QueueFull
+        self._put(item)
+
+    def task_done(self, count=1):
+        """ mark `count` items taken from the queue as processed, e.g.
+            len(batch) after working through a get_batch
+        """
+        if (count > self.__unfinished):
+            raise ValueError("task_done() called too many times")
+
+        self.__unfinished -= count
+        if (not self.__unfinished and self.__finished is not None and not self.__finished.done()):
+            self.__finished.set_result(None)
+
+    ### Read ###
+    async def get(self):
+        """ remove and return the front item, first waiting for one if the
+            queue is empty
+        """
+        while (not self.__items.length):
+            await self._wait(self.__getters)
+        return self.get_nowait()
+
+    def get_nowait(self):
+        """ remove and return the front item. Raises asyncio.QueueEmpty if
+            there is none
+        """
+        if (not self.__items.length):
+            raise asyncio.QueueEmpty
+
+        item = self.__items._pop_value_after(-1)
+        self._wakeup_next(self.__putters)
+        return item
+
+    async def get_batch(self, n, timeout=None):
+        """ remove and return up to `n` items from the front, as a LinkedList.
+            The nodes are detached from the queue's chain, not copied
+
+            n - @type - int
+              - @param - the most items to take
+
+            timeout - @type - number or None
+                    - @param - seconds to wait for an item if the queue is
+                               empty. When they elapse the batch is empty.
+                               None waits for as long as it takes
+        """
+        if (not isinstance(n, int) or n < 1):
+            raise ValueError("n must be a positive {}, you passed {}".format(int, n))
+
+        if (not self.__items.length):
+            if (timeout is None):
+                while (not self.__items.length):
+                    await self._wait(self.__getters)
+            else:
+                deadline = _loop().time() + timeout
+                while (not self.__items.length):
+                    remaining = deadline - _loop().time()
+                    if (remaining <= 0 or not await self._wait(self.__getters, remaining)):
+                        break
+
+        # the batch keeps the storage's front, the rest moves to a new list
+        batch = self.__items
+        self.__items = batch._new_list() if n >= batch.length else batch.split_at(n)
+        # the pool stays with the queue, for the puts to come
+        self.__items._take_pool(batch)
+
+        self._wakeup_next(self.__putters, batch.length)
+        if (self.__items.length):
+            # the wake-up this getter took may have been meant for another
+            self._wakeup_next(self.__getters)
+        return batch
+
+    async def join(self):
+        """ wait until every item put has been marked done with task_done """
+        if (self.__unfinished):
+            if (self.__finished is None):
+                self.__finished = _loop().create_future()
+            await asyncio.shield(self.__finished)
+
+    def qsize(self):
+        """ number of items in the queue """
+        return self.__items.length
+
+    def empty(self):
+        return not self.__items.length
+
+    def full(self):
+        return 0 < self.__maxsize <= self.__items.length
+
+    ###########################
+    ### Container type methods
+    ###########################
+    def __len__(self):
+        return self.__items.length
+
+    def __repr__(self):
+        return "<{} maxsize={} qsize={} unfinished={}>".format(
+            type(self).__name__, self.__maxsize, self.__items.length, self.__unfinished)
+
+
+def _loop():
+    """ the running event loop """
+    get_running_loop = getattr(asyncio, "get_running_loop", None)
+    if (get_running_loop is not None):
+        return get_running_loop()
+    return asyncio.get_event_loop()
@@ -0,0 +1,350 @@
+#!/usr/bin/python
+import threading
+
+
+class _LockedNode(object):
+    """ An item of a ConcurrentLinkedList: a value, the next node (None after
+        the final one) and the lock guarding both
+    """
+    __slots__ = ("value", "next", "lock")
+
+    def __init__(self, value=None):
+        self.value = value
+        self.next = None
+        self.lock = threading.Lock()
+
+
+class ConcurrentLinkedList(object):
+    """ Implementation of a Linked List that can be shared between threads.
+
+        The chain starts at a sentinel node, the head, and ends at the tail.
+        Every node has its own lock, guarding its value and its link to the
+        next node:
+
+            - positional operations (get, insert, item assignment and
+              deletion, remove, pop) lock their way along the chain hand over
+              hand, holding a node until its successor is locked, so threads
+              working on different parts of the list pass one another
+            - `append` only takes the tail lock and the tail node
+            - `prepend` and `popleft` only take the head lock and the first
+              nodes. `popleft` turns the first node into the new head, and
+              `prepend` stores its value in the head and puts a new head in
+              front of it, so neither touches the tail unless the list is
+              nearly empty
+
+        Locks are always taken head lock or tail lock first, then nodes in
+        chain order, so no two operations can deadlock.
+
+        Walks remember where they stopped in a per-thread cache, which is only
+        trusted while no other change to the chain has been made, so reads
+        never write shared state.
+
+        Iteration, `in` and `count` take no locks. They are weakly consistent:
+        they see every value present for the whole walk, and may or may not see
+        values added or removed meanwhile. Negative indices are resolved with
+        the length at the time of the call.
+
+        As with ArenaLinkedList, nodes are not handed out: `get`, `pop`,
+        indexing and iteration give back the values themselves.
+    """
+
+    def __init__(self):
+        """ creates the head, sets length to 0 """
+        self.__head = _LockedNode(-1)
+        self.__tail = self.__head
+        self.__head_lock = threading.Lock()
+        self.__tail_lock = threading.Lock()
+
+        # guards length and mod_count, the only state every change updates
+        self.__count_lock = threading.Lock()
+        self.__length = 0
+        self.__mod_count = 0
+
+        # each thread's last (mod_count, index, node)
+        self.__local = threading.local()
+
+    ################
+    ## Properties ##
+    ################
+    @property
+    def length(self):
+        """ number of items in the list """
+        return self.__length
+
+    @property
+    def mod_count(self):
+        """ number of changes made to the chain, not counting item assignment """
+        return self.__mod_count
+
+    ##############################
+    ## Private / helper methods ##
+    ##############################
+    def _changed(self, delta):
+        """ record a change about to be made to the chain. Called with the
+            nodes involved locked and before relinking them, so a thread that
+            locks its cached node and finds mod_count unchanged knows the node
+            is still at the cached index
+        """
+        with self.__count_lock:
+            self.__length += delta
+            self.__mod_count += 1
+
+    def _lock_head(self):
+        """ the current head, locked """
+        with self.__head_lock:
+            node = self.__head
+            node.lock.acquire()
+        return node
+
+    def _lock_nth(self, indx):
+        """ the `indx`th node, locked, reached hand over hand from the head or
+            from this thread's cached node. The caller releases it
+
+            indx of -1 == head
+        """
+        if (not isinstance(indx, int)):
+            raise TypeError("index must be type {}, you passed {}".format(int, type(indx)))
+
+        elif (indx < -1):
+            raise IndexError("index out of range")
+
+        # mod_count is read where the walk starts, so a change made while
+        # walking leaves the cached position stale rather than trusted
+        node = None
+        cached = getattr(self.__local, "position", None)
+        if (cached is not None and -1 < cached[1] <= indx):
+            mod_count, i, node = cached
+            node.lock.acquire()
+            if (mod_count != self.__mod_count):
+                node.lock.release()
+                node = None
+
+        if (node is None):
+            i = -1
+            with self.__head_lock:
+                node = self.__head
+                node.lock.acquire()
+                mod_count = self.__mod_count
+
+        while (i < indx):
+            next_node = node.next
+            if (next_node is None):
+                node.lock.release()
+                raise IndexError("index out of range")
+            next_node.lock.acquire()
+            node.lock.release()
+            node = next_node
+            i += 1
+
+        if (indx > -1):
+            self.__local.position = (mod_count, indx, node)
+        return node
+
+    def _normalize(self, indx):
+        """ a negative index counted from the end of the list as it is now """
+        if (isinstance(indx, int) and indx < 0):
+            indx += self.__length
+            if (indx < 0):
+                raise IndexError("index out of range")
+        return indx
+
+    def _insert_after(self, value, indx):
+        """ link a node holding `value` after the `indx`th item """
+        new_node = _LockedNode(value)
+        prev_node = self._lock_nth(indx)
+        try:
+            self._changed(1)
+            new_node.next = prev_node.next
+            prev_node.next = new_node
+            if (self.__tail is prev_node):
+                self.__tail = new_node
+        finally:
+            prev_node.lock.release()
+
+    def _pop_after(self, indx):
+        """ unlink the item after the `indx`th and return its value """
+        prev_node = self._lock_nth(indx)
+        try:
+            node = prev_node.next
+            if (node is None):
+                raise IndexError("index out of range")
+
+            with node.lock:
+                # node keeps its link, so lock-free walks standing on it go on
+                self._changed(-1)
+                prev_node.next = node.next
+                if (self.__tail is node):
+                    self.__tail = prev_node
+                return node.value
+        finally:
+            prev_node.lock.release()
+
+    ############################
+    ## Public Methods         ##
+    ############################
+
+    ### Write ###
+    def append(self, value):
+        """ Akin to list's append. Only contends with other appends, and with
+            head operations when the list is nearly empty
+
+            value - @type - any
+                  - @param - linked on after the tail
+        """
+        new_node = _LockedNode(value)
+        with self.__tail_lock:
+            while (True):
+                tail = self.__tail
+                with tail.lock:
+                    # the tail only moves while its node is locked, so if it
+                    # is still this node nothing can have been linked after it
+                    if (tail is self.__tail):
+                        self._changed(1)
+                        tail.next = new_node
+                        self.__tail = new_node
+                        return
+
+    def prepend(self, value):
+        """ Push to the beginning of a ConcurrentLinkedList. Only contends with
+            other head operations, and with the tail when the list is empty
+
+            value - @type - any
+                  - @param - stored in the head, which a new head is put before
+        """
+        new_head = _LockedNode(-1)
+        with self.__head_lock:
+            head = self.__head
+            with head.lock:
+                self._changed(1)
+                head.value = value
+                new_head.next = head
+                self.__head = new_head
+
+    def popleft(self):
+        """ Remove and return the first value in a list. Its node becomes the
+            new head
+        """
+        with self.__head_lock:
+            head = self.__head
+            with head.lock:
+                first = head.next
+                if (first is None):
+                    raise IndexError("pop from empty list")
+                with first.lock:
+                    self._changed(-1)
+                    self.__head = first
+                    return first.value
+
+    def pop(self):
+        """ Remove and return the final value in a list, walking hand over hand
+            to the node before it
+        """
+        prev_node = self._lock_head()
+        node = prev_node.next
+        if (node is None):
+            prev_node.lock.release()
+            raise IndexError("pop from empty list")
+
+        node.lock.acquire()
+        while (node.next is not None):
+            next_node = node.next
+            next_node.lock.acquire()
+            prev_node.lock.release()
+            prev_node, node = node, next_node
+
+        self._changed(-1)
+        prev_node.next = None
+        self.__tail = prev_node
+        node.lock.release()
+        prev_node.lock.release()
+        return node.value
+
+    def insert(self, indx, value):
+        """ insert a value btwn ConcurrentLinkedList[indx - 1] and ConcurrentLinkedList[indx] """
+        self._insert_after(value, self._normalize(indx) - 1)
+
+    def remove(self, value):
+        """ Akin to list's remove, unlink the first item == value. Raises
+            ValueError if there is none
+        """
+        prev_node = self._lock_head()
+        while (True):
+            node = prev_node.next
+            if (node is None):
+                prev_node.lock.release()
+                raise ValueError("{} is not in list".format(value))
+
+            node.lock.acquire()
+            if (node.value == value):
+                self._changed(-1)
+                prev_node.next = node.next
+                if (self.__tail is node):
+                    self.__tail = prev_node
+                node.lock.release()
+                prev_node.lock.release()
+                return
+
+            prev_node.lock.release()
+            prev_node = node
+
+    ### Read ###
+    def get(self, indx):
+        """ Same as ConcurrentLinkedList[indx]
+
+            indx - @type - int
+                 - @param - value to get. If < 0, get `indx`th value from the end of list
+        """
+        node = self._lock_nth(self._normalize(indx))
+        value = node.value
+        node.lock.release()
+        return value
+
+    def count(self, value):
+        """ number of items == value, counted without locking """
+        return sum(1 for item in self if item == value)
+
+    ###########################
+    ### Container type methods
+    ### Enables things like len() and iteration
+    ### https://docs.python.org/2/reference/datamodel.html#emulating-container-types
+    ###########################
+    def __iter__(self):
+        """ Iterate through values without locking, see the class docstring """
+        node = self.__head.next
+        while (node is not None):
+            yield node.value
+            node = node.next
+
+    def __len__(self):
+        return self.__length
+
+    def __getitem__(self, indx):
+        """ implements self[indx] evaluation """
+        if (not isinstance(indx, int)):
+            raise TypeError("Type of {} was passed to __getitem__. Only {} is accepted".format(type(indx), int))
+        return self.get(indx)
+
+    def __setitem__(self, indx, value):
+        """ supports self[indx] assignment """
+        if (not isinstance(indx, int)):
+            raise TypeError("Type of {} was passed to __setitem__. Only {} is accepted".format(type(indx), int))
+
+        node = self._lock_nth(self._normalize(indx))
+        node.value = value
+        node.lock.release()
+
+    def __delitem__(self, indx):
+        """ support for `del self[indx]` """
+        if (not isinstance(indx, int)):
+            raise TypeError("Type of {} was passed to __delitem__. Only {} is accepted".format(type(indx), int))
+        self._pop_after(self._normalize(indx) - 1)
+
+    def __contains__(self, value):
+        """ Is value in self? Checked without locking """
+        for item in self:
+            if (value == item):
+                return True
+        return False
+
+    def __repr__(self):
+        return "[" + ", ".join("{}".format(value) for value in self) + "]"
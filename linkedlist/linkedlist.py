@@ -1,4 +1,9 @@
 #!/usr/bin/python
+import random
+from bisect import bisect_left
+from .stream import LinkedListStream
+from .snapshot import CHUNK_SIZE, dump_values, load_values
+from .parallel import NO_INITIAL, map_values, reduce_values
 
 
 class LinkedList(object):
@@ -8,13 +13,108 @@ class LinkedList(object):
         is always referenced by the final item.
     """
 
-    def __init__(self):
-        """ creates the head, sets length to 0 """
-        self.__head = LinkElement()
-        self.__head.value = -1
+    def __init__(self, fingers=4, indexed=False, value_indexed=False, fingerprinted=False, pool_size=0):
+        """ creates the head, sets length to 0
+
+            fingers - @type - int
+                    - @param - how many recently used positions to remember
+
+            indexed - @type - bool
+                    - @param - keep a skip-list index over the chain, making
+                               positional lookups O(log n)
+
+            value_indexed - @type - bool
+                          - @param - keep a hash index from value to the
+                                     LinkElements holding it, making `in`,
+                                     count and find O(1) for hashable values.
+                                     Values must then be changed through the
+                                     list, by item or slice assignment. Call
+                                     `values_changed` after setting a
+                                     LinkElement's value directly
+
+            fingerprinted - @type - bool
+                          - @param - keep an order-sensitive hash of the values,
+                                     so most unequal lists compare in O(1).
+                                     As with value_indexed, values must then
+                                     be changed through the list, or
+                                     `values_changed` called after
+
+            pool_size - @type - int
+                      - @param - how many deleted LinkElements to keep for
+                                 reuse by later inserts. Only enable it if
+                                 LinkElements are not held on to after they
+                                 are deleted. Those `pop` hands back are
+                                 never reused
+        """
+        if (not isinstance(fingers, int) or fingers < 0):
+            raise TypeError("fingers must be a non-negative {}, you passed {}".format(int, fingers))
+        if (not isinstance(pool_size, int) or pool_size < 0):
+            raise TypeError("pool_size must be a non-negative {}, you passed {}".format(int, pool_size))
+
+        # deleted LinkElements, reset and waiting to be reused by _new_node
+        self.__pool = []
+        self.__pool_size = pool_size
+        self.__pool_hits = 0
+        self.__pool_misses = 0
+
+        self.__head = self._new_node(-1)
         self.__length = 0
-        self.__cache_node = self.__head
-        self.__cache_index = -1
+
+        # fingers are [index, node] pairs, least recently used first. Walks
+        # start from the closest one instead of from the head.
+        self.__fingers = []
+        self.__finger_count = fingers
+        self.__cache_hits = 0
+        self.__cache_misses = 0
+
+        # bumped by every change to the chain, so views can tell they are stale
+        self.__mod_count = 0
+
+        # the trail is a run of consecutive nodes ending in the tail, the
+        # first of which sits at index `trail_start`. It gives append the
+        # tail and pop the tail's predecessor without walking the chain.
+        self.__trail = []
+        self.__trail_start = 0
+
+        # optional express links over the chain, rebuilt lazily when stale
+        self.__index = None
+        self.__index_stale = False
+        self.indexed = indexed
+
+        # optional hash index of values, rebuilt lazily when stale
+        self.__values = None
+        self.__values_stale = False
+        self.value_indexed = value_indexed
+
+        # optional hash of the values in order, rebuilt lazily when stale
+        self.__fingerprint = None
+        self.__fingerprint_stale = False
+        self.fingerprinted = fingerprinted
+
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """ create a list holding every value of `iterable`, built in one pass
+
+            iterable - @type - iterable
+                     - @param - the values, in order. May be a generator
+
+            kwargs are passed on to the constructor
+        """
+        new_list = cls(**kwargs)
+        new_list.extend(iterable)
+        return new_list
+
+    @classmethod
+    def load(cls, fileobj, **kwargs):
+        """ create a list from a snapshot written by `dump`, linking the values
+            on a chunk at a time
+
+            fileobj - @type - binary file
+                    - @param - read from its current position
+
+            kwargs are passed on to the constructor
+        """
+        return cls.from_iterable(load_values(fileobj), **kwargs)
 
     ################
     ## Properties ##
@@ -31,6 +131,8 @@ class LinkedList(object):
             raise TypeError("head must be type {}, you passed {}".format(LinkElement, type(node)))
 
         self.__head = node
+        self.__values_stale = True
+        self.__fingerprint_stale = True
 
     @property
     def length(self):
@@ -39,29 +141,129 @@ class LinkedList(object):
 
     @length.setter
     def length(self, value):
-
+        """ set the length. Assumes the chain was relinked by hand, so any
+            positions remembered about it (cache, tail) are dropped
+        """
         if (not isinstance(value, int)):
             raise TypeError("head must be type {}, you passed {}".format(int, type(value)))
 
         self.__length = value
+        self.__values_stale = True
+        self._reset_positions()
+
+    @property
+    def tail(self):
+        """ the final LinkElement in the list, or head if the list is empty """
+        if (self.__trail is None):
+            self._rebuild_trail()
+
+        if (self.__trail):
+            return self.__trail[-1]
+        return self.head
+
+    @property
+    def indexed(self):
+        """ whether positional lookups go through a skip-list index """
+        return self.__index is not None
+
+    @indexed.setter
+    def indexed(self, value):
+        """ build or drop the skip-list index """
+        if (value and self.__index is None):
+            self.__index = _SkipIndex(self.head)
+            self.__index_stale = True
+        elif (not value):
+            self.__index = None
+
+    @property
+    def value_indexed(self):
+        """ whether `in`, count and find go through a hash index of values """
+        return self.__values is not None
+
+    @value_indexed.setter
+    def value_indexed(self, value):
+        """ build or drop the value index """
+        if (value and self.__values is None):
+            self.__values = _ValueIndex()
+            self.__values_stale = True
+        elif (not value):
+            self.__values = None
+
+    @property
+    def fingerprinted(self):
+        """ whether an order-sensitive hash of the values is kept """
+        return self.__fingerprint is not None
+
+    @fingerprinted.setter
+    def fingerprinted(self, value):
+        """ start or stop keeping the fingerprint """
+        if (value and self.__fingerprint is None):
+            self.__fingerprint = _Fingerprint()
+            self.__fingerprint_stale = True
+        elif (not value):
+            self.__fingerprint = None
+
+    @property
+    def fingerprint(self):
+        """ an order-sensitive hash of the values. Equal lists have equal
+            fingerprints. None if the list is not fingerprinted or holds
+            unhashable values
+        """
+        return self._fingerprint()
 
     @property
     def cache_node(self):
         """ a pointer to the node of the last requested index """
-        return self.__cache_node
-
-    @cache_node.setter
-    def cache_node(self, element):
-        self.__cache_node = element
+        if (self.__fingers):
+            return self.__fingers[-1][1]
+        return self.head
 
     @property
     def cache_index(self):
         """ the index of cache_node """
-        return self.__cache_index
+        if (self.__fingers):
+            return self.__fingers[-1][0]
+        return -1
+
+    @property
+    def mod_count(self):
+        """ number of times the chain has been relinked """
+        return self.__mod_count
 
-    @cache_index.setter
-    def cache_index(self, index):
-        self.__cache_index = index
+    @property
+    def finger_count(self):
+        """ the most positions that are remembered at once """
+        return self.__finger_count
+
+    @property
+    def cache_hits(self):
+        """ number of lookups that started walking from a finger """
+        return self.__cache_hits
+
+    @property
+    def cache_misses(self):
+        """ number of lookups that had to start walking from the head or tail """
+        return self.__cache_misses
+
+    @property
+    def pool_size(self):
+        """ the most deleted LinkElements kept for reuse """
+        return self.__pool_size
+
+    @property
+    def pooled(self):
+        """ number of deleted LinkElements waiting to be reused """
+        return len(self.__pool)
+
+    @property
+    def pool_hits(self):
+        """ number of new LinkElements taken from the pool """
+        return self.__pool_hits
+
+    @property
+    def pool_misses(self):
+        """ number of new LinkElements created because the pool was empty """
+        return self.__pool_misses
 
     ##############################
     ## Private / helper methods ##
@@ -78,11 +280,22 @@ class LinkedList(object):
         elif (indx < -1 or indx >= self.length):
             raise IndexError("index out of range")
 
-        elif (indx >= self.cache_index):
-            print "using cache node"
-            i = self.cache_index
-            cur_node = self.cache_node
+        elif (indx >= self.__length - 2 and self.__trail is not None):
+            # the tail and its predecessor are kept by the trail
+            if (indx == self.__length - 1):
+                return self.tail
+            return self._tail_predecessor()
 
+        elif (indx == -1):
+            return self.head
+
+        index = self._skip_index()
+        if (index is not None):
+            return index.locate(indx)
+
+        finger = self._closest_finger(indx)
+        if (finger is not None):
+            i, cur_node = finger
         else:
             i = -1
             cur_node = self.head
@@ -94,17 +307,259 @@ class LinkedList(object):
             cur_node = cur_node.next
             i += 1
 
-        self.cache_index = indx
-        self.cache_node = cur_node
+        self._move_finger(finger, indx, cur_node)
         return cur_node
 
+    def _closest_finger(self, indx, either_way=False):
+        """ the finger closest to `indx` that sits at or before it (or on
+            either side if `either_way`). None if there is no such finger
+        """
+        closest = None
+        closest_distance = 0
+        for finger in self.__fingers:
+            distance = indx - finger[0]
+            if (either_way):
+                distance = abs(distance)
+
+            if (distance >= 0 and (closest is None or distance < closest_distance)):
+                closest = finger
+                closest_distance = distance
+
+        return closest
+
+    def _move_finger(self, finger, indx, node):
+        """ record that `node`, found at `indx`, was reached from `finger`.
+
+            A finger follows its reader while the walks stay short (within
+            length / (finger_count + 1) nodes). A walk that started from the
+            head or tail, or that went further than that, adds a new finger
+            instead, evicting the least recently used one.
+        """
+        fingers = self.__fingers
+        if (finger is None):
+            self.__cache_misses += 1
+        else:
+            self.__cache_hits += 1
+
+            # mark the starting finger most recently used
+            if (fingers[-1] is not finger):
+                for i in range(len(fingers)):
+                    if (fingers[i] is finger):
+                        del fingers[i]
+                        break
+                fingers.append(finger)
+
+            if (abs(indx - finger[0]) * (self.__finger_count + 1) <= self.__length):
+                finger[0] = indx
+                finger[1] = node
+                return
+
+        if (self.__finger_count == 0):
+            return
+        if (len(fingers) >= self.__finger_count):
+            del fingers[0]
+        fingers.append([indx, node])
+
+    def _shift_fingers(self, pos, delta):
+        """ after an insert (delta 1) or a removal (delta -1) at index `pos`,
+            move the fingers behind it and drop the one on the removed node
+        """
+        fingers = self.__fingers
+        for i in reversed(range(len(fingers))):
+            if (fingers[i][0] > pos or (fingers[i][0] == pos and delta > 0)):
+                fingers[i][0] += delta
+            elif (fingers[i][0] == pos):
+                del fingers[i]
+
+
+    def _new_node(self, value):
+        """ an unlinked LinkElement holding `value`, reused from the pool
+            when there is one
+        """
+        pool = self.__pool
+        if (pool):
+            new_node = pool.pop()
+            self.__pool_hits += 1
+        else:
+            new_node = self._make_node()
+            if (self.__pool_size):
+                self.__pool_misses += 1
+        new_node.value = value
+        return new_node
+
+    def _make_node(self):
+        """ create an unlinked LinkElement """
+        return LinkElement()
+
+    def _release_nodes(self, nodes):
+        """ keep deleted LinkElements, that were never handed out, for
+            _new_node while the pool has room. Each is reset to link to
+            itself and hold nothing
+        """
+        pool = self.__pool
+        for node in nodes:
+            if (len(pool) >= self.__pool_size):
+                return
+            node.value = None
+            node.next = node
+            pool.append(node)
+
+    def _take_pool(self, other):
+        """ move the LinkElements pooled by `other`, a list of the same type,
+            into this list's pool while it has room
+        """
+        room = self.__pool_size - len(self.__pool)
+        if (room > 0 and other.__pool):
+            self.__pool.extend(other.__pool[-room:])
+            del other.__pool[-room:]
+
+    def _reset_positions(self):
+        """ forget every remembered position (fingers, tail) in the chain.
+            Called after the links were changed without going through
+            _insert_after / _pop_after
+        """
+        self.__fingers = []
+        self.__trail = None
+        self.__index_stale = True
+        self.__fingerprint_stale = True
+        self.__mod_count += 1
+
+    def _skip_index(self):
+        """ the skip-list index, rebuilt first if the chain was relinked
+            behind its back. None if the list is not indexed
+        """
+        if (self.__index is not None and self.__index_stale):
+            self.__index.rebuild(self.head)
+            self.__index_stale = False
+        return self.__index
+
+    def _value_index(self):
+        """ the value index, rebuilt first if the chain was relinked behind its
+            back. None if the list is not value indexed
+        """
+        if (self.__values is not None and self.__values_stale):
+            self.__values.rebuild(self.head)
+            self.__values_stale = False
+        return self.__values
+
+    def _index_values(self, added=(), removed=()):
+        """ tell the value index about LinkElements linked in or snipped out
+            of the chain. A stale index is left to be rebuilt
+        """
+        if (self.__values is not None and not self.__values_stale):
+            for node in removed:
+                self.__values.discard(node)
+            for node in added:
+                self.__values.add(node)
+
+    def _fingerprint(self):
+        """ the fingerprint, rebuilt first if the values changed behind its
+            back. None if the list is not fingerprinted or a value is unhashable
+        """
+        if (self.__fingerprint is None):
+            return None
+
+        if (self.__fingerprint_stale):
+            try:
+                self.__fingerprint.rebuild(self.head)
+            except TypeError:
+                return None
+            self.__fingerprint_stale = False
+        return self.__fingerprint.value
+
+    def _update_fingerprint(self, change, *args):
+        """ apply the _Fingerprint method named `change`, or leave the
+            fingerprint stale when a value cannot be hashed
+        """
+        if (self.__fingerprint is not None and not self.__fingerprint_stale):
+            try:
+                getattr(self.__fingerprint, change)(*args)
+            except TypeError:
+                self.__fingerprint_stale = True
+
+    def _forget_removed(self, removed):
+        """ after unlinking the elements at the sorted, original indices
+            `removed`, move the fingers behind them back and drop any that
+            were on them. The tail and the index are found again lazily
+        """
+        fingers = self.__fingers
+        for i in reversed(range(len(fingers))):
+            indx = fingers[i][0]
+            shift = bisect_left(removed, indx)
+            if (shift < len(removed) and removed[shift] == indx):
+                del fingers[i]
+            else:
+                fingers[i][0] = indx - shift
+
+        self.__trail = None
+        self.__index_stale = True
+        self.__fingerprint_stale = True
+        self.__mod_count += 1
+
+    def _rebuild_trail(self):
+        """ walk to the end of the chain, remembering every node passed so
+            that the following pops are O(1). The walk starts from the
+            closest known position before the tail's predecessor: the index,
+            a finger, or else the head
+        """
+        start = self.__length - 2
+        i = -1
+        cur_node = self.head
+        if (start >= 0):
+            if (self.__index is not None and not self.__index_stale):
+                i = start
+                cur_node = self.__index.locate(start)
+            else:
+                finger = self._closest_finger(start)
+                if (finger is not None):
+                    i, cur_node = finger
+
+        trail = [] if i == -1 else [cur_node]
+        cur_node = cur_node.next
+        while (cur_node is not self.head):
+            trail.append(cur_node)
+            cur_node = cur_node.next
+
+        self.__trail = trail
+        self.__trail_start = max(i, 0)
+
+    def _set_tail(self, node):
+        """ remember `node` as the tail after the chain was relinked by hand,
+            so the following appends and pops need not walk to it
+        """
+        if (node is self.head):
+            self.__trail = []
+            self.__trail_start = 0
+        else:
+            self.__trail = [node]
+            self.__trail_start = self.__length - 1
+
+    def _options(self):
+        """ the constructor arguments for an empty list like this one """
+        return {"fingers": self.__finger_count, "indexed": self.indexed,
+                "value_indexed": self.value_indexed, "fingerprinted": self.fingerprinted,
+                "pool_size": self.__pool_size}
+
+    def _new_list(self):
+        """ an empty list of the same type and options """
+        return type(self)(**self._options())
+
+    def _tail_predecessor(self):
+        """ the node just before the tail. O(1) while the trail holds it,
+            otherwise the trail is rebuilt from the head first
+        """
+        if (self.__trail is None or (len(self.__trail) < 2 and self.__trail_start > 0)):
+            self._rebuild_trail()
+
+        if (len(self.__trail) >= 2):
+            return self.__trail[-2]
+        return self.head
 
     def _insert_after(self, value, indx):
         """ create a ListElement with `value` and insert after indx """
 
         # create the new node
-        new_node = LinkElement()
-        new_node.value = value
+        new_node = self._new_node(value)
 
         prev_node = self._get_nth_el(indx)
 
@@ -114,7 +569,30 @@ class LinkedList(object):
         # prev_node links to new node
         prev_node.next = new_node
 
-        self.length += 1
+        self.__length += 1
+        self.__mod_count += 1
+        pos = indx + 1
+        self._shift_fingers(pos, 1)
+        if (self.__index is not None and not self.__index_stale):
+            self.__index.insert(pos, new_node)
+        self._index_values(added=(new_node,))
+        if (pos == self.__length - 1):
+            self._update_fingerprint("push_back", value)
+        elif (pos == 0):
+            self._update_fingerprint("push_front", value)
+        else:
+            self.__fingerprint_stale = True
+
+        # keep the trail pointing at the tail
+        trail = self.__trail
+        if (trail is not None):
+            if (pos == self.__length - 1):
+                trail.append(new_node)
+            elif (pos <= self.__trail_start):
+                self.__trail_start += 1
+            else:
+                # splice it in, so the trail still runs on to the tail
+                trail.insert(pos - self.__trail_start, new_node)
 
     def _pop_after(self, indx):
         """ remove the ListElement at `indx` and return """
@@ -122,14 +600,47 @@ class LinkedList(object):
 
         # popped node
         rm_node = prev_node.next
+        if (rm_node is self.head):
+            raise IndexError("index out of range")
 
         # snip out prev_node.next
         prev_node.next = prev_node.next.next
 
-        self.length -= 1
+        self.__length -= 1
+        self.__mod_count += 1
+        pos = indx + 1
+        self._shift_fingers(pos, -1)
+        if (self.__index is not None and not self.__index_stale):
+            self.__index.remove(pos)
+        self._index_values(removed=(rm_node,))
+        if (pos == self.__length):
+            self._update_fingerprint("pop_back", rm_node.value)
+        elif (pos == 0):
+            self._update_fingerprint("pop_front", rm_node.value)
+        else:
+            self.__fingerprint_stale = True
+
+        # keep the trail pointing at the tail
+        trail = self.__trail
+        if (trail is not None):
+            if (trail and rm_node is trail[-1]):
+                trail.pop()
+            elif (pos < self.__trail_start):
+                self.__trail_start -= 1
+            else:
+                # snip it out, so the trail still runs on to the tail
+                del trail[pos - self.__trail_start]
 
         return rm_node
 
+    def _pop_value_after(self, indx):
+        """ remove the ListElement at `indx` and return its value. The
+            LinkElement is never handed out, so it goes back to the pool
+        """
+        rm_node = self._pop_after(indx)
+        value = rm_node.value
+        self._release_nodes((rm_node,))
+        return value
 
     ############################
     ## Public Methods         ##
@@ -142,6 +653,8 @@ class LinkedList(object):
             value - @type - any
                   - @param - creates a LinkElement with value as LinkElement.value
         """
+        if (self.__trail is None):
+            self._rebuild_trail()
         self._insert_after(value, self.length - 1)
 
     def prepend(self, value):
@@ -156,17 +669,556 @@ class LinkedList(object):
         """ Remove and return the final LinkElement in a list """
 
         l = self.length - 2 # penultimate LinkElement
+        if (self.__trail is None):
+            # found once, so the pops that follow are O(1) again
+            self._rebuild_trail()
 
         old_el = self._pop_after(l)
         return old_el
 
+    def extend(self, iterable):
+        """ Akin to list's extend. Each value is linked straight onto the
+            running tail and length is updated once, so there is no per-item
+            lookup or bookkeeping
+
+            iterable - @type - iterable
+                     - @param - the values to add. For a LinkedList its
+                                LinkElements' values are added
+        """
+        if (isinstance(iterable, LinkedList)):
+            iterable = [el.value for el in iterable]
+
+        head = self.head
+        prev_node = self.tail
+        new_node = self._new_node
+        trail = self.__trail
+        values = self.__values if not self.__values_stale else None
+        fingerprint = self.__fingerprint if not self.__fingerprint_stale else None
+
+        count = 0
+        try:
+            for value in iterable:
+                node = new_node(value)
+                prev_node.next = node
+                prev_node = node
+                if (trail is not None):
+                    trail.append(node)
+                if (values is not None):
+                    values.add(node)
+                if (fingerprint is not None):
+                    try:
+                        fingerprint.push_back(value)
+                    except TypeError:
+                        self.__fingerprint_stale = True
+                        fingerprint = None
+                count += 1
+
+        finally:
+            # close the loop even if the iterable raised part way through
+            prev_node.next = head
+            self.__length += count
+            if (count):
+                self.__index_stale = True
+                self.__mod_count += 1
+
+    def splice(self, other):
+        """ move every LinkElement of `other` onto the end of this list,
+            leaving `other` empty. Nothing is copied, the chains are relinked
+
+            other - @type - LinkedList
+                  - @param - a list whose elements are the same type as this
+                             list's, e.g. DoubleLinkElements for a DoublyLinkedList
+
+            *Performance* - O(1) while both tails are known, as they are after
+                            appends and always are for a DoublyLinkedList
+        """
+        if (not isinstance(other, LinkedList) or not isinstance(other.head, type(self.head))):
+            raise TypeError("can only splice a list of {} into {}, you passed {}".format(type(self.head), type(self), type(other)))
+        elif (other is self):
+            raise ValueError("cannot splice a list into itself")
+        elif (not other.length):
+            return
+
+        count = other.length
+        other_fingerprint = other._fingerprint() if self.fingerprinted else None
+        other_first = other.head.next
+        other_tail = other.tail
+        self.tail.next = other_first
+        other_tail.next = self.head
+
+        # other's elements now end the list, so only the trail moves on
+        self.__length += count
+        self.__mod_count += 1
+        self.__index_stale = True
+        self.__values_stale = True
+        if (other_fingerprint is not None):
+            self._update_fingerprint("concat", other.__fingerprint)
+        else:
+            self.__fingerprint_stale = True
+        if (self.__trail is not None):
+            self.__trail = [other_tail]
+            self.__trail_start = self.__length - 1
+
+        other.head.next = other.head
+        other.length = 0
+
+    def split_at(self, indx):
+        """ detach the LinkElements from `indx` onwards into a new list and
+            return it. Nothing is copied, the chain is cut and relinked
+
+            indx - @type - int
+                 - @param - the first index to move. If < 0, counts from the
+                            end of the list. length moves nothing
+
+            *Performance* - a walk to `indx`, from the closest finger
+        """
+        if (not isinstance(indx, int)):
+            raise TypeError("index must be type {}, you passed {}".format(int, type(indx)))
+        if (indx < 0):
+            indx += self.__length
+        if (indx < 0 or indx > self.__length):
+            raise IndexError("index out of range")
+
+        new_list = self._new_list()
+        count = self.__length - indx
+        if (not count):
+            return new_list
+
+        last_kept = self._get_nth_el(indx - 1)
+        tail = self.tail
+        new_list.head.next = last_kept.next
+        tail.next = new_list.head
+        last_kept.next = self.head
+        new_list.length = count
+        new_list._set_tail(tail)
+
+        # positions before indx are unchanged
+        self.__length = indx
+        self.__fingers = [finger for finger in self.__fingers if finger[0] < indx]
+        self.__index_stale = True
+        self.__values_stale = True
+        self.__fingerprint_stale = True
+        self.__mod_count += 1
+        self._set_tail(last_kept)
+        return new_list
+
+    def partition(self, predicate):
+        """ move every LinkElement whose value satisfies `predicate` into a
+            new list, in order, and return it. The rest stay in this list.
+            Nothing is copied, the elements are relinked in one pass
+
+            predicate - @type - callable
+                      - @param - called once with each value, in order
+        """
+        new_list = self._new_list()
+        new_tail = new_list.head
+        head = self.head
+        prev_node = head
+        cur_node = head.next
+        moved = []
+        i = 0
+        try:
+            while (cur_node is not head):
+                next_node = cur_node.next
+                if (predicate(cur_node.value)):
+                    prev_node.next = next_node
+                    new_tail.next = cur_node
+                    new_tail = cur_node
+                    moved.append(i)
+                    self._index_values(removed=(cur_node,))
+                else:
+                    prev_node = cur_node
+                cur_node = next_node
+                i += 1
+
+        finally:
+            # close both loops even if predicate raised part way through
+            new_tail.next = new_list.head
+            new_list.length = len(moved)
+            new_list._set_tail(new_tail)
+            if (moved):
+                self.__length -= len(moved)
+                self._forget_removed(moved)
+                if (cur_node is head):
+                    self._set_tail(prev_node)
+
+        return new_list
+
     def insert(self, indx, value):
         """ insert an element btwn LinkedList[indx - 1] and LinkedList[indx] """
 
         indx -= 1
         self._insert_after(value, indx)
 
+    def insert_many(self, pairs):
+        """ insert many values in one sweep of the list
+
+            pairs - @type - iterable of (int, any)
+                  - @param - (indx, value) pairs. Every indx refers to the list
+                             as it was before the call, so each value lands
+                             before the element that was at indx then (or at
+                             the end for indx == length). Values sharing an
+                             indx keep their order
+
+            *Performance* - the pairs are sorted and then applied in a single
+                            forward walk, O(n + k log k) rather than the
+                            O(k * n) of calling insert k times
+        """
+        length = self.length
+        batch = []
+        for indx, value in pairs:
+            if (not isinstance(indx, int)):
+                raise TypeError("index must be type {}, you passed {}".format(int, type(indx)))
+            if (indx < 0):
+                indx += length
+            if (indx < 0 or indx > length):
+                raise IndexError("index out of range")
+            batch.append((indx, value))
+
+        if (not batch):
+            return
+
+        # a stable sort keeps the order of values sharing an indx
+        batch.sort(key=lambda pair: pair[0])
+
+        # the tail stays unless values go at the end, so keep it if it is known
+        tail = self.__trail[-1] if self.__trail else None
+        i = batch[0][0]
+        prev_node = self._get_nth_el(i - 1)
+        new_node = self._new_node
+        for indx, value in batch:
+            while (i < indx):
+                prev_node = prev_node.next
+                i += 1
+
+            node = new_node(value)
+            node.next = prev_node.next
+            prev_node.next = node
+            prev_node = node
+            self._index_values(added=(node,))
+
+        self.__length += len(batch)
+        self._reset_positions()
+        if (batch[-1][0] == length):
+            self._set_tail(prev_node)
+        elif (tail is not None):
+            self._set_tail(tail)
+
+    def delete_many(self, indices):
+        """ delete the elements at many indices in one sweep of the list
+
+            indices - @type - iterable of int
+                    - @param - indices into the list as it was before the
+                               call. Negative ones count from the end and
+                               repeats are deleted once
+
+            Returns the number of elements deleted
+
+            *Performance* - a single forward walk, O(n + k log k) rather than
+                            the O(k * n) of deleting one index at a time
+        """
+        length = self.length
+        targets = set()
+        for indx in indices:
+            if (not isinstance(indx, int)):
+                raise TypeError("index must be type {}, you passed {}".format(int, type(indx)))
+            if (indx < 0):
+                indx += length
+            if (indx < 0 or indx >= length):
+                raise IndexError("index out of range")
+            targets.add(indx)
+
+        if (not targets):
+            return 0
+
+        targets = sorted(targets)
+        # the tail stays unless the last element goes, so keep it if it is known
+        tail = self.__trail[-1] if self.__trail else None
+        i = targets[0]
+        prev_node = self._get_nth_el(i - 1)
+        removed = []
+        for indx in targets:
+            while (i < indx):
+                prev_node = prev_node.next
+                i += 1
+
+            # snip out the element at indx, prev_node now precedes indx + 1
+            rm_node = prev_node.next
+            self._index_values(removed=(rm_node,))
+            prev_node.next = rm_node.next
+            removed.append(rm_node)
+            i += 1
+
+        self.__length -= len(targets)
+        self._forget_removed(targets)
+        if (targets[-1] == length - 1):
+            self._set_tail(prev_node)
+        elif (tail is not None):
+            self._set_tail(tail)
+        self._release_nodes(removed)
+        return len(targets)
+
+    def remove_if(self, predicate):
+        """ delete every element whose value satisfies `predicate`, in one pass
+
+            predicate - @type - callable
+                      - @param - called once with each value, in order
+
+            Returns the number of elements deleted
+        """
+        head = self.head
+        prev_node = head
+        cur_node = head.next
+        removed = []
+        removed_nodes = []
+        i = 0
+        try:
+            while (cur_node is not head):
+                if (predicate(cur_node.value)):
+                    prev_node.next = cur_node.next
+                    removed.append(i)
+                    removed_nodes.append(cur_node)
+                    self._index_values(removed=(cur_node,))
+                else:
+                    prev_node = cur_node
+                cur_node = cur_node.next
+                i += 1
+
+            # the walk ended on the last element kept
+            last_kept = prev_node
+
+        finally:
+            # keep what was removed even if predicate raised part way through
+            if (removed):
+                self.__length -= len(removed)
+                self._forget_removed(removed)
+                self._release_nodes(removed_nodes)
+
+        if (removed):
+            self._set_tail(last_kept)
+        return len(removed)
+
+    def sort(self, key=None, reverse=False):
+        """ Akin to list's sort. A stable, bottom-up natural merge sort that
+            relinks the existing LinkElements instead of creating new ones
+
+            key - @type - callable or None
+                - @param - called once per value, the results are compared
+                           instead of the values
+
+            reverse - @type - bool
+                    - @param - sort in descending order, still keeping equal
+                               values in their original order
+
+            *Performance* - O(n log n) comparisons, or O(n) for a list that is
+                            already sorted. Each pass merges neighbouring
+                            ascending runs in place, so apart from the keys no
+                            extra space is used
+        """
+        # while sorting, each element holds its key. The values are put back after
+        values = None
+        tail = None
+        try:
+            if (key is not None):
+                values = {}
+                for el in self:
+                    values[id(el)] = el.value
+                    el.value = key(el.value)
+
+            # as with list, reversing before and after an ascending sort keeps
+            # equal values in their original order
+            if (reverse):
+                self._reverse_chain()
+            tail = self._merge_sort_chain()
+            if (reverse):
+                tail = self._reverse_chain()
+
+        finally:
+            if (values is not None):
+                for el in self:
+                    el.value = values.get(id(el), el.value)
+            self._reset_positions()
+            if (tail is not None):
+                self._set_tail(tail)
+
+    def values_changed(self):
+        """ tell the list that values were changed on its LinkElements
+            directly, e.g. `L.get(0).value = 9`, rather than through item or
+            slice assignment. Whatever is kept about the values is rebuilt
+            on its next use
+        """
+        self.__values_stale = True
+        self.__fingerprint_stale = True
+
+    def _reverse_chain(self):
+        """ reverse the links of the chain in place, returning the new last
+            node (the head if the chain is empty)
+        """
+        head = self.head
+        prev_node = head
+        cur_node = last = head.next
+        while (cur_node is not head):
+            next_node = cur_node.next
+            cur_node.next = prev_node
+            prev_node = cur_node
+            cur_node = next_node
+        head.next = prev_node
+        return last
+
+    def _merge_sort_chain(self):
+        """ stably sort the chain by value, relinking it in place, and return
+            the last node (the head if the chain is empty). If a comparison
+            raises, every element is linked back in before the error is
+            passed on
+        """
+        head = self.head
+        tail = pending = head
+        merging = False
+        try:
+            runs = 2
+            while (runs > 1):
+                # one pass: merge each pair of ascending runs onto `tail`
+                runs = 0
+                tail = head
+                pending = head.next
+                while (pending is not head):
+                    runs += 1
+                    a = a_end = pending
+                    nxt = a_end.next
+                    while (nxt is not head and not nxt.value < a_end.value):
+                        a_end = nxt
+                        nxt = nxt.next
+
+                    b = nxt
+                    if (b is head):
+                        tail.next = a
+                        tail = a_end
+                        break
+
+                    b_end = b
+                    nxt = b_end.next
+                    while (nxt is not head and not nxt.value < b_end.value):
+                        b_end = nxt
+                        nxt = nxt.next
+                    pending = nxt
+
+                    # only take from b when it is strictly smaller, for stability.
+                    # Nodes taken in a row from one run are already linked, so
+                    # links are only set when the merge switches runs
+                    merging = True
+                    a_value = a.value
+                    b_value = b.value
+                    source = None
+                    while (True):
+                        if (b_value < a_value):
+                            if (source is not b_end):
+                                tail.next = b
+                                source = b_end
+                            tail = b
+                            if (b is b_end):
+                                tail.next = a
+                                tail = a_end
+                                break
+                            b = b.next
+                            b_value = b.value
+                        else:
+                            if (source is not a_end):
+                                tail.next = a
+                                source = a_end
+                            tail = a
+                            if (a is a_end):
+                                tail.next = b
+                                tail = b_end
+                                break
+                            a = a.next
+                            a_value = a.value
+                    merging = False
+
+                tail.next = head
+
+        except:
+            # link everything not yet placed back in after tail
+            if (merging):
+                tail.next = a
+                a_end.next = b
+                b_end.next = pending
+            else:
+                tail.next = pending
+            raise
+        return tail
+
     ### Read ###
+    def dump(self, fileobj):
+        """ write a compact, versioned binary snapshot of the values, a chunk
+            at a time. Chunks of ints or floats are packed, others pickled.
+            See linkedlist.snapshot
+
+            fileobj - @type - binary file
+                    - @param - written from its current position
+        """
+        dump_values((el.value for el in self), self.length, fileobj)
+
+    def count(self, value):
+        """ Akin to list's count, number of LinkElements whose value == value
+
+            *Performance* - O(1) for a hashable value of a value indexed list,
+                            otherwise a scan
+        """
+        bucket = self._value_index_lookup(value)
+        if (bucket is not None):
+            return len(bucket)
+
+        total = 0
+        for el in self:
+            if (el.value == value):
+                total += 1
+        return total
+
+    def find(self, value):
+        """ the first LinkElement whose value == value, or None
+
+            *Performance* - for a value indexed list, O(1) when the value is
+                            missing or held once. Otherwise the chain is
+                            walked to the first element holding it
+        """
+        bucket = self._value_index_lookup(value)
+        if (bucket is not None):
+            if (len(bucket) < 2):
+                for node in bucket.values():
+                    return node
+                return None
+
+            # several elements hold it, the first one reached is first in the list
+            for el in self:
+                if (id(el) in bucket):
+                    return el
+
+        for el in self:
+            if (el.value == value):
+                return el
+        return None
+
+    def index(self, value):
+        """ Akin to list's index, the position of the first LinkElement whose
+            value == value. Raises ValueError if there is none
+
+            *Performance* - a missing value is O(1) for a value indexed list
+        """
+        bucket = self._value_index_lookup(value)
+        if (bucket is not None):
+            if (not bucket):
+                raise ValueError("{} is not in list".format(value))
+            for i, el in enumerate(self):
+                if (id(el) in bucket):
+                    return i
+
+        else:
+            for i, el in enumerate(self):
+                if (el.value == value):
+                    return i
+
+        raise ValueError("{} is not in list".format(value))
+
     def get(self, indx):
         """ Same as LinkedList[indx]
 
@@ -187,6 +1239,47 @@ class LinkedList(object):
     ### Enables things like len() and iteration
     ### https://docs.python.org/2/reference/datamodel.html#emulating-container-types
     ###########################
+    def view(self, start=None, stop=None, step=None):
+        """ a LinkedListView of self[start:stop:step] that reads straight from
+            this list's LinkElements instead of copying them
+
+            step - @type - int or None
+                 - @param - must be positive, a view only walks forwards
+        """
+        return LinkedListView(self, slice(start, stop, step))
+
+    def stream(self):
+        """ a lazy LinkedListStream over this list's values, for chaining
+            map / filter / take / chunk without copying the list
+        """
+        return LinkedListStream((el.value for el in self), type(self))
+
+    def parallel_map(self, function, workers=None, chunk=CHUNK_SIZE):
+        """ a new list of function(value) for every value, computed in a
+            process pool. The chain is walked once, chunks of values are
+            shipped packed, and the results are linked on after the new
+            list's tail as they come back. See linkedlist.parallel
+
+            function - @type - callable
+                     - @param - must be picklable, e.g. defined at module level
+
+            workers - @type - int or None
+                    - @param - processes to use, None for one per CPU
+
+            chunk - @type - int
+                  - @param - values sent to a worker at a time
+        """
+        new_list = self._new_list()
+        new_list.extend(map_values(function, (el.value for el in self), workers, chunk))
+        return new_list
+
+    def parallel_reduce(self, function, initial=NO_INITIAL, workers=None, chunk=CHUNK_SIZE):
+        """ Akin to functools.reduce over the values, with each chunk reduced
+            in a process pool and the chunks' results reduced in order.
+            `function` must be associative and picklable
+        """
+        return reduce_values(function, (el.value for el in self), initial, workers, chunk)
+
     def __iter__(self):
         """ Iterate through LL following Links """
         cur_node = self.head.next # first node
@@ -197,33 +1290,67 @@ class LinkedList(object):
     def __len__(self):
         return self.length
 
+    def _slice_positions(self, slice_k):
+        """ normalize slice_k against the list's length.
+
+            Returns (start, count, step, backwards): the `count` positions
+            start, start + step, ... in ascending order, step > 0, and whether
+            slice_k visits them backwards
+        """
+        start, stop, step = slice_k.indices(self.length)
+        if (step > 0):
+            count = max(0, (stop - start + step - 1) // step)
+            return start, count, step, False
+
+        count = max(0, (start - stop - step - 1) // -step)
+        return start + step * (count - 1), count, -step, True
+
+    def _walk_slice(self, start, count, step):
+        """ the slice engine. Yields (prev_node, node) for the `count` nodes at
+            start, start + step, ... in a single forward walk. The caller may
+            unlink `node` before asking for the next one
+        """
+        if (not count):
+            return
+
+        prev_node = self._get_nth_el(start - 1)
+        node = prev_node.next
+        for n in range(count):
+            if (n):
+                # continue from node, or from prev_node if node was unlinked
+                if (prev_node.next is node):
+                    prev_node = node
+                for i in range(step - 1):
+                    prev_node = prev_node.next
+                node = prev_node.next
+
+            yield prev_node, node
+
     def _getitem__single(self, key):
         """ Returns LinkElement at position key """
         return self.get(key)
 
     def _getitem__slice(self, slice_k):
-        """ Returns LinkedList of indices specified in slice_k, type slice """
-        start = slice_k.start or 0
-        stop = slice_k.stop
-        step = slice_k.step or 1
-
-        L = LinkedList() # Return List
-        i = start
-        prev_self = self._get_nth_el(start - 1)
-        prev_L = L.head
-
-        # iterate through remainder of list, saving every nth item to L, where n = step
-        while (start < stop):
+        """ Returns LinkedList of indices specified in slice_k, type slice.
+            Copies are tail-linked (or head-linked for a negative step) into
+            the new list as the slice is walked
+        """
+        start, count, step, backwards = self._slice_positions(slice_k)
 
-            if (i == start):
-                new_el = LinkElement()
-                new_el.val = prev_self.next.value
+        L = self._new_list() # Return List
+        prev_L = L.head
+        for prev_node, node in self._walk_slice(start, count, step):
+            new_el = L._new_node(node.value)
+            if (backwards):
+                new_el.next = L.head.next
+                L.head.next = new_el
+            else:
                 prev_L.next = new_el
-                prev_L = prev_L.next
-                start += step
+                prev_L = new_el
 
-            prev_self = prev_self.next
-            i += 1
+        if (not backwards):
+            prev_L.next = L.head
+        L.length = count
         return L
 
     def __getitem__(self, key):
@@ -242,43 +1369,82 @@ class LinkedList(object):
             raise TypeError("Type of {} was passed to __getitem__. Only {} and {} are accepted".format(type(key), slice, int))
 
     def __setitem__single(self, key, value):
-        """ Sets self[key] to new LinkElement of value """
-        prev_el = self._get_nth_el(key - 1)
-        new_el = LinkElement()
-        new_el.value = value
-        new_el.next = prev_el.next.next
-        prev_el.next = new_el
+        """ Sets self[key].value to value """
+        if (key < 0):
+            key = self.length + key
+        if (key < 0):
+            raise IndexError("index out of range")
+
+        node = self._get_nth_el(key)
+        self._index_values(removed=(node,))
+        self._update_fingerprint("replace", key, node.value, value)
+        node.value = value
+        self._index_values(added=(node,))
 
     def __setitem__slice(self, slice_k, values):
-        """ Sets specified slice of self to values. Does not check that len(values) is correct
+        """ Sets specified slice of self to values, writing into the existing
+            LinkElements in one walk
 
             slice_k - @type - slice
-                    - @param - from slice.start up to slice.stop, set every slice.step el to value
+                    - @param - a step of 1 replaces the run with any number of
+                               values. Any other step needs exactly one value
+                               per index, as with list
 
             values - @type - iterable
                    - @param - an iterable of values to set self[indices] to
 
         """
+        if (isinstance(values, LinkedList)):
+            values = [el.value for el in values]
+        else:
+            values = list(values)
+
+        start, count, step, backwards = self._slice_positions(slice_k)
+        self.__fingerprint_stale = True
+        if (slice_k.step not in (None, 1)):
+            if (len(values) != count):
+                raise ValueError("attempt to assign sequence of size {} to extended slice of size {}".format(len(values), count))
+            if (backwards):
+                values.reverse()
+
+            j = 0
+            for prev_node, node in self._walk_slice(start, count, step):
+                self._index_values(removed=(node,))
+                node.value = values[j]
+                self._index_values(added=(node,))
+                j += 1
+            return
 
-        start = slice_k.start or 0
-        stop = slice_k.stop
-        step = slice_k.step or 1
-
-        i = start
+        # a plain slice: overwrite the run, then unlink what is left over or
+        # link in the values that did not fit
+        last_node = None
         j = 0
-        prev_el = self._get_nth_el(i - 1)
-
-        # from prev_el/start set every nth element to the next value, where n = step
-        while (start < stop):
-            if (i == start):
-                new_el = LinkElement()
-                new_el.value = values[j]
-                new_el.next = prev_el.next.next
-                prev_el.next = new_el
-                start += step
-                j += 1
-            prev_el = prev_el.next
-            i += 1
+        for prev_node, node in self._walk_slice(start, count, 1):
+            self._index_values(removed=(node,))
+            if (j < len(values)):
+                node.value = values[j]
+                self._index_values(added=(node,))
+                last_node = node
+            else:
+                prev_node.next = node.next
+            j += 1
+
+        if (len(values) == count):
+            return
+
+        if (len(values) > count):
+            if (last_node is None):
+                last_node = self._get_nth_el(start - 1)
+            after = last_node.next
+            for value in values[count:]:
+                new_el = self._new_node(value)
+                last_node.next = new_el
+                last_node = new_el
+                self._index_values(added=(new_el,))
+            last_node.next = after
+
+        self.__length += len(values) - count
+        self._reset_positions()
 
     def __setitem__(self, key, value):
         """ supports self[key] assignment.
@@ -293,7 +1459,7 @@ class LinkedList(object):
             self.__setitem__single(key, value)
 
         elif (isinstance(key, slice) and hasattr(value, "__iter__")):
-            self.__setitem__slice
+            self.__setitem__slice(key, value)
 
         elif (isinstance(key, slice) and not hasattr(value, "__iter__")):
             raise TypeError("Tried to assign {} to slice of {}. Only iterables accepted".format(type(key), type(self)))
@@ -303,24 +1469,24 @@ class LinkedList(object):
 
     def __delitem__single(self, key):
         """ pop ListElement at `key` """
+        if (key < 0):
+            key = self.length + key
         prev_i = key - 1
-        self._pop_after(prev_i)
+        self._release_nodes((self._pop_after(prev_i),))
 
     def __delitem_slice(self, slice_k):
-        """ pop all ListElements spec'd by slice_k, type = slice """
-        # For performance reasons, cannot use either pop or __delitem_single
-        start = slice_k.start or 0
-        stop = slice_k.stop
-        step = slice_k.step or 1
-
-        prev_el = self._get_nth_el(start - 1)
-        i = start
-        while (start < stop):
-            if (i == start):
-                prev_el.next = prev_el.next.next
-                start += step
-            prev_el = prev_el.next
-            i += 1
+        """ pop all ListElements spec'd by slice_k, type = slice, in one walk """
+        start, count, step, backwards = self._slice_positions(slice_k)
+        removed = []
+        for prev_node, node in self._walk_slice(start, count, step):
+            prev_node.next = node.next
+            self._index_values(removed=(node,))
+            removed.append(node)
+
+        if (count):
+            self.__length -= count
+            self._forget_removed(range(start, start + count * step, step))
+            self._release_nodes(removed)
 
     def __delitem__(self, key):
         """ support for `del self[key]`
@@ -328,7 +1494,7 @@ class LinkedList(object):
             key - @type - int or slice
                 - @param - a index or slice of indices to delete
         """
-        if (isinstacne(key, slice)):
+        if (isinstance(key, slice)):
             self.__delitem_slice(key)
 
         elif (isinstance(key, int)):
@@ -342,11 +1508,36 @@ class LinkedList(object):
             Like a normal `list` it simply iterates through to search
             https://github.com/certik/python-2.7/blob/c360290c3c9e55fbd79d6ceacdfc7cd4f393c1eb/Objects/listobject.c#L438
         """
+        indexed = self._value_index_lookup(value)
+        if (indexed is not None):
+            return bool(indexed)
+
         for i in self:
             if (value == i.value):
                 return True
         return False
 
+    def _value_index_lookup(self, value):
+        """ the {id: LinkElement} bucket of every element holding `value`, from
+            the value index. None if the index cannot answer, because the list
+            is not value indexed, `value` is unhashable, or the answer might
+            hide among unhashable values, which only a scan compares
+        """
+        index = self._value_index()
+        if (index is None):
+            return None
+
+        try:
+            bucket = index.buckets.get(value)
+        except TypeError:
+            return None
+
+        if (bucket):
+            return bucket
+        elif (index.unhashable):
+            return None
+        return {}
+
     ###########################
     ### Numeric comparison type methods
     ### Enables things like > and ==
@@ -361,78 +1552,95 @@ class LinkedList(object):
             cmp_w - @type - LinkedList
                   - @param - is second operand in self < cmp_w for any op
 
-            If self and cmp_w are diff types, is arbitrarily consistent.
+            If cmp_w is not a LinkedList, is arbitrarily consistent.
                 str(type(self)) compared to str(type(cmp_w))
 
-            Otherwise, the first list with a smaller node is __lt__.
-            if list1 is a subset of list2, list1 < list2
+            Otherwise, the values are compared pair by pair in one walk, as
+            list does: the first unequal pair decides. If one list runs out
+            first it is the smaller.
 
             See https://docs.python.org/2.7/reference/expressions.html#not-in
         """
-        # diff't types, just compare type names
-        if (not isinstance(cmp_w, type(self))):
-            if (self < cmp_w):
+        # not a list of ours, just compare type names
+        if (not isinstance(cmp_w, LinkedList)):
+            self_type = str(type(self))
+            other_type = str(type(cmp_w))
+            if (self_type < other_type):
                 return -1
-            elif (cmp_w == self):
+            elif (self_type == other_type):
                 return 0
             else:
                 return 1
 
-        # iterate, matching item by item
-        self_node = self.head.next
-        other_node = cmp_w.head.next
-        while (self_node is not self.head and other_node is not cmp_w.head):
-            if (other_node < self_node):
+        # iterate, matching value by value
+        self_head = self.head
+        other_head = cmp_w.head
+        self_node = self_head.next
+        other_node = other_head.next
+        while (self_node is not self_head and other_node is not other_head):
+            self_value = self_node.value
+            other_value = other_node.value
+            if (not (self_value is other_value or self_value == other_value)):
+                if (self_value < other_value):
+                    return -1
                 return 1
-            elif (other_node > self_node):
-                return -1
 
             self_node = self_node.next
             other_node = other_node.next
 
-        # Still are euqal, so compare length (meaning whichever's head we got to)
-        if (self_node is self.head and other_node is cmp_w.head):
+        # Still are equal, so compare length (meaning whichever's head we got to)
+        if (self_node is self_head and other_node is other_head):
             return 0
-        elif (self_node is self.head):
+        elif (self_node is self_head):
             return -1
-        elif (other_node is cmp_w.head):
+        else:
             return 1
 
     def __gt__(self, cmp_w):
-        if (self.__cmp__(cmp_w) == 1):
-            return True
-        else:
-            return False
+        return self.__cmp__(cmp_w) > 0
 
     def __ge__(self, cmp_w):
-        if (self.__gt__(cmp_w) or self.__eq__(cmp_w)):
-            return True
-        else:
-            return False
+        return self.__cmp__(cmp_w) >= 0
 
     def __lt__(self, cmp_w):
-        if (self.__cmp__(cmp_w) == -1):
-            return True
-        else:
-            return False
+        return self.__cmp__(cmp_w) < 0
+
     def __le__(self, cmp_w):
-        if (self.__lt__(cmp_w) or self.__eq__(cmp_w)):
-            return True
-        else:
-            return False
+        return self.__cmp__(cmp_w) <= 0
 
     def __eq__(self, cmp_w):
-        """ NB: This tests equivalence of values, not identity """
-        if (self.__cmp__(cmp_w) == 0):
-            return True
-        else:
+        """ NB: This tests equivalence of values, not identity.
+
+            Lists of different lengths, or whose fingerprints differ when both
+            are fingerprinted, are unequal without walking either
+        """
+        if (not isinstance(cmp_w, LinkedList)):
+            return False
+        elif (self.length != cmp_w.length):
             return False
 
+        self_fingerprint = self._fingerprint()
+        if (self_fingerprint is not None):
+            other_fingerprint = cmp_w._fingerprint()
+            if (other_fingerprint is not None and other_fingerprint != self_fingerprint):
+                return False
+
+        self_head = self.head
+        other_head = cmp_w.head
+        self_node = self_head.next
+        other_node = other_head.next
+        while (self_node is not self_head):
+            self_value = self_node.value
+            other_value = other_node.value
+            if (not (self_value is other_value or self_value == other_value)):
+                return False
+
+            self_node = self_node.next
+            other_node = other_node.next
+        return True
+
     def __ne__(self, cmp_w):
-        if (not self.__eq__(cmp_w)):
-            return True
-        else:
-            return False
+        return not self.__eq__(cmp_w)
 
     def __add__(self, other):
         """ Concat two LinkedLists and return a third one
@@ -442,35 +1650,49 @@ class LinkedList(object):
         if (not isinstance(other, type(self))):
             raise TypeError("can only concatenate {} (not {}) to {}".format(type(self), type(other), type(self)))
 
-        new_list = LinkedList() # List to return
+        new_list = self._new_list() # List to return
         prev_el = new_list.head # start appending to this
 
         for el in self:
-            new_el = LinkElement()
-            new_el.value = el.value
+            new_el = new_list._new_node(el.value)
             prev_el.next = new_el
             prev_el = new_el
 
         for el in other:
-            new_el = LinkElement()
-            new_el.value = el.value
+            new_el = new_list._new_node(el.value)
             prev_el.next = new_el
             prev_el = new_el
 
-        new_el.next = new_list.head # close the loop by linking last el and head
+        prev_el.next = new_list.head # close the loop by linking last el and head
+        new_list.length = self.length + other.length
 
         return new_list
 
+    def __iadd__(self, other):
+        """ Akin to list's +=, extends self in place with a copy of other's
+            values and returns self
+        """
+        self.extend(other)
+        return self
+
     def __mul__(self, n):
-        """ concatenate self to itself n-times. Return *new* list """
+        """ concatenate self to itself n-times. Return *new* list, built in
+            one tail-linked pass
+        """
         if (not isinstance(n, int)):
             raise TypeError("can only concatenate {} (not {}) to {}".format(type(self), type(n), type(self)))
 
-        new_list = LinkedList()
-        for i in range(n):
-            new_list += self
+        values = [el.value for el in self]
+        new_list = self._new_list()
+        new_list.extend(value for i in range(n) for value in values)
         return new_list
 
+    def __reduce__(self):
+        """ pickle the values as one flat list, so pickling never recurses
+            down the chain of LinkElements
+        """
+        return (_unpickle_list, (type(self), self._options(), [el.value for el in self]))
+
     def __repr__(self):
         """ __str__ falls back to this. Is what is printed in interactive env.
 
@@ -478,12 +1700,544 @@ class LinkedList(object):
                 print as [[value, index of linked item in this list], ...]
                 would require new __str__
         """
-        ret_str = ""
-        for cur_node in self:
-            ret_str += "{}, ".format(cur_node.value)
+        return "[" + ", ".join("{}".format(cur_node.value) for cur_node in self) + "]"
+
+
+
+def _unpickle_list(cls, options, values):
+    """ rebuild a pickled LinkedList """
+    return cls.from_iterable(values, **options)
+
+
+
+class LinkedListView(object):
+    """ A read-only window onto a slice of a LinkedList.
+
+        The view keeps the LinkElement its slice starts at and walks the
+        parent's chain from there, so making one costs a walk to the start and
+        no copies. Any relinking of the parent makes the view stale, after
+        which using it raises RuntimeError. Changing values in place does not.
+    """
+
+    def __init__(self, parent, slice_k):
+        """ parent - @type - LinkedList
+                   - @param - the list to look into
+
+            slice_k - @type - slice
+                    - @param - the part of parent to show. Its step must be positive
+        """
+        if (slice_k.step is not None and slice_k.step <= 0):
+            raise ValueError("a {} can only have a positive step".format(type(self)))
+
+        start, count, step, backwards = parent._slice_positions(slice_k)
+        self.__parent = parent
+        self.__mod_count = parent.mod_count
+        self.__start = start
+        self.__length = count
+        self.__step = step
+        self.__start_node = parent._get_nth_el(start) if count else None
+
+        # index and node of the last element looked up
+        self.__cache_index = 0
+        self.__cache_node = self.__start_node
+
+    ################
+    ## Properties ##
+    ################
+    @property
+    def parent(self):
+        """ the LinkedList being viewed """
+        return self.__parent
+
+    @property
+    def length(self):
+        """ number of LinkElements in the view """
+        return self.__length
+
+    @property
+    def stale(self):
+        """ whether the parent was relinked since the view was made """
+        return self.__mod_count != self.__parent.mod_count
+
+    ##############################
+    ## Private / helper methods ##
+    ##############################
+    def _check(self):
+        """ raise if the view no longer matches its parent """
+        if (self.stale):
+            raise RuntimeError("{} is stale, its LinkedList was changed".format(type(self)))
+
+    def _get_nth_el(self, indx):
+        """ the view's `indx`th LinkElement, walking on from the last lookup
+            when it is at or before `indx`
+        """
+        self._check()
+        if (not isinstance(indx, int)):
+            raise TypeError("index must be type {}, you passed {}".format(int, type(indx)))
+        elif (indx < 0 or indx >= self.__length):
+            raise IndexError("index out of range")
+
+        if (indx >= self.__cache_index):
+            i = self.__cache_index
+            cur_node = self.__cache_node
+        else:
+            i = 0
+            cur_node = self.__start_node
+
+        for hop in range((indx - i) * self.__step):
+            cur_node = cur_node.next
+
+        self.__cache_index = indx
+        self.__cache_node = cur_node
+        return cur_node
+
+    ############################
+    ## Public Methods         ##
+    ############################
+    def get(self, indx):
+        """ Same as LinkedListView[indx]. If < 0, get `indx`th el from the end of the view """
+        if (isinstance(indx, int) and indx < 0):
+            indx = self.__length + indx
+        return self._get_nth_el(indx)
+
+    def count(self, value):
+        """ number of LinkElements in the view whose value == value """
+        total = 0
+        for el in self:
+            if (el.value == value):
+                total += 1
+        return total
+
+    def reduce(self, function, *initial):
+        """ Akin to functools.reduce over the view's values
+
+            function - @type - callable
+                     - @param - takes the running result and the next value
+
+            initial - @type - any
+                    - @param - optional starting result
+        """
+        values = (el.value for el in self)
+        if (initial):
+            result = initial[0]
+        else:
+            try:
+                result = next(values)
+            except StopIteration:
+                raise TypeError("reduce() of empty view with no initial value")
+
+        for value in values:
+            result = function(result, value)
+        return result
+
+    ###########################
+    ### Container type methods
+    ###########################
+    def __iter__(self):
+        """ Iterate through the view's LinkElements following the parent's links """
+        self._check()
+        cur_node = self.__start_node
+        step = self.__step
+        for n in range(self.__length):
+            if (n):
+                self._check()
+                for hop in range(step):
+                    cur_node = cur_node.next
+            yield cur_node
+
+    def __len__(self):
+        return self.__length
+
+    def __getitem__(self, key):
+        """ implements self[key] evaluation. A slice gives a narrower view
+
+            key - @type - int or slice
+                - @param - the nth item you want, or the slice of items you want
+        """
+        if (isinstance(key, slice)):
+            self._check()
+            if (key.step is not None and key.step <= 0):
+                raise ValueError("a {} can only have a positive step".format(type(self)))
+            start, stop, step = key.indices(self.__length)
+            stop = max(start, stop)
+            return LinkedListView(self.__parent, slice(self.__start + start * self.__step,
+                                                       self.__start + stop * self.__step,
+                                                       step * self.__step))
+
+        elif (isinstance(key, int)):
+            return self.get(key)
+
+        else:
+            raise TypeError("Type of {} was passed to __getitem__. Only {} and {} are accepted".format(type(key), slice, int))
+
+    def __contains__(self, value):
+        """ Is value in self[x].value for some x? """
+        for el in self:
+            if (value == el.value):
+                return True
+        return False
+
+    def __repr__(self):
+        return "[" + ", ".join("{}".format(el.value) for el in self) + "]"
+
+
+
+class DoublyLinkedList(LinkedList):
+    """ A LinkedList whose elements also link back to the previous element.
+
+        The head's `prev` is always the final item, so both ends of the list
+        are reachable in O(1) and index lookups walk from whichever of the
+        head, the tail or the fingers is closest.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(DoublyLinkedList, self).__init__(*args, **kwargs)
+        self._reset_positions() # the tail is head.prev, no trail needed
+
+    ################
+    ## Properties ##
+    ################
+    @property
+    def tail(self):
+        """ the final DoubleLinkElement in the list, or head if the list is empty """
+        return self.head.prev
+
+    ##############################
+    ## Private / helper methods ##
+    ##############################
+    def _get_nth_el(self, indx):
+        """ same as LinkedList._get_nth_el, but starts from the closest of the
+            head, the tail and the fingers and walks in either direction
+
+            indx of -1 == head
+        """
+        if (not isinstance(indx, int)):
+            raise TypeError("index must be type {}, you passed {}".format(int, type(indx)))
+
+        elif (indx < -1 or indx >= self.length):
+            raise IndexError("index out of range")
+
+        elif (indx == -1):
+            return self.head
+
+        elif (indx == self.length - 1):
+            return self.head.prev
+
+        index = self._skip_index()
+        if (index is not None):
+            return index.locate(indx)
+
+        # start at the head...
+        i = -1
+        cur_node = self.head
+        distance = indx + 1
+
+        # ...unless the tail...
+        if (self.length - 1 - indx < distance):
+            i = self.length - 1
+            cur_node = self.head.prev
+            distance = i - indx
+
+        # ...or a finger is closer
+        finger = self._closest_finger(indx, either_way=True)
+        if (finger is not None and abs(indx - finger[0]) < distance):
+            i, cur_node = finger
+        else:
+            finger = None
+
+        while (i < indx):
+            cur_node = cur_node.next
+            i += 1
+
+        while (i > indx):
+            cur_node = cur_node.prev
+            i -= 1
+
+        self._move_finger(finger, indx, cur_node)
+        return cur_node
+
+    def _make_node(self):
+        """ create an unlinked DoubleLinkElement """
+        return DoubleLinkElement()
+
+    def _set_tail(self, node):
+        """ the tail is always head.prev """
+        pass
+
+    def _rebuild_trail(self):
+        """ the tail is always head.prev, no trail is kept """
+        pass
+
+    def _tail_predecessor(self):
+        """ the node just before the tail """
+        return self.head.prev.prev
+
+
+
+class _SkipIndex(object):
+    """ Express links over the chain of a LinkedList, as in an indexable
+        skip list. The chain itself is the bottom level. Each express link
+        stores its width, the number of hops along the chain it skips, so a
+        lookup by index only follows O(log n) links.
+
+        Indices are the same as LinkedList._get_nth_el, the head being -1.
+        A width on a level's last link counts the hops to the end of the list.
+    """
+
+    MAX_LEVEL = 32
+
+    def __init__(self, head):
+        self.head_tower = _SkipTower(head, self.MAX_LEVEL)
+        self.level = 0 # number of express levels in use
+        self.length = 0
+
+    def _random_level(self):
+        """ number of express levels for a new node, each one 1/4 as likely """
+        level = 0
+        while (level < self.MAX_LEVEL and random.random() < 0.25):
+            level += 1
+        return level
+
+    def _path(self, indx):
+        """ for every level, the last tower at or before `indx` and its index """
+        tower = self.head_tower
+        i = -1
+        path = [None] * self.level
+        for l in reversed(range(self.level)):
+            while (tower.right[l] is not None and i + tower.width[l] <= indx):
+                i += tower.width[l]
+                tower = tower.right[l]
+            path[l] = (tower, i)
+        return path
+
+    def locate(self, indx):
+        """ the node at `indx` """
+        if (self.level):
+            tower, i = self._path(indx)[0]
+        else:
+            tower, i = self.head_tower, -1
+
+        cur_node = tower.node
+        while (i < indx):
+            cur_node = cur_node.next
+            i += 1
+        return cur_node
+
+    def insert(self, indx, node):
+        """ account for `node`, just linked into the chain at `indx` """
+        path = self._path(indx - 1)
+
+        level = self._random_level()
+        head_tower = self.head_tower
+        while (self.level < level):
+            head_tower.right[self.level] = None
+            head_tower.width[self.level] = self.length + 1
+            path.append((head_tower, -1))
+            self.level += 1
+
+        self.length += 1
+        if (level):
+            new_tower = _SkipTower(node, level)
+
+        for l in range(self.level):
+            tower, i = path[l]
+            if (l < level):
+                end = i + tower.width[l] + 1 # where the right tower is now
+                new_tower.right[l] = tower.right[l]
+                new_tower.width[l] = end - indx
+                tower.right[l] = new_tower
+                tower.width[l] = indx - i
+            else:
+                tower.width[l] += 1
+
+    def remove(self, indx):
+        """ account for the node at `indx` having been unlinked """
+        path = self._path(indx - 1)
+        self.length -= 1
+
+        for l in range(self.level):
+            tower, i = path[l]
+            right = tower.right[l]
+            if (right is not None and i + tower.width[l] == indx):
+                tower.right[l] = right.right[l]
+                tower.width[l] += right.width[l] - 1
+            else:
+                tower.width[l] -= 1
+
+        # drop levels that no longer link anywhere
+        while (self.level and self.head_tower.right[self.level - 1] is None):
+            self.level -= 1
+
+    def bisect(self, before):
+        """ for a chain where every node satisfying `before` comes first, the
+            number of those nodes and the last of them (or the head)
+        """
+        tower = self.head_tower
+        head = tower.node
+        i = -1
+        for l in reversed(range(self.level)):
+            while (tower.right[l] is not None and before(tower.right[l].node)):
+                i += tower.width[l]
+                tower = tower.right[l]
+
+        cur_node = tower.node
+        while (cur_node.next is not head and before(cur_node.next)):
+            cur_node = cur_node.next
+            i += 1
+        return i + 1, cur_node
+
+    def rebuild(self, head):
+        """ build the express links over the chain starting at `head` in one pass """
+        self.head_tower = _SkipTower(head, self.MAX_LEVEL)
+        self.level = 0
+        last = [] # (tower, index) of the last tower seen on each level
+
+        i = 0
+        cur_node = head.next
+        while (cur_node is not head):
+            level = self._random_level()
+            if (level):
+                new_tower = _SkipTower(cur_node, level)
+                while (len(last) < level):
+                    last.append((self.head_tower, -1))
+
+                for l in range(level):
+                    tower, j = last[l]
+                    tower.right[l] = new_tower
+                    tower.width[l] = i - j
+                    last[l] = (new_tower, i)
+
+            cur_node = cur_node.next
+            i += 1
+
+        # the last tower on each level spans to the end of the list
+        for l in range(len(last)):
+            tower, j = last[l]
+            tower.right[l] = None
+            tower.width[l] = i - j
+
+        self.level = len(last)
+        self.length = i
+
 
-        if ret_str:  ret_str = ret_str[:-2] # rm dangling ", "
-        return "[" + ret_str + "]"
+
+class _ValueIndex(object):
+    """ A hash index of the values in a LinkedList. `buckets` maps each
+        hashable value to an {id(node): node} dict of every LinkElement
+        holding it. Elements with unhashable values are only counted, so
+        lookups know when they have to fall back to a scan.
+
+        Entries are filed under the element's value when it is added, so a
+        value must be changed through the list, not on the LinkElement,
+        unless LinkedList.values_changed is called after.
+    """
+
+    def __init__(self):
+        self.buckets = {}
+        self.unhashable = 0
+
+    def add(self, node):
+        """ file `node` under its value """
+        try:
+            bucket = self.buckets.setdefault(node.value, {})
+        except TypeError:
+            self.unhashable += 1
+            return
+        bucket[id(node)] = node
+
+    def discard(self, node):
+        """ drop `node`, filed under its current value """
+        try:
+            bucket = self.buckets.get(node.value)
+        except TypeError:
+            self.unhashable -= 1
+            return
+
+        if (bucket is not None):
+            bucket.pop(id(node), None)
+            if (not bucket):
+                del self.buckets[node.value]
+
+    def rebuild(self, head):
+        """ file every element of the chain starting at `head` afresh """
+        self.buckets = {}
+        self.unhashable = 0
+        cur_node = head.next
+        while (cur_node is not head):
+            self.add(cur_node)
+            cur_node = cur_node.next
+
+
+class _Fingerprint(object):
+    """ An order-sensitive hash of the values in a LinkedList: the sum of
+        hash(value) * BASE ** index over the values, modulo a prime. A value
+        can be added to or removed from either end, or replaced, without
+        visiting the others. Equal lists have equal fingerprints.
+
+        The length of the list is tracked as `power`, BASE ** length.
+    """
+
+    MODULUS = 2 ** 61 - 1
+    BASE = 1000003
+    INVERSE = pow(BASE, MODULUS - 2, MODULUS) # BASE * INVERSE == 1
+
+    def __init__(self):
+        self.value = 0
+        self.power = 1
+
+    def _hash(self, value):
+        """ hash(value) reduced modulo MODULUS. Raises TypeError if unhashable """
+        return hash(value) % self.MODULUS
+
+    def push_back(self, value):
+        h = self._hash(value)
+        self.value = (self.value + h * self.power) % self.MODULUS
+        self.power = self.power * self.BASE % self.MODULUS
+
+    def push_front(self, value):
+        h = self._hash(value)
+        self.value = (h + self.value * self.BASE) % self.MODULUS
+        self.power = self.power * self.BASE % self.MODULUS
+
+    def pop_back(self, value):
+        h = self._hash(value)
+        self.power = self.power * self.INVERSE % self.MODULUS
+        self.value = (self.value - h * self.power) % self.MODULUS
+
+    def pop_front(self, value):
+        h = self._hash(value)
+        self.value = (self.value - h) * self.INVERSE % self.MODULUS
+        self.power = self.power * self.INVERSE % self.MODULUS
+
+    def replace(self, indx, old_value, new_value):
+        """ account for the value at `indx` changing from old_value to new_value """
+        change = self._hash(new_value) - self._hash(old_value)
+        self.value = (self.value + change * pow(self.BASE, indx, self.MODULUS)) % self.MODULUS
+
+    def concat(self, other):
+        """ account for the values of the _Fingerprint `other` following these """
+        self.value = (self.value + other.value * self.power) % self.MODULUS
+        self.power = self.power * other.power % self.MODULUS
+
+    def rebuild(self, head):
+        """ hash every value of the chain starting at `head` afresh """
+        self.value = 0
+        self.power = 1
+        cur_node = head.next
+        while (cur_node is not head):
+            self.push_back(cur_node.value)
+            cur_node = cur_node.next
+
+
+class _SkipTower(object):
+    """ The express links leaving one node of a _SkipIndex """
+
+    __slots__ = ("node", "right", "width")
+
+    def __init__(self, node, level):
+        self.node = node
+        self.right = [None] * level
+        self.width = [0] * level
 
 
 
@@ -601,3 +2355,39 @@ class LinkElement(object):
 
     def __repr__(self):
         return str(self.value)
+
+
+
+class DoubleLinkElement(LinkElement):
+    """ Elements of a DoublyLinkedList. Setting `next` also points the new
+        next element's `prev` back at this one, so every relink done by
+        LinkedList keeps the back links in step
+    """
+
+    def __init__(self):
+        super(DoubleLinkElement, self).__init__()
+        self.__prev = self #reference to the previous object
+
+    ################
+    ## Properties ##
+    ################
+    @property
+    def next(self):
+        return LinkElement.next.fget(self)
+
+    @next.setter
+    def next(self, DoubleLinkElement_obj):
+        if (not isinstance(DoubleLinkElement_obj, DoubleLinkElement)):
+            raise TypeError("set_next takes a {} object. You added a {}".format(DoubleLinkElement, type(DoubleLinkElement_obj)))
+        LinkElement.next.fset(self, DoubleLinkElement_obj)
+        DoubleLinkElement_obj.prev = self
+
+    @property
+    def prev(self):
+        return self.__prev
+
+    @prev.setter
+    def prev(self, DoubleLinkElement_obj):
+        if (not isinstance(DoubleLinkElement_obj, DoubleLinkElement)):
+            raise TypeError("set_prev takes a {} object. You added a {}".format(DoubleLinkElement, type(DoubleLinkElement_obj)))
+        self.__prev = DoubleLinkElement_obj
@@ -0,0 +1,392 @@
+#!/usr/bin/python
+import os
+import mmap
+import struct
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+
+class MmapLinkedList(object):
+    """ Implementation of a Linked List stored in a memory-mapped file.
+
+        As in ArenaLinkedList every item is a slot, here a fixed-size record
+        in the file: the slot numbers of the next and previous items, then the
+        value. Slot 0 is the head, and slots of removed items are chained into
+        a free list and reused. The file is paged in and out by the OS, so the
+        list can grow past available memory, and reopening it reads only the
+        header.
+
+        dtype decides how values are stored:
+            "q" - 64-bit ints, in the record
+            "d" - floats, in the record
+            "O" - any picklable object, appended to a `<path>.heap` file. The
+                  record holds its offset there. Heap space of removed values
+                  is not reclaimed
+
+        Items have no element of their own, so as with ArenaLinkedList, `get`,
+        `pop`, indexing and iteration hand back the values themselves.
+    """
+
+    MAGIC = b"LLMM"
+    VERSION = 1
+    HEADER = struct.Struct("<4sBc2xQQQQ") # magic, version, dtype, length, used, free, capacity
+    HEADER_SIZE = 64
+    LINKS = struct.Struct("<qq") # next slot, prev slot
+    RECORD_SIZE = 24
+    DTYPES = {"q": struct.Struct("<q"), "d": struct.Struct("<d"), "O": struct.Struct("<q")}
+    BLOB_SIZE = struct.Struct("<I")
+
+    def __init__(self, path, dtype=None, capacity=1024):
+        """ opens the list stored at `path`, or creates it
+
+            path - @type - str
+                 - @param - the file holding the records
+
+            dtype - @type - str or None
+                  - @param - "q", "d" or "O", see the class docstring. None
+                             is the stored dtype of an existing file, or "q"
+
+            capacity - @type - int
+                     - @param - slots to allocate for a new file. The file
+                                doubles whenever it runs out
+        """
+        self.__path = path
+        self.__heap = None
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+
+        if (exists):
+            self.__file = open(path, "r+b")
+            magic, version, stored, length, used, free, slots = self.HEADER.unpack(
+                self.__file.read(self.HEADER.size))
+            if (magic != self.MAGIC or version != self.VERSION):
+                self.__file.close()
+                raise ValueError("{} is not a {} file".format(path, type(self)))
+
+            stored = stored.decode("ascii")
+            if (dtype is not None and dtype != stored):
+                self.__file.close()
+                raise ValueError("{} holds dtype {}, not {}".format(path, stored, dtype))
+            dtype = stored
+
+        else:
+            dtype = dtype or "q"
+            if (dtype not in self.DTYPES):
+                raise TypeError("dtype must be one of {}, you passed {}".format(sorted(self.DTYPES), dtype))
+            if (not isinstance(capacity, int) or capacity < 1):
+                raise TypeError("capacity must be a positive {}, you passed {}".format(int, capacity))
+
+            length, used, free, slots = 0, 1, 0, capacity + 1
+            self.__file = open(path, "w+b")
+            self.__file.truncate(self.HEADER_SIZE + slots * self.RECORD_SIZE)
+
+        self.__dtype = dtype
+        self.__value = self.DTYPES[dtype]
+        self.__length = length
+        self.__used = used # slots handed out so far, including the head
+        self.__free = free # first free slot, 0 when there are none
+        self.__slots = slots
+        self.__map = mmap.mmap(self.__file.fileno(), 0)
+
+        if (dtype == "O"):
+            heap_path = path + ".heap"
+            self.__heap = open(heap_path, "r+b" if os.path.exists(heap_path) else "w+b")
+
+        if (not exists):
+            self._set_links(0, 0, 0)
+            self._write_header()
+
+        # index and slot of the last requested index
+        self.__cache_index = -1
+        self.__cache_slot = 0
+
+    ################
+    ## Properties ##
+    ################
+    @property
+    def length(self):
+        """ number of items in the list """
+        return self.__length
+
+    @property
+    def path(self):
+        """ the file holding the records """
+        return self.__path
+
+    @property
+    def dtype(self):
+        """ how values are stored, "q", "d" or "O" """
+        return self.__dtype
+
+    @property
+    def capacity(self):
+        """ number of slots the file has room for, excluding the head """
+        return self.__slots - 1
+
+    ##############################
+    ## Private / helper methods ##
+    ##############################
+    def _write_header(self):
+        """ store the list's bookkeeping, so reopening the file finds it """
+        self.HEADER.pack_into(self.__map, 0, self.MAGIC, self.VERSION, self.__dtype.encode("ascii"),
+                              self.__length, self.__used, self.__free, self.__slots)
+
+    def _offset(self, slot):
+        return self.HEADER_SIZE + slot * self.RECORD_SIZE
+
+    def _links(self, slot):
+        """ (next slot, prev slot) of `slot` """
+        return self.LINKS.unpack_from(self.__map, self._offset(slot))
+
+    def _set_links(self, slot, next_slot, prev_slot):
+        self.LINKS.pack_into(self.__map, self._offset(slot), next_slot, prev_slot)
+
+    def _set_next(self, slot, next_slot):
+        struct.pack_into("<q", self.__map, self._offset(slot), next_slot)
+
+    def _set_prev(self, slot, prev_slot):
+        struct.pack_into("<q", self.__map, self._offset(slot) + 8, prev_slot)
+
+    def _read_value(self, slot):
+        value, = self.__value.unpack_from(self.__map, self._offset(slot) + self.LINKS.size)
+        if (self.__heap is not None):
+            self.__heap.seek(value)
+            size, = self.BLOB_SIZE.unpack(self.__heap.read(self.BLOB_SIZE.size))
+            value = pickle.loads(self.__heap.read(size))
+        return value
+
+    def _write_value(self, slot, value):
+        if (self.__heap is not None):
+            data = pickle.dumps(value, 2)
+            self.__heap.seek(0, os.SEEK_END)
+            offset = self.__heap.tell()
+            self.__heap.write(self.BLOB_SIZE.pack(len(data)))
+            self.__heap.write(data)
+            value = offset
+
+        try:
+            self.__value.pack_into(self.__map, self._offset(slot) + self.LINKS.size, value)
+        except struct.error:
+            raise TypeError("a {} of dtype {} cannot store {}".format(type(self), self.__dtype, type(value)))
+
+    def _grow(self):
+        """ double the slots the file has room for """
+        self.__slots *= 2
+        self.__map.close()
+        self.__file.truncate(self.HEADER_SIZE + self.__slots * self.RECORD_SIZE)
+        self.__map = mmap.mmap(self.__file.fileno(), 0)
+
+    def _get_nth_slot(self, indx):
+        """ slot of the `indx`th item, walking from whichever of the head, the
+            tail and the cached slot is closest
+
+            indx of -1 == head slot, 0
+        """
+        if (not isinstance(indx, int)):
+            raise TypeError("index must be type {}, you passed {}".format(int, type(indx)))
+
+        elif (indx < -1 or indx >= self.__length):
+            raise IndexError("index out of range")
+
+        # start at the head...
+        i = -1
+        slot = 0
+        distance = indx + 1
+
+        # ...unless the tail...
+        if (self.__length - 1 - indx < distance):
+            i = self.__length - 1
+            slot = self._links(0)[1]
+            distance = i - indx
+
+        # ...or the cached slot is closer
+        if (abs(indx - self.__cache_index) < distance):
+            i = self.__cache_index
+            slot = self.__cache_slot
+
+        while (i < indx):
+            slot = self._links(slot)[0]
+            i += 1
+
+        while (i > indx):
+            slot = self._links(slot)[1]
+            i -= 1
+
+        self.__cache_index = indx
+        self.__cache_slot = slot
+        return slot
+
+    def _insert_after(self, value, indx):
+        """ store `value` in a free slot and link it after the `indx`th item """
+        prev_slot = self._get_nth_slot(indx)
+
+        # take a slot off the free list, or the next unused one
+        slot = self.__free
+        reused = bool(slot)
+        if (reused):
+            self.__free = self._links(slot)[0]
+        else:
+            if (self.__used == self.__slots):
+                self._grow()
+            slot = self.__used
+            self.__used += 1
+
+        try:
+            self._write_value(slot, value)
+        except:
+            # hand the slot back, whatever stopped the value being stored
+            # (e.g. a value of dtype "O" that cannot be pickled)
+            if (reused):
+                self._set_next(slot, self.__free)
+                self.__free = slot
+            else:
+                self.__used -= 1
+            self._write_header()
+            raise
+
+        next_slot = self._links(prev_slot)[0]
+        self._set_links(slot, next_slot, prev_slot)
+        self._set_next(prev_slot, slot)
+        self._set_prev(next_slot, slot)
+
+        self.__length += 1
+        if (self.__cache_index > indx):
+            self.__cache_index += 1
+        self._write_header()
+
+    def _pop_after(self, indx):
+        """ unlink the item after the `indx`th, free its slot and return its value """
+        prev_slot = self._get_nth_slot(indx)
+        slot = self._links(prev_slot)[0]
+        if (slot == 0):
+            raise IndexError("index out of range")
+
+        value = self._read_value(slot)
+        next_slot = self._links(slot)[0]
+        self._set_next(prev_slot, next_slot)
+        self._set_prev(next_slot, prev_slot)
+
+        self._set_next(slot, self.__free)
+        self.__free = slot
+
+        self.__length -= 1
+        self.__cache_index = indx
+        self.__cache_slot = prev_slot
+        self._write_header()
+        return value
+
+    ############################
+    ## Public Methods         ##
+    ############################
+
+    ### Write ###
+    def append(self, value):
+        """ Akin to list's append
+
+            value - @type - any the dtype can store
+                  - @param - stored in a free slot linked before the head
+        """
+        self._insert_after(value, self.__length - 1)
+
+    def prepend(self, value):
+        """ Push to the beginning of a MmapLinkedList
+
+            value - @type - any the dtype can store
+                  - @param - stored in a free slot linked after the head
+        """
+        self._insert_after(value, -1)
+
+    def pop(self):
+        """ Remove and return the final value in a list """
+        return self._pop_after(self.__length - 2)
+
+    def insert(self, indx, value):
+        """ insert a value btwn MmapLinkedList[indx - 1] and MmapLinkedList[indx] """
+        self._insert_after(value, indx - 1)
+
+    def flush(self):
+        """ write every change out to the file """
+        self.__map.flush()
+        if (self.__heap is not None):
+            self.__heap.flush()
+
+    def close(self):
+        """ flush and release the file. The list cannot be used afterwards """
+        if (self.__file.closed):
+            return
+        self.flush()
+        self.__map.close()
+        self.__file.close()
+        if (self.__heap is not None):
+            self.__heap.close()
+
+    ### Read ###
+    def get(self, indx):
+        """ Same as MmapLinkedList[indx]
+
+            indx - @type - int
+                 - @param - value to get. If < 0, get `indx`th value from the end of list
+        """
+        if (isinstance(indx, int) and indx < 0):
+            indx = self.__length + indx
+
+        if (indx == -1):
+            raise IndexError("index out of range")
+
+        return self._read_value(self._get_nth_slot(indx))
+
+    ###########################
+    ### Container type methods
+    ### Enables things like len() and iteration
+    ### https://docs.python.org/2/reference/datamodel.html#emulating-container-types
+    ###########################
+    def __iter__(self):
+        """ Iterate through values following the slot links """
+        slot = self._links(0)[0]
+        while (slot):
+            yield self._read_value(slot)
+            slot = self._links(slot)[0]
+
+    def __len__(self):
+        return self.__length
+
+    def __getitem__(self, indx):
+        """ implements self[indx] evaluation """
+        if (not isinstance(indx, int)):
+            raise TypeError("Type of {} was passed to __getitem__. Only {} is accepted".format(type(indx), int))
+        return self.get(indx)
+
+    def __setitem__(self, indx, value):
+        """ supports self[indx] assignment """
+        if (not isinstance(indx, int)):
+            raise TypeError("Type of {} was passed to __setitem__. Only {} is accepted".format(type(indx), int))
+        if (indx < 0):
+            indx = self.__length + indx
+        if (indx == -1):
+            raise IndexError("index out of range")
+        self._write_value(self._get_nth_slot(indx), value)
+
+    def __delitem__(self, indx):
+        """ support for `del self[indx]` """
+        if (not isinstance(indx, int)):
+            raise TypeError("Type of {} was passed to __delitem__. Only {} is accepted".format(type(indx), int))
+        if (indx < 0):
+            indx = self.__length + indx
+        self._pop_after(indx - 1)
+
+    def __contains__(self, value):
+        """ Is value in self? """
+        for item in self:
+            if (value == item):
+                return True
+        return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return "[" + ", ".join("{}".format(value) for value in self) + "]"
@@ -0,0 +1,98 @@
+#!/usr/bin/python
+""" Process-pool map and reduce over the values of a list.
+
+    The values are cut into chunks of consecutive values in one pass, and
+    each chunk travels to a worker process packed as a snapshot (see
+    linkedlist.snapshot), so ints and floats cross as packed int64s and
+    doubles, never as LinkElements. Results come back the same way, in order.
+
+    Functions run in other processes, so they must be picklable, e.g.
+    defined at module level.
+
+    concurrent.futures is imported on first use. It is in the standard
+    library from python 3.2, and is the `futures` backport on python 2.
+"""
+import functools
+import multiprocessing
+from collections import deque
+from io import BytesIO
+from .snapshot import CHUNK_SIZE, dump_values, load_values
+
+# parallel_reduce's initial when none is given, as None is a valid one
+NO_INITIAL = object()
+
+
+def pack(values):
+    """ a python list of values as snapshot bytes """
+    data = BytesIO()
+    dump_values(values, len(values), data)
+    return data.getvalue()
+
+def unpack(data):
+    """ the python list of values in snapshot bytes """
+    return list(load_values(BytesIO(data)))
+
+def _chunks(values, size):
+    """ yield python lists of up to `size` consecutive values """
+    chunk = []
+    for value in values:
+        chunk.append(value)
+        if (len(chunk) == size):
+            yield chunk
+            chunk = []
+    if (chunk):
+        yield chunk
+
+def _map_chunk(function, data):
+    """ run in a worker, `function` of every value of a packed chunk """
+    return pack([function(value) for value in unpack(data)])
+
+def _reduce_chunk(function, data):
+    """ run in a worker, a packed chunk reduced to one value """
+    return pack([functools.reduce(function, unpack(data))])
+
+def _run(task, function, values, workers, chunk):
+    """ yield task(function, packed chunk) for each chunk of values, in order.
+        At most two chunks per worker are in flight, so the values are never
+        all packed at once
+    """
+    if (not isinstance(chunk, int) or chunk < 1):
+        raise ValueError("chunk must be a positive {}, you passed {}".format(int, chunk))
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or multiprocessing.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque()
+        for part in _chunks(values, chunk):
+            in_flight.append(executor.submit(task, function, pack(part)))
+            if (len(in_flight) >= 2 * workers):
+                yield in_flight.popleft().result()
+
+        while (in_flight):
+            yield in_flight.popleft().result()
+
+def map_values(function, values, workers=None, chunk=CHUNK_SIZE):
+    """ yield function(value) for every value, computed in worker processes
+
+        workers - @type - int or None
+                - @param - processes to use, None for one per CPU
+
+        chunk - @type - int
+              - @param - values sent to a worker at a time
+    """
+    for data in _run(_map_chunk, function, values, workers, chunk):
+        for value in unpack(data):
+            yield value
+
+def reduce_values(function, values, initial=NO_INITIAL, workers=None, chunk=CHUNK_SIZE):
+    """ Akin to functools.reduce, but each chunk is reduced in a worker
+        process and the results are then reduced in order, so `function`
+        must be associative
+    """
+    results = [unpack(data)[0] for data in _run(_reduce_chunk, function, values, workers, chunk)]
+    if (initial is not NO_INITIAL):
+        results.insert(0, initial)
+    if (not results):
+        raise TypeError("reduce() of empty list with no initial value")
+    return functools.reduce(function, results)
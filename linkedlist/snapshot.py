@@ -0,0 +1,117 @@
+#!/usr/bin/python
+""" A versioned binary format for the values of a list.
+
+    A snapshot is a header followed by chunks of up to CHUNK_SIZE values:
+
+        header - MAGIC, VERSION (1 byte), number of values (uint64)
+        chunk  - kind (1 byte), number of values (uint32), payload
+
+    A chunk of only ints that fit in 64 bits is packed as int64s, a chunk of
+    only floats as doubles, and any other chunk is a pickled python list
+    preceded by its size in bytes (uint32). Everything is little endian.
+"""
+import struct
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+MAGIC = b"LLST"
+VERSION = 1
+CHUNK_SIZE = 4096
+
+_HEADER = struct.Struct("<4sBQ")
+_CHUNK = struct.Struct("<cI")
+_SIZE = struct.Struct("<I")
+
+_INTS = b"i"
+_FLOATS = b"f"
+_PICKLED = b"p"
+
+_INT_MIN = -2 ** 63
+_INT_MAX = 2 ** 63 - 1
+
+
+def _read(fileobj, size):
+    """ exactly `size` bytes from fileobj """
+    data = fileobj.read(size)
+    if (len(data) != size):
+        raise ValueError("snapshot is truncated")
+    return data
+
+def _chunk_kind(values):
+    """ how a chunk of values is packed """
+    if (all(type(value) is int and _INT_MIN <= value <= _INT_MAX for value in values)):
+        return _INTS
+    elif (all(type(value) is float for value in values)):
+        return _FLOATS
+    return _PICKLED
+
+def _write_chunk(values, fileobj):
+    kind = _chunk_kind(values)
+    fileobj.write(_CHUNK.pack(kind, len(values)))
+    if (kind == _INTS):
+        fileobj.write(struct.pack("<{}q".format(len(values)), *values))
+    elif (kind == _FLOATS):
+        fileobj.write(struct.pack("<{}d".format(len(values)), *values))
+    else:
+        data = pickle.dumps(values, 2)
+        fileobj.write(_SIZE.pack(len(data)))
+        fileobj.write(data)
+
+def dump_values(values, count, fileobj):
+    """ write a snapshot of `values` to fileobj, a chunk at a time
+
+        values - @type - iterable
+               - @param - the values, in order
+
+        count - @type - int
+              - @param - how many values there are
+    """
+    fileobj.write(_HEADER.pack(MAGIC, VERSION, count))
+
+    chunk = []
+    written = 0
+    for value in values:
+        chunk.append(value)
+        if (len(chunk) == CHUNK_SIZE):
+            _write_chunk(chunk, fileobj)
+            written += len(chunk)
+            chunk = []
+
+    if (chunk):
+        _write_chunk(chunk, fileobj)
+        written += len(chunk)
+
+    if (written != count):
+        raise ValueError("expected {} values, got {}".format(count, written))
+
+def load_values(fileobj):
+    """ Iterate through the values of a snapshot, reading a chunk at a time """
+    magic, version, count = _HEADER.unpack(_read(fileobj, _HEADER.size))
+    if (magic != MAGIC):
+        raise ValueError("not a snapshot")
+    elif (version != VERSION):
+        raise ValueError("unsupported snapshot version {}".format(version))
+
+    while (count):
+        kind, n = _CHUNK.unpack(_read(fileobj, _CHUNK.size))
+        if (n > count):
+            raise ValueError("snapshot chunk overruns its header")
+
+        if (kind == _INTS):
+            values = struct.unpack("<{}q".format(n), _read(fileobj, 8 * n))
+        elif (kind == _FLOATS):
+            values = struct.unpack("<{}d".format(n), _read(fileobj, 8 * n))
+        elif (kind == _PICKLED):
+            size, = _SIZE.unpack(_read(fileobj, _SIZE.size))
+            values = pickle.loads(_read(fileobj, size))
+        else:
+            raise ValueError("unknown snapshot chunk {!r}".format(kind))
+
+        if (len(values) != n):
+            raise ValueError("snapshot chunk holds {} values, not {}".format(len(values), n))
+
+        for value in values:
+            yield value
+        count -= n
@@ -0,0 +1,280 @@
+#!/usr/bin/python
+from .linkedlist import LinkedList
+
+
+class SortedLinkedList(LinkedList):
+    """ A LinkedList that keeps its values in ascending order.
+
+        Values are ordered by `key(value)`, compared with `<` as
+        LinkElement.__cmp__ compares values. Equal keys keep the order they
+        were added in.
+
+        The list is always indexed: the skip-list index's express links are
+        in order too, so `add`, `remove` and the bisects follow O(log n) links
+        instead of walking the chain.
+
+        Values can only be placed by `add` (or `extend`), so the positional
+        writes of LinkedList (append, prepend, insert, insert_many, item
+        assignment) raise NotImplementedError.
+    """
+
+    def __init__(self, key=None, fingers=4, value_indexed=False, fingerprinted=False, pool_size=0):
+        """ creates the head, sets length to 0
+
+            key - @type - callable or None
+                - @param - values are ordered by key(value). None orders by
+                           the values themselves
+        """
+        super(SortedLinkedList, self).__init__(fingers=fingers, indexed=True, value_indexed=value_indexed,
+                                               fingerprinted=fingerprinted, pool_size=pool_size)
+        self.__key = key
+
+    ################
+    ## Properties ##
+    ################
+    @property
+    def key(self):
+        """ the function values are ordered by, or None """
+        return self.__key
+
+    ##############################
+    ## Private / helper methods ##
+    ##############################
+    def _key_of(self, value):
+        """ what `value` is ordered by """
+        if (self.__key is None):
+            return value
+        return self.__key(value)
+
+    def _bisect(self, before):
+        """ (number of LinkElements satisfying `before`, the last of them or head),
+            through the index when there is one
+        """
+        index = self._skip_index()
+        if (index is not None):
+            return index.bisect(before)
+
+        i = 0
+        head = self.head
+        cur_node = head
+        while (cur_node.next is not head and before(cur_node.next)):
+            cur_node = cur_node.next
+            i += 1
+        return i, cur_node
+
+    def _bisect_left(self, key):
+        """ position of the first LinkElement whose key is not < key, and the one before it """
+        key_of = self._key_of
+        return self._bisect(lambda node: key_of(node.value) < key)
+
+    def _bisect_right(self, key):
+        """ position of the first LinkElement whose key is > key, and the one before it """
+        key_of = self._key_of
+        return self._bisect(lambda node: not key < key_of(node.value))
+
+    def _find_node(self, value):
+        """ (position, LinkElement) of the first element whose value == value,
+            found among those sharing its key. (None, None) if there is none
+        """
+        key = self._key_of(value)
+        i, prev_node = self._bisect_left(key)
+        cur_node = prev_node.next
+        while (cur_node is not self.head and not key < self._key_of(cur_node.value)):
+            if (cur_node.value == value):
+                return i, cur_node
+            cur_node = cur_node.next
+            i += 1
+        return None, None
+
+    def _options(self):
+        """ the constructor arguments for an empty SortedLinkedList ordered the same way """
+        return {"key": self.__key, "fingers": self.finger_count,
+                "value_indexed": self.value_indexed, "fingerprinted": self.fingerprinted,
+                "pool_size": self.pool_size}
+
+    ############################
+    ## Public Methods         ##
+    ############################
+
+    ### Write ###
+    def add(self, value):
+        """ link `value` in at its place in the order, after any equal keys
+
+            *Performance* - O(log n)
+        """
+        i, prev_node = self._bisect_right(self._key_of(value))
+        self._insert_after(value, i - 1)
+
+    def extend(self, iterable):
+        """ add every value of `iterable`. Values that all sort after the
+            current tail are sorted and linked on in one pass
+
+            iterable - @type - iterable
+                     - @param - the values to add, in any order
+        """
+        if (isinstance(iterable, LinkedList)):
+            values = [el.value for el in iterable]
+        else:
+            values = list(iterable)
+        values.sort(key=self._key_of)
+
+        if (values and (not self.length or not self._key_of(values[0]) < self._key_of(self.tail.value))):
+            super(SortedLinkedList, self).extend(values)
+        else:
+            for value in values:
+                self.add(value)
+
+    def splice(self, other):
+        """ move every value of `other` into this list, in order, leaving
+            `other` empty. Unlike LinkedList.splice the values are added, not
+            relinked, so this is O(k log n)
+        """
+        if (other is self):
+            raise ValueError("cannot splice a list into itself")
+        self.extend(other)
+        del other[:]
+
+    def remove(self, value):
+        """ Akin to list's remove, delete the first LinkElement whose value == value.
+            Raises ValueError if there is none
+        """
+        i, node = self._find_node(value)
+        if (node is None):
+            raise ValueError("{} is not in list".format(value))
+        self._release_nodes((self._pop_after(i - 1),))
+
+    def append(self, value):
+        raise NotImplementedError("use add, a {} places values itself".format(type(self)))
+
+    def prepend(self, value):
+        raise NotImplementedError("use add, a {} places values itself".format(type(self)))
+
+    def insert(self, indx, value):
+        raise NotImplementedError("use add, a {} places values itself".format(type(self)))
+
+    def insert_many(self, pairs):
+        raise NotImplementedError("use extend, a {} places values itself".format(type(self)))
+
+    def sort(self, key=None, reverse=False):
+        raise NotImplementedError("a {} is always sorted".format(type(self)))
+
+    ### Read ###
+    def bisect_left(self, value):
+        """ Akin to bisect.bisect_left, the index to add `value` at before any
+            equal keys
+        """
+        return self._bisect_left(self._key_of(value))[0]
+
+    def bisect_right(self, value):
+        """ Akin to bisect.bisect_right, the index to add `value` at after any
+            equal keys
+        """
+        return self._bisect_right(self._key_of(value))[0]
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """ Iterate through the LinkElements whose keys lie between lo's and hi's
+
+            lo, hi - @type - any
+                   - @param - bounding values, their keys are compared. None
+                              leaves that end open
+
+            inclusive - @type - (bool, bool)
+                      - @param - whether values with lo's and hi's keys are included
+
+            *Performance* - O(log n) to find the first LinkElement, then a walk
+        """
+        head = self.head
+        if (lo is None):
+            prev_node = head
+        elif (inclusive[0]):
+            prev_node = self._bisect_left(self._key_of(lo))[1]
+        else:
+            prev_node = self._bisect_right(self._key_of(lo))[1]
+
+        hi_key = None if hi is None else self._key_of(hi)
+        cur_node = prev_node.next
+        while (cur_node is not head):
+            if (hi is not None):
+                key = self._key_of(cur_node.value)
+                if (hi_key < key or (not inclusive[1] and not key < hi_key)):
+                    return
+            yield cur_node
+            cur_node = cur_node.next
+
+    def nsmallest(self, n):
+        """ a python list of the first `n` LinkElements, those with the
+            smallest keys. O(n), they are already at the front
+        """
+        smallest = []
+        for el in self:
+            if (len(smallest) >= n):
+                break
+            smallest.append(el)
+        return smallest
+
+    def count(self, value):
+        """ number of LinkElements whose value == value, among those sharing its key """
+        i, node = self._find_node(value)
+        total = 0
+        key = self._key_of(value)
+        while (node is not None and node is not self.head and not key < self._key_of(node.value)):
+            if (node.value == value):
+                total += 1
+            node = node.next
+        return total
+
+    def find(self, value):
+        """ the first LinkElement whose value == value, or None. O(log n) """
+        return self._find_node(value)[1]
+
+    def index(self, value):
+        """ position of the first LinkElement whose value == value. Raises
+            ValueError if there is none. O(log n)
+        """
+        i, node = self._find_node(value)
+        if (node is None):
+            raise ValueError("{} is not in list".format(value))
+        return i
+
+    ###########################
+    ### Container type methods
+    ###########################
+    def __contains__(self, value):
+        """ Is value in self? Bisects to the LinkElements sharing its key """
+        return self._find_node(value)[1] is not None
+
+    def _getitem__slice(self, slice_k):
+        """ a slice as a new SortedLinkedList. A reversed slice is not in
+            order, so it comes back as a plain LinkedList
+        """
+        start, count, step, backwards = self._slice_positions(slice_k)
+        values = [node.value for prev_node, node in self._walk_slice(start, count, step)]
+        if (backwards):
+            values.reverse()
+            return LinkedList.from_iterable(values)
+
+        L = self._new_list()
+        LinkedList.extend(L, values)
+        return L
+
+    def __setitem__(self, key, value):
+        raise NotImplementedError("use add and remove, a {} places values itself".format(type(self)))
+
+    def __add__(self, other):
+        """ a new SortedLinkedList holding the values of both lists, in order """
+        if (not isinstance(other, LinkedList)):
+            raise TypeError("can only concatenate {} (not {}) to {}".format(LinkedList, type(other), type(self)))
+
+        new_list = self._new_list()
+        LinkedList.extend(new_list, self)
+        new_list.extend(other)
+        return new_list
+
+    def __mul__(self, n):
+        """ a new SortedLinkedList holding each value n times, in order """
+        if (not isinstance(n, int)):
+            raise TypeError("can only concatenate {} (not {}) to {}".format(type(self), type(n), type(self)))
+
+        new_list = self._new_list()
+        LinkedList.extend(new_list, (el.value for el in self for i in range(n)))
+        return new_list
@@ -0,0 +1,108 @@
+#!/usr/bin/python
+from itertools import islice
+
+
+class LinkedListStream(object):
+    """ A lazy pipeline of transforms over a stream of values.
+
+        Transforms (`map`, `filter`, `take`, `chunk`) only wrap the
+        underlying generator and return a new stream, so nothing is read from
+        the source until a terminal (`to_linkedlist`, `to_list`, `reduce`,
+        `for_each`) pulls values through. Only one value at a time (or one
+        chunk, for `chunk`) is alive in the pipeline.
+
+        A stream can be consumed once.
+    """
+
+    def __init__(self, values, list_type=None):
+        """ values - @type - iterable
+                   - @param - the source values, in order
+
+            list_type - @type - LinkedList subclass or None
+                      - @param - what `to_linkedlist` builds by default
+        """
+        self.__values = iter(values)
+        self.__list_type = list_type
+
+    def _chain(self, values):
+        """ a stream over `values` that keeps this stream's list_type """
+        return type(self)(values, self.__list_type)
+
+    ############################
+    ## Transforms             ##
+    ############################
+    def map(self, function):
+        """ apply `function` to every value """
+        return self._chain(function(value) for value in self.__values)
+
+    def filter(self, predicate):
+        """ keep only the values for which `predicate(value)` is true """
+        return self._chain(value for value in self.__values if predicate(value))
+
+    def take(self, n):
+        """ stop after the first `n` values. Nothing past them is read """
+        if (not isinstance(n, int) or n < 0):
+            raise ValueError("take expects a non-negative {}, you passed {}".format(int, n))
+        return self._chain(islice(self.__values, n))
+
+    def chunk(self, size):
+        """ group values into python lists of `size`, the last one possibly shorter """
+        if (not isinstance(size, int) or size < 1):
+            raise ValueError("chunk size must be a positive {}, you passed {}".format(int, size))
+
+        def chunks(values):
+            while (True):
+                block = list(islice(values, size))
+                if (not block):
+                    return
+                yield block
+
+        return self._chain(chunks(self.__values))
+
+    ############################
+    ## Terminals              ##
+    ############################
+    def to_linkedlist(self, list_type=None):
+        """ build a list of the stream's values, linking each one straight
+            onto the running tail
+
+            list_type - @type - LinkedList subclass or None
+                      - @param - defaults to the type of the source list
+        """
+        list_type = list_type or self.__list_type
+        if (list_type is None):
+            raise TypeError("no list type to build, pass list_type")
+        return list_type.from_iterable(self.__values)
+
+    def to_list(self):
+        """ the stream's values as a python list """
+        return list(self.__values)
+
+    def reduce(self, function, *initial):
+        """ Akin to functools.reduce over the stream's values
+
+            function - @type - callable
+                     - @param - takes the running result and the next value
+
+            initial - @type - any
+                    - @param - optional starting result
+        """
+        if (initial):
+            result = initial[0]
+        else:
+            try:
+                result = next(self.__values)
+            except StopIteration:
+                raise TypeError("reduce() of empty stream with no initial value")
+
+        for value in self.__values:
+            result = function(result, value)
+        return result
+
+    def for_each(self, function):
+        """ call `function` on every value, for its side effects """
+        for value in self.__values:
+            function(value)
+
+    def __iter__(self):
+        return self.__values
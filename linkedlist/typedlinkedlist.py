@@ -0,0 +1,168 @@
+#!/usr/bin/python
+from array import array
+from .unrolledlinkedlist import UnrolledLinkedList
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TypedLinkedList(UnrolledLinkedList):
+    """ An UnrolledLinkedList of numbers whose blocks are typed arrays.
+
+        Each block is an `array` of `dtype`, so values are stored unboxed and
+        contiguously, a block at a time. Reductions run over whole blocks in
+        C: through numpy when it is installed, otherwise through the builtins
+        over each array. `to_numpy` and `apply_ufunc` need numpy.
+    """
+
+    def __init__(self, dtype="d", capacity=1024):
+        """ creates the head, sets length to 0
+
+            dtype - @type - str
+                  - @param - an `array` typecode, e.g. "d" for floats or "l" for ints
+
+            capacity - @type - int
+                     - @param - the most values a block holds before it is split
+        """
+        try:
+            array(dtype)
+        except (TypeError, ValueError):
+            raise TypeError("dtype must be an array typecode, you passed {}".format(dtype))
+
+        super(TypedLinkedList, self).__init__(capacity)
+        self.__dtype = dtype
+
+    ################
+    ## Properties ##
+    ################
+    @property
+    def dtype(self):
+        """ the array typecode values are stored as """
+        return self.__dtype
+
+    ##############################
+    ## Private / helper methods ##
+    ##############################
+    def _new_block(self, values, prev_block):
+        """ link a new block holding `values`, as an array, in after `prev_block` """
+        if (not isinstance(values, array)):
+            values = array(self.__dtype, values)
+        return super(TypedLinkedList, self)._new_block(values, prev_block)
+
+    def _new_list(self):
+        """ an empty list of the same dtype and capacity """
+        return type(self)(self.__dtype, self.capacity)
+
+    def _blocks(self):
+        """ Iterate through the arrays of values, a block at a time """
+        block = self.head.next
+        while (block is not self.head):
+            yield block.value
+            block = block.next
+
+    def _numpy_blocks(self):
+        """ Iterate through numpy views of the blocks, sharing their memory """
+        for values in self._blocks():
+            yield numpy.frombuffer(values, dtype=values.typecode)
+
+    def _check_numpy(self):
+        if (numpy is None):
+            raise ImportError("{} needs numpy for this".format(type(self)))
+
+    def _check_not_empty(self, name):
+        if (not self.length):
+            raise ValueError("{}() of an empty {}".format(name, type(self)))
+
+    ############################
+    ## Public Methods         ##
+    ############################
+    def to_numpy(self):
+        """ a numpy array of every value, copied a block at a time without
+            boxing any of them
+        """
+        self._check_numpy()
+        out = numpy.empty(self.length, dtype=self.__dtype)
+        i = 0
+        for values in self._numpy_blocks():
+            out[i:i + len(values)] = values
+            i += len(values)
+        return out
+
+    def sum(self):
+        """ the total of every value, block by block, as a python number """
+        if (numpy is not None):
+            return sum(values.sum().item() for values in self._numpy_blocks())
+        return sum(sum(values) for values in self._blocks())
+
+    def min(self):
+        """ the smallest value, block by block """
+        self._check_not_empty("min")
+        if (numpy is not None):
+            return min(values.min().item() for values in self._numpy_blocks())
+        return min(min(values) for values in self._blocks())
+
+    def max(self):
+        """ the largest value, block by block """
+        self._check_not_empty("max")
+        if (numpy is not None):
+            return max(values.max().item() for values in self._numpy_blocks())
+        return max(max(values) for values in self._blocks())
+
+    def mean(self):
+        """ the average value """
+        self._check_not_empty("mean")
+        return self.sum() / float(self.length)
+
+    def argmax(self):
+        """ the index of the first largest value """
+        self._check_not_empty("argmax")
+        best = None
+        best_indx = 0
+        start = 0
+        for values in self._blocks():
+            if (numpy is not None):
+                i = int(numpy.frombuffer(values, dtype=values.typecode).argmax())
+            else:
+                i = values.index(max(values))
+
+            if (best is None or best < values[i]):
+                best = values[i]
+                best_indx = start + i
+            start += len(values)
+        return best_indx
+
+    def apply_ufunc(self, ufunc, *args, **kwargs):
+        """ a new TypedLinkedList of ufunc applied to the values, a block at a time
+
+            ufunc - @type - numpy.ufunc
+                  - @param - called with a block's values, then args and kwargs.
+                             The new list's dtype is that of its results, or
+                             "B" for bools. Results no array typecode can
+                             hold, e.g. complex ones, raise TypeError
+        """
+        self._check_numpy()
+        new_list = None
+        for values in self._numpy_blocks():
+            result = numpy.asarray(ufunc(values, *args, **kwargs))
+            if (new_list is None):
+                new_list = type(self)(_typecode(result.dtype), self.capacity)
+            new_list._append_block(array(new_list.dtype, result.tobytes()))
+
+        if (new_list is None):
+            # no blocks, so find the dtype from the ufunc of no values
+            result = numpy.asarray(ufunc(numpy.empty(0, dtype=self.__dtype), *args, **kwargs))
+            new_list = type(self)(_typecode(result.dtype), self.capacity)
+        return new_list
+
+
+def _typecode(dtype):
+    """ the array typecode storing values of numpy `dtype`. Bools are kept
+        as unsigned bytes, as array has no bool typecode
+    """
+    typecode = "B" if dtype.kind == "b" else dtype.char
+    try:
+        array(typecode)
+    except (TypeError, ValueError):
+        raise TypeError("results of dtype {} can not be stored in a {}".format(dtype, TypedLinkedList))
+    return typecode
@@ -0,0 +1,441 @@
+#!/usr/bin/python
+from .linkedlist import DoubleLinkElement
+
+
+class UnrolledLinkedList(object):
+    """ Implementation of an Unrolled Linked List.
+
+        Each element of the chain is a DoubleLinkElement whose value is a
+        block: a python list of up to `capacity` values. Following a link skips
+        a whole block, so walking and iterating cost a fraction of a
+        LinkedList's, and each value costs one list slot instead of one
+        LinkElement.
+
+        As in LinkedList, the chain starts at a `head` which is always
+        referenced by the final block. Blocks are never left empty.
+
+        Values have no element of their own, so unlike LinkedList, `get`,
+        `pop`, indexing and iteration hand back the values themselves.
+    """
+
+    def __init__(self, capacity=64):
+        """ creates the head, sets length to 0
+
+            capacity - @type - int
+                     - @param - the most values a block holds before it is split
+        """
+        if (not isinstance(capacity, int) or capacity < 2):
+            raise TypeError("capacity must be an {} of at least 2, you passed {}".format(int, capacity))
+
+        self.__head = DoubleLinkElement()
+        self.__head.value = -1
+        self.__length = 0
+        self.__capacity = capacity
+
+        # block and index of its first value, for the last requested index
+        self.__cache_block = self.__head
+        self.__cache_start = 0
+
+    ################
+    ## Properties ##
+    ################
+    @property
+    def head(self):
+        """The root of the list. It is never seen by the end user """
+        return self.__head
+
+    @property
+    def length(self):
+        """ number of values in the list """
+        return self.__length
+
+    @property
+    def capacity(self):
+        """ the most values a block holds """
+        return self.__capacity
+
+    ##############################
+    ## Private / helper methods ##
+    ##############################
+    def _find(self, indx):
+        """ the block holding `indx` and the index of the block's first value.
+
+            Walks block by block from whichever of the head, the tail and
+            the cached block is closest
+        """
+        if (not isinstance(indx, int)):
+            raise TypeError("index must be type {}, you passed {}".format(int, type(indx)))
+
+        elif (indx < 0 or indx >= self.__length):
+            raise IndexError("index out of range")
+
+        block = self.__cache_block
+        start = self.__cache_start
+        if (block is self.head or abs(indx - start) > min(indx, self.__length - indx)):
+            if (indx < self.__length - indx):
+                block = self.head.next
+                start = 0
+            else:
+                block = self.head.prev
+                start = self.__length - len(block.value)
+
+        while (indx >= start + len(block.value)):
+            start += len(block.value)
+            block = block.next
+
+        while (indx < start):
+            block = block.prev
+            start -= len(block.value)
+
+        self.__cache_block = block
+        self.__cache_start = start
+        return block, start
+
+    def _new_block(self, values, prev_block):
+        """ link a new block holding `values` in after `prev_block` """
+        new_block = DoubleLinkElement()
+        new_block.value = values
+        new_block.next = prev_block.next
+        prev_block.next = new_block
+        return new_block
+
+    def _unlink_block(self, block):
+        """ snip `block` out of the chain """
+        block.prev.next = block.next
+        self.__cache_block = self.head
+        self.__cache_start = 0
+
+    def _new_list(self):
+        """ an empty list of the same type and capacity """
+        return type(self)(self.__capacity)
+
+    def _append_block(self, values):
+        """ link a whole block of values on after the final block """
+        if (values):
+            self._new_block(values, self.head.prev)
+            self.__length += len(values)
+
+    def _merge_small(self, block, last):
+        """ from `block` up to `last`, merge each block with the next one when
+            either is under half full and both fit in one
+        """
+        if (block is self.head):
+            block = block.next
+
+        half = self.__capacity // 2
+        while (block is not self.head and block is not last):
+            following = block.next
+            if (following is not self.head and (len(block.value) < half or len(following.value) < half)
+                    and len(block.value) + len(following.value) <= self.__capacity):
+                block.value.extend(following.value)
+                self._unlink_block(following)
+                if (following is last):
+                    return
+            else:
+                block = following
+
+    def _insert_values(self, indx, values):
+        """ insert `values` before the `indx`th value. The block holding it is
+            split there, and the values are linked in between as blocks of
+            their own
+        """
+        if (not values):
+            return
+
+        # the values after indx in its block move into the new blocks
+        values = list(values)
+        prev_block = self.head.prev
+        if (indx < self.__length):
+            prev_block, start = self._find(indx)
+            moved = prev_block.value[indx - start:]
+            del prev_block.value[indx - start:]
+            values.extend(moved)
+            self.__length -= len(moved)
+            if (not prev_block.value):
+                block = prev_block
+                prev_block = block.prev
+                self._unlink_block(block)
+
+        # as few blocks as hold them, filled evenly
+        n = len(values)
+        blocks = (n + self.__capacity - 1) // self.__capacity
+        block = prev_block
+        for i in range(blocks):
+            block = self._new_block(values[i * n // blocks:(i + 1) * n // blocks], block)
+        self.__length += n
+
+        self.__cache_block = self.head
+        self.__cache_start = 0
+        self._merge_small(prev_block, block.next)
+
+    def _walk(self, indx):
+        """ yield (block, offset) for every position from `indx` to the end """
+        if (indx >= self.__length):
+            return
+
+        block, start = self._find(indx)
+        offset = indx - start
+        while (block is not self.head):
+            for i in range(offset, len(block.value)):
+                yield block, i
+            offset = 0
+            block = block.next
+
+    ############################
+    ## Public Methods         ##
+    ############################
+
+    ### Write ###
+    def append(self, value):
+        """ Akin to list's append
+
+            value - @type - any
+                  - @param - added to the final block, or a new one if it is full
+        """
+        tail = self.head.prev
+        if (tail is self.head or len(tail.value) >= self.__capacity):
+            self._new_block([value], tail)
+        else:
+            tail.value.append(value)
+
+        self.__length += 1
+
+    def prepend(self, value):
+        """ Push to the beginning of an UnrolledLinkedList
+
+            value - @type - any
+                  - @param - added to the first block, or a new one if it is full
+        """
+        first = self.head.next
+        if (first is self.head or len(first.value) >= self.__capacity):
+            first = self._new_block([value], self.head)
+        else:
+            first.value.insert(0, value)
+
+        self.__length += 1
+
+        # every block but the first now starts one later
+        if (self.__cache_block is not self.head and self.__cache_block is not first):
+            self.__cache_start += 1
+
+    def pop(self):
+        """ Remove and return the final value in a list """
+        tail = self.head.prev
+        if (tail is self.head):
+            raise IndexError("pop from empty list")
+
+        value = tail.value.pop()
+        if (not tail.value):
+            self._unlink_block(tail)
+
+        self.__length -= 1
+        return value
+
+    def insert(self, indx, value):
+        """ insert a value btwn UnrolledLinkedList[indx - 1] and UnrolledLinkedList[indx].
+            A full block is split in half first
+        """
+        if (indx == self.__length):
+            self.append(value)
+            return
+
+        block, start = self._find(indx)
+        if (len(block.value) >= self.__capacity):
+            half = len(block.value) // 2
+            self._new_block(block.value[half:], block)
+            del block.value[half:]
+
+            if (indx - start >= half):
+                start += half
+                block = block.next
+                self.__cache_block = block
+                self.__cache_start = start
+
+        block.value.insert(indx - start, value)
+        self.__length += 1
+
+    ### Read ###
+    def get(self, indx):
+        """ Same as UnrolledLinkedList[indx]
+
+            indx - @type - int
+                 - @param - value to get. If < 0, get `indx`th value from the end of list
+
+            *Performance* - O(n / capacity), walking a block per hop
+        """
+        if (isinstance(indx, int) and indx < 0):
+            indx = self.__length + indx
+
+        block, start = self._find(indx)
+        return block.value[indx - start]
+
+    ###########################
+    ### Container type methods
+    ### Enables things like len() and iteration
+    ### https://docs.python.org/2/reference/datamodel.html#emulating-container-types
+    ###########################
+    def __iter__(self):
+        """ Iterate through values, a block at a time """
+        block = self.head.next
+        while (block is not self.head):
+            for value in block.value:
+                yield value
+            block = block.next
+
+    def __len__(self):
+        return self.__length
+
+    def _slice_positions(self, slice_k):
+        """ (first index, number of items, step) covered by slice_k, walking forwards """
+        start, stop, step = slice_k.indices(self.__length)
+        if (step > 0):
+            count = max(0, (stop - start + step - 1) // step)
+        else:
+            count = max(0, (start - stop - step - 1) // -step)
+
+        if (step < 0 and count):
+            # walk the same positions forwards
+            start = start + step * (count - 1)
+            step = -step
+        return start, count, step
+
+    def __getitem__(self, key):
+        """ implements self[key] evaluation
+
+            key - @type - int or slice
+                - @param - the nth item you want, or the slice of items you want
+        """
+        if (isinstance(key, slice)):
+            start, count, step = self._slice_positions(key)
+            values = []
+            if (count):
+                for i, (block, offset) in enumerate(self._walk(start)):
+                    if (i % step == 0):
+                        values.append(block.value[offset])
+                        if (len(values) == count):
+                            break
+
+            if (key.step is not None and key.step < 0):
+                values.reverse()
+
+            L = self._new_list()
+            for value in values:
+                L.append(value)
+            return L
+
+        elif (isinstance(key, int)):
+            return self.get(key)
+
+        else:
+            raise TypeError("Type of {} was passed to __getitem__. Only {} and {} are accepted".format(type(key), slice, int))
+
+    def __setitem__(self, key, value):
+        """ supports self[key] assignment.
+
+            key - @type - slice or int
+                - @param - the indices to replace
+
+            value - @type - any or iterable
+                  - @param - the value, or for a slice one value per index
+        """
+        if (isinstance(key, int)):
+            if (key < 0):
+                key = self.__length + key
+            block, start = self._find(key)
+            block.value[key - start] = value
+
+        elif (isinstance(key, slice) and hasattr(value, "__iter__")):
+            values = list(value)
+            start, count, step = self._slice_positions(key)
+            if (len(values) != count and key.step in (None, 1)):
+                # as with list, a plain slice can grow or shrink
+                del self[start:start + count]
+                self._insert_values(start, values)
+                return
+
+            elif (len(values) != count):
+                raise ValueError("attempt to assign sequence of size {} to extended slice of size {}".format(len(values), count))
+
+            if (key.step is not None and key.step < 0):
+                values.reverse()
+
+            j = 0
+            if (count):
+                for i, (block, offset) in enumerate(self._walk(start)):
+                    if (i % step == 0):
+                        block.value[offset] = values[j]
+                        j += 1
+                        if (j == count):
+                            break
+
+        elif (isinstance(key, slice)):
+            raise TypeError("Tried to assign {} to slice of {}. Only iterables accepted".format(type(value), type(self)))
+
+        else:
+            raise TypeError("Type of {} was passed to __setitem__. Only {} and {} are accepted".format(type(key), slice, int))
+
+    def __delitem__(self, key):
+        """ support for `del self[key]`. Blocks that drop under half full are
+            merged with the next block when both fit in one
+
+            key - @type - int or slice
+                - @param - a index or slice of indices to delete
+
+            *Performance* - a slice is deleted from each block it covers in
+                            turn, so only those blocks are walked and merged
+        """
+        if (isinstance(key, slice)):
+            start, count, step = self._slice_positions(key)
+            if (not count):
+                return
+
+            stop = start + (count - 1) * step + 1
+            block, block_start = self._find(start)
+            before = block.prev
+            indx = start
+            while (indx < stop):
+                size = len(block.value)
+                end = min(stop, block_start + size)
+                if (indx < end):
+                    del block.value[indx - block_start:end - block_start:step]
+                    indx += ((end - indx - 1) // step + 1) * step
+                block_start += size
+
+                following = block.next
+                if (not block.value):
+                    self._unlink_block(block)
+                block = following
+
+            self.__length -= count
+            self._merge_small(before, block)
+
+        elif (isinstance(key, int)):
+            if (key < 0):
+                key = self.__length + key
+            block, start = self._find(key)
+            del block.value[key - start]
+            self.__length -= 1
+
+            following = block.next
+            if (not block.value):
+                self._unlink_block(block)
+
+            elif (len(block.value) < self.__capacity // 2 and following is not self.head
+                    and len(block.value) + len(following.value) <= self.__capacity):
+                block.value.extend(following.value)
+                self._unlink_block(following)
+
+        else:
+            raise TypeError("Type of {} was passed to __delitem__. Only {} and {} are accepted".format(type(key), slice, int))
+
+    def __contains__(self, value):
+        """ Is value in self? Searches a block at a time """
+        block = self.head.next
+        while (block is not self.head):
+            if (value in block.value):
+                return True
+            block = block.next
+        return False
+
+    def __repr__(self):
+        return "[" + ", ".join("{}".format(value) for value in self) + "]"
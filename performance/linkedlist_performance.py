@@ -1,6 +1,11 @@
 import random
+import threading
 import time
-from linkedlist.linkedlist import LinkedList
+from functools import partial
+from linkedlist.linkedlist import LinkedList, DoublyLinkedList
+from linkedlist.unrolledlinkedlist import UnrolledLinkedList
+from linkedlist.arenalinkedlist import ArenaLinkedList
+from linkedlist.concurrentlinkedlist import ConcurrentLinkedList
 from plotly.offline import plot
 from plotly.graph_objs import Scatter
 
@@ -14,6 +19,30 @@ class Timer(object):
     def get_elapsed(self):
         return self.stop - self.start
 
+class LockedLinkedList(object):
+    """ a LinkedList behind a single lock, what ConcurrentLinkedList is measured against """
+    def __init__(self):
+        self.list = LinkedList()
+        self.lock = threading.Lock()
+
+    def append(self, value):
+        with self.lock:
+            self.list.append(value)
+
+    def prepend(self, value):
+        with self.lock:
+            self.list.prepend(value)
+
+    def popleft(self):
+        with self.lock:
+            value = self.list.get(0).value
+            del self.list[0]
+            return value
+
+    def get(self, indx):
+        with self.lock:
+            return self.list.get(indx).value
+
 def get_avg(num_list):
     """ get the average of a list of numbers """
     return sum(num_list)/len(num_list)
@@ -24,7 +53,10 @@ def avg_obj(obj):
         ret.append([key, get_avg(obj[key])])
     return ret
 
-def compare_append(arr_len, insert_n, step, num_times, safety=10):
+# the series every compare_* returns, unless it says otherwise
+LIST_LABELS = ("Python List", "Linked List")
+
+def compare_append(arr_len, insert_n, step, num_times, safety=10, list_type=LinkedList):
     LL_time = {}
     NL_time = {}
 
@@ -38,7 +70,7 @@ def compare_append(arr_len, insert_n, step, num_times, safety=10):
             t2 = Timer()
             t2.start_time()
 
-            LL = LinkedList()
+            LL = list_type()
             [LL.prepend(random.random()) for x in range(length) ]
 
             t = Timer()
@@ -64,7 +96,7 @@ def compare_append(arr_len, insert_n, step, num_times, safety=10):
 
     return [NL_time, LL_time]
 
-def compare_prepend(arr_len, step, num_times, safety=10):
+def compare_prepend(arr_len, step, num_times, safety=10, list_type=LinkedList):
     LL_time = {}
     NL_time = {}
 
@@ -77,7 +109,7 @@ def compare_prepend(arr_len, step, num_times, safety=10):
             t2 = Timer()
             t2.start_time()
 
-            LL = LinkedList()
+            LL = list_type()
             [LL.prepend(random.random()) for x in range(length) ]
 
             t = Timer()
@@ -101,7 +133,7 @@ def compare_prepend(arr_len, step, num_times, safety=10):
 
     return [NL_time, LL_time]
 
-def compare_insert(arr_len, insert_n, step, num_times, safety=10):
+def compare_insert(arr_len, insert_n, step, num_times, safety=10, list_type=LinkedList):
     LL_time = {}
     NL_time = {}
 
@@ -116,7 +148,7 @@ def compare_insert(arr_len, insert_n, step, num_times, safety=10):
             t2 = Timer()
             t2.start_time()
 
-            LL = LinkedList()
+            LL = list_type()
             [LL.prepend(random.random()) for x in range(length) ]
 
             t = Timer()
@@ -142,8 +174,47 @@ def compare_insert(arr_len, insert_n, step, num_times, safety=10):
 
     return [NL_time, LL_time]
 
+def compare_insert_many(arr_len, insert_n, step, num_times, safety=10, list_type=LinkedList):
+    LL_time = {}
+    NL_time = {}
+
+    for length in range(1, arr_len, step):
+        LL_time[length] = []
+        NL_time[length] = []
 
-def compare_iteration(arr_len, step, num_times, safety=10):
+        for i in range(num_times):
+            insert_val = [random.random() for x in range(insert_n)]
+            insert_index = [random.randint(0, length) for x in range(insert_n)]
+
+            t2 = Timer()
+            t2.start_time()
+
+            LL = list_type.from_iterable(random.random() for x in range(length))
+
+            t = Timer()
+            t.start_time()
+            LL.insert_many(zip(insert_index, insert_val))
+            t.stop_time()
+            LL_time[length].append(t.get_elapsed())
+
+            NL = []
+            [NL.append(random.random()) for x in range(length) ]
+
+            t = Timer()
+            t.start_time()
+            for i in range(insert_n):
+                NL.insert(insert_index[i], insert_val[i])
+            t.stop_time()
+            NL_time[length].append(t.get_elapsed())
+
+            t2.stop_time()
+            if (t2.get_elapsed() > safety):
+                return [NL_time, LL_time]
+
+    return [NL_time, LL_time]
+
+
+def compare_get(arr_len, get_n, step, num_times, safety=10, list_type=LinkedList):
     LL_time = {}
     NL_time = {}
 
@@ -152,11 +223,117 @@ def compare_iteration(arr_len, step, num_times, safety=10):
         NL_time[length] = []
 
         for i in range(num_times):
+            get_index = [random.randint(-length, length - 1) for x in range(get_n)]
 
             t2 = Timer()
             t2.start_time()
 
-            LL = LinkedList()
+            LL = list_type()
+            [LL.prepend(random.random()) for x in range(length) ]
+
+            t = Timer()
+            t.start_time()
+            for i in range(get_n):
+                LL.get(get_index[i])
+            t.stop_time()
+            LL_time[length].append(t.get_elapsed())
+
+            NL = []
+            [NL.append(random.random()) for x in range(length) ]
+
+            t = Timer()
+            t.start_time()
+            for i in range(get_n):
+                NL[get_index[i]]
+            t.stop_time()
+            NL_time[length].append(t.get_elapsed())
+
+            t2.stop_time()
+            if (t2.get_elapsed() > safety):
+                return [NL_time, LL_time]
+
+    return [NL_time, LL_time]
+
+def compare_build(arr_len, step, num_times, safety=10, list_type=LinkedList):
+    LL_time = {}
+    NL_time = {}
+
+    for length in range(1, arr_len, step):
+        LL_time[length] = []
+        NL_time[length] = []
+
+        for i in range(num_times):
+            build_val = [random.random() for x in range(length)]
+
+            t2 = Timer()
+            t2.start_time()
+
+            t = Timer()
+            t.start_time()
+            LL = list_type.from_iterable(build_val)
+            t.stop_time()
+            LL_time[length].append(t.get_elapsed())
+
+            t = Timer()
+            t.start_time()
+            NL = list(build_val)
+            t.stop_time()
+            NL_time[length].append(t.get_elapsed())
+
+            t2.stop_time()
+            if (t2.get_elapsed() > safety):
+                return [NL_time, LL_time]
+
+    return [NL_time, LL_time]
+
+def compare_sort(arr_len, step, num_times, safety=10, list_type=LinkedList):
+    LL_time = {}
+    NL_time = {}
+
+    for length in range(1, arr_len, step):
+        LL_time[length] = []
+        NL_time[length] = []
+
+        for i in range(num_times):
+            sort_val = [random.random() for x in range(length)]
+
+            t2 = Timer()
+            t2.start_time()
+
+            LL = list_type.from_iterable(sort_val)
+
+            t = Timer()
+            t.start_time()
+            LL.sort()
+            t.stop_time()
+            LL_time[length].append(t.get_elapsed())
+
+            t = Timer()
+            t.start_time()
+            NL = sorted(sort_val)
+            t.stop_time()
+            NL_time[length].append(t.get_elapsed())
+
+            t2.stop_time()
+            if (t2.get_elapsed() > safety):
+                return [NL_time, LL_time]
+
+    return [NL_time, LL_time]
+
+def compare_iteration(arr_len, step, num_times, safety=10, list_type=LinkedList):
+    LL_time = {}
+    NL_time = {}
+
+    for length in range(1, arr_len, step):
+        LL_time[length] = []
+        NL_time[length] = []
+
+        for i in range(num_times):
+
+            t2 = Timer()
+            t2.start_time()
+
+            LL = list_type()
             [LL.prepend(random.random()) for x in range(length) ]
 
             t = Timer()
@@ -182,11 +359,105 @@ def compare_iteration(arr_len, step, num_times, safety=10):
 
     return [NL_time, LL_time]
 
-def graph_results(test, results):
+QUEUE_LABELS = ("no pool", "pool")
+
+def compare_queue(arr_len, ops_n, step, num_times, pool_size=64, safety=10, list_type=LinkedList):
+    """ time ops_n append / del [0] pairs on a queue held at each length,
+        without (results[0]) and with (results[1]) a node pool
+    """
+    LL_time = {}
+    NL_time = {}
 
+    for length in range(1, arr_len, step):
+        LL_time[length] = []
+        NL_time[length] = []
+
+        for i in range(num_times):
+            t2 = Timer()
+            t2.start_time()
+
+            for pool, times in ((0, NL_time), (pool_size, LL_time)):
+                LL = list_type(pool_size=pool)
+                LL.extend(range(length))
+
+                t = Timer()
+                t.start_time()
+                for x in range(ops_n):
+                    LL.append(x)
+                    del LL[0]
+                t.stop_time()
+                times[length].append(t.get_elapsed())
+
+            t2.stop_time()
+            if (t2.get_elapsed() > safety):
+                return [NL_time, LL_time]
+
+    return [NL_time, LL_time]
+
+def run_threads(shared, thread_n, ops_n):
+    """ time thread_n threads each doing ops_n appends, prepends, poplefts
+        and gets near the front of `shared`
+    """
+    def work():
+        for i in range(ops_n):
+            op = i % 4
+            if (op == 0):
+                shared.append(i)
+            elif (op == 1):
+                shared.prepend(i)
+            elif (op == 2):
+                shared.popleft()
+            else:
+                shared.get(i % 32)
+
+    threads = [threading.Thread(target=work) for x in range(thread_n)]
+    t = Timer()
+    t.start_time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    t.stop_time()
+    return t.get_elapsed()
+
+THREAD_LABELS = ("LockedLinkedList", "ConcurrentLinkedList")
+
+def compare_threads(max_threads, ops_n, num_times, prefill=1000, safety=10):
+    """ time a LockedLinkedList (results[0]) and a ConcurrentLinkedList
+        (results[1]) shared by 1 to max_threads threads
+    """
+    LL_time = {}
+    NL_time = {}
+
+    for thread_n in range(1, max_threads + 1):
+        LL_time[thread_n] = []
+        NL_time[thread_n] = []
+
+        for i in range(num_times):
+            t2 = Timer()
+            t2.start_time()
+
+            NL = LockedLinkedList()
+            [NL.append(x) for x in range(prefill)]
+            NL_time[thread_n].append(run_threads(NL, thread_n, ops_n))
+
+            LL = ConcurrentLinkedList()
+            [LL.append(x) for x in range(prefill)]
+            LL_time[thread_n].append(run_threads(LL, thread_n, ops_n))
+
+            t2.stop_time()
+            if (t2.get_elapsed() > safety):
+                return [NL_time, LL_time]
+
+    return [NL_time, LL_time]
+
+def graph_results(test, results, labels=LIST_LABELS):
+    """ plot the averaged results of a compare_* function, naming its two
+        series with `labels`
+    """
     results = {
-        "Python List, {}".format(test) : avg_obj(results[0]),
-        "Linked List, {}".format(test) : avg_obj(results[1])
+        "{}, {}".format(labels[0], test) : avg_obj(results[0]),
+        "{}, {}".format(labels[1], test) : avg_obj(results[1])
     }
 
     graph_lines = []
@@ -224,5 +495,41 @@ if __name__ == "__main__":
     ir = compare_insert(100001, 100, 10000, 10)
     graph_results("insert", ir)
 
+    # ir = compare_insert(100001, 100, 10000, 10, list_type=partial(LinkedList, indexed=True))
+    # graph_results("insert_indexed", ir)
+
+    # ir = compare_insert_many(100001, 100, 10000, 10)
+    # graph_results("insert_many", ir)
+
     # it_r = compare_iteration(100001, 1000, 10)
     # graph_results("iteration", it_r)
+
+    # gr = compare_get(100001, 100, 10000, 10)
+    # graph_results("get", gr)
+    #
+    # gr = compare_get(100001, 100, 10000, 10, list_type=DoublyLinkedList)
+    # graph_results("get_doubly", gr)
+
+    # it_r = compare_iteration(100001, 1000, 10, list_type=UnrolledLinkedList)
+    # graph_results("iteration_unrolled", it_r)
+    #
+    # gr = compare_get(100001, 100, 10000, 10, list_type=UnrolledLinkedList)
+    # graph_results("get_unrolled", gr)
+    #
+    # ir = compare_insert(100001, 100, 10000, 10, list_type=UnrolledLinkedList)
+    # graph_results("insert_unrolled", ir)
+
+    # it_r = compare_iteration(100001, 1000, 10, list_type=ArenaLinkedList)
+    # graph_results("iteration_arena", it_r)
+
+    # br = compare_build(100001, 10000, 10)
+    # graph_results("build", br)
+
+    # sr = compare_sort(10000001, 100000, 1, safety=600)
+    # graph_results("sort", sr)
+
+    # qr = compare_queue(100001, 100000, 10000, 5)
+    # graph_results("queue_pool", qr, QUEUE_LABELS)
+
+    # tr = compare_threads(8, 20000, 5)
+    # graph_results("threads", tr, THREAD_LABELS)
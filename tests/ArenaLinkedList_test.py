@@ -0,0 +1,154 @@
+import sys, os, unittest, random
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
+from linkedlist.arenalinkedlist import ArenaLinkedList
+
+
+class ALL_base(unittest.TestCase):
+    def setUp(self):
+        self.L = ArenaLinkedList()
+        for i in range(10):
+            self.L.append(i)
+
+    def assertConsistent(self, L, model):
+        """ values should match model forwards and backwards """
+        self.assertEqual(list(L), model)
+        self.assertEqual(L.length, len(model))
+        self.assertEqual([L.get(i) for i in range(-1, -len(model) - 1, -1)], model[::-1])
+
+class ALL_init(unittest.TestCase):
+
+    def test_empty(self):
+        L = ArenaLinkedList()
+        self.assertEqual(L.length, 0)
+        self.assertEqual(L.capacity, 0)
+        self.assertEqual(list(L), [])
+
+class ALL_write(ALL_base):
+
+    def test_append(self):
+        self.assertConsistent(self.L, list(range(10)))
+
+    def test_prepend(self):
+        self.L.prepend(-1)
+        self.assertConsistent(self.L, list(range(-1, 10)))
+
+    def test_insert(self):
+        self.L.insert(4, "tester")
+        self.assertConsistent(self.L, [0, 1, 2, 3, "tester"] + list(range(4, 10)))
+
+    def test_insert_IndexError(self):
+        with self.assertRaises(IndexError):
+            self.L.insert(12, "tester")
+
+    def test_pop(self):
+        self.assertEqual([self.L.pop() for i in range(10)], list(reversed(range(10))))
+        self.assertConsistent(self.L, [])
+
+    def test_pop_empty(self):
+        with self.assertRaises(IndexError):
+            ArenaLinkedList().pop()
+
+    def test_free_slots_reused(self):
+        """ slots freed by removals should be used before the arena grows """
+        del self.L[3]
+        self.L.pop()
+        self.L.append("a")
+        self.L.prepend("b")
+        self.assertEqual(self.L.capacity, 10)
+        self.assertConsistent(self.L, ["b", 0, 1, 2, 4, 5, 6, 7, 8, "a"])
+
+    def test_compact(self):
+        """ compacting should keep the values and release free slots """
+        del self.L[::2]
+        self.L.compact()
+        self.assertEqual(self.L.capacity, 5)
+        self.assertConsistent(self.L, [1, 3, 5, 7, 9])
+        self.L.append(11)
+        self.assertConsistent(self.L, [1, 3, 5, 7, 9, 11])
+
+class ALL_read(ALL_base):
+
+    def test_get_IndexError(self):
+        with self.assertRaises(IndexError):
+            self.L.get(10)
+        with self.assertRaises(IndexError):
+            self.L.get(-11)
+
+    def test_contains(self):
+        self.assertTrue(9 in self.L)
+        self.assertFalse(10 in self.L)
+
+    def test_repr(self):
+        self.assertEqual(repr(self.L), repr(list(range(10))))
+
+class ALL_slice(ALL_base):
+
+    def test_getitem_slices(self):
+        """ slicing should match python's list slicing """
+        model = list(range(10))
+        for key in [slice(None), slice(2, 7), slice(1, None, 3), slice(None, None, -1),
+                    slice(8, 1, -2), slice(-3, None), slice(5, 2)]:
+            self.assertEqual(list(self.L[key]), model[key])
+
+    def test_setitem_slice(self):
+        model = list(range(10))
+        self.L[1:8:3] = ["a", "b", "c"]
+        model[1:8:3] = ["a", "b", "c"]
+        self.L[::-4] = ["x", "y", "z"]
+        model[::-4] = ["x", "y", "z"]
+        self.assertConsistent(self.L, model)
+
+    def test_setitem_slice_size(self):
+        with self.assertRaises(ValueError):
+            self.L[::2] = [1]
+
+    def test_setitem_slice_resize(self):
+        """ as with list, a plain slice can be given more or fewer values """
+        model = list(range(10))
+        for key, values in [(slice(1, 3), [9]), (slice(2, 4), list("abcde")), (slice(3, 3), ["y", "z"]),
+                            (slice(None), list(range(7))), (slice(7, None), ["end"]), (slice(0, 2), []),
+                            (slice(20, None), ["x"]), (slice(-2, 1), ["w"])]:
+            self.L[key] = values
+            model[key] = values
+            self.assertConsistent(self.L, model)
+
+    def test_delitem_slice(self):
+        model = list(range(10))
+        del self.L[8:1:-3]
+        del model[8:1:-3]
+        self.assertConsistent(self.L, model)
+
+class ALL_mixed(ALL_base):
+
+    def test_mixed(self):
+        """ links should stay consistent through any mix of mutations """
+        rand = random.Random(4)
+        model = list(range(10))
+        for i in range(600):
+            op = rand.randint(0, 5)
+            if (op == 0):
+                self.L.append(i)
+                model.append(i)
+            elif (op == 1):
+                self.L.prepend(i)
+                model.insert(0, i)
+            elif (op == 2):
+                indx = rand.randint(0, len(model))
+                self.L.insert(indx, i)
+                model.insert(indx, i)
+            elif (op == 3 and model):
+                self.assertEqual(self.L.pop(), model.pop())
+            elif (op == 4 and model):
+                indx = rand.randint(0, len(model) - 1)
+                del self.L[indx]
+                del model[indx]
+            elif (op == 5 and model):
+                indx = rand.randint(-len(model), len(model) - 1)
+                self.assertEqual(self.L[indx], model[indx])
+        self.assertConsistent(self.L, model)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
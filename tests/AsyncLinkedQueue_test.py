@@ -0,0 +1,182 @@
+import sys, os, unittest
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
+from linkedlist.linkedlist import LinkedList
+
+if (sys.version_info >= (3, 5)):
+    import asyncio
+    from linkedlist.asyncqueue import AsyncLinkedQueue
+
+
+@unittest.skipIf(sys.version_info < (3, 5), "AsyncLinkedQueue needs async/await")
+class ALQ_base(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.Q = AsyncLinkedQueue()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_loop(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def values(self, batch):
+        return [el.value for el in batch]
+
+class ALQ_nowait(ALQ_base):
+
+    def test_fifo(self):
+        for i in range(5):
+            self.Q.put_nowait(i)
+        self.assertEqual(self.Q.qsize(), 5)
+        self.assertEqual([self.Q.get_nowait() for i in range(5)], list(range(5)))
+        self.assertTrue(self.Q.empty())
+
+    def test_empty(self):
+        with self.assertRaises(asyncio.QueueEmpty):
+            self.Q.get_nowait()
+
+    def test_full(self):
+        Q = AsyncLinkedQueue(maxsize=2)
+        Q.put_nowait(1)
+        Q.put_nowait(2)
+        self.assertTrue(Q.full())
+        with self.assertRaises(asyncio.QueueFull):
+            Q.put_nowait(3)
+
+    def test_pool(self):
+        """ items taken by get should leave their LinkElements for later puts """
+        Q = AsyncLinkedQueue(pool_size=4)
+        for i in range(3):
+            for j in range(4):
+                Q.put_nowait(j)
+            self.assertEqual(Q.pooled, 0)
+            self.assertEqual([Q.get_nowait() for j in range(4)], list(range(4)))
+            self.assertEqual(Q.pooled, 4)
+
+    def test_maxsize_typeError(self):
+        with self.assertRaises(TypeError):
+            AsyncLinkedQueue(maxsize="a")
+
+class ALQ_await(ALQ_base):
+
+    def test_get_waits(self):
+        """ a getter on an empty queue should be woken by a put """
+        getter = self.loop.create_task(self.Q.get())
+        self.run_loop(asyncio.sleep(0))
+        self.assertFalse(getter.done())
+        self.run_loop(self.Q.put("a"))
+        self.assertEqual(self.run_loop(getter), "a")
+
+    def test_put_waits(self):
+        """ a putter on a full queue should wait for a get """
+        Q = AsyncLinkedQueue(maxsize=1)
+        Q.put_nowait(1)
+        putter = self.loop.create_task(Q.put(2))
+        self.run_loop(asyncio.sleep(0))
+        self.assertFalse(putter.done())
+        self.assertEqual(self.run_loop(Q.get()), 1)
+        self.run_loop(putter)
+        self.assertEqual(Q.get_nowait(), 2)
+
+    def test_cancelled_getter(self):
+        """ a cancelled getter should not swallow the next item """
+        first = self.loop.create_task(self.Q.get())
+        second = self.loop.create_task(self.Q.get())
+        self.run_loop(asyncio.sleep(0))
+        first.cancel()
+        self.Q.put_nowait("a")
+        self.assertEqual(self.run_loop(second), "a")
+        self.assertTrue(first.cancelled())
+
+    def test_producers_consumers(self):
+        """ many putters on a small queue and as many getters should hand
+            over every item exactly once
+        """
+        Q = AsyncLinkedQueue(maxsize=8)
+        items = [(n, i) for n in range(3) for i in range(100)]
+        getters = [self.loop.create_task(Q.get()) for item in items]
+        putters = [self.loop.create_task(Q.put(item)) for item in items]
+        got = self.run_loop(asyncio.gather(*getters))
+        self.run_loop(asyncio.gather(*putters))
+        self.assertEqual(sorted(got), items)
+
+        joiner = self.loop.create_task(Q.join())
+        Q.task_done(len(items) - 1)
+        self.run_loop(asyncio.sleep(0))
+        self.assertFalse(joiner.done())
+        Q.task_done()
+        self.run_loop(joiner)
+        self.assertEqual(Q.unfinished, 0)
+
+class ALQ_batch(ALQ_base):
+
+    def test_get_batch(self):
+        for i in range(10):
+            self.Q.put_nowait(i)
+        batch = self.run_loop(self.Q.get_batch(4))
+        self.assertIsInstance(batch, LinkedList)
+        self.assertEqual(self.values(batch), [0, 1, 2, 3])
+        self.assertEqual(self.values(self.run_loop(self.Q.get_batch(100))), list(range(4, 10)))
+        self.assertTrue(self.Q.empty())
+        self.Q.put_nowait("a")
+        self.assertEqual(self.Q.get_nowait(), "a")
+
+    def test_get_batch_keeps_pool(self):
+        """ the pool should stay with the queue, not leave with a batch """
+        Q = AsyncLinkedQueue(pool_size=4)
+        for i in range(8):
+            Q.put_nowait(i)
+        self.assertEqual([Q.get_nowait() for i in range(4)], list(range(4)))
+        self.assertEqual(self.values(self.run_loop(Q.get_batch(2))), [4, 5])
+        self.assertEqual(Q.pooled, 4)
+        self.assertEqual(self.values(self.run_loop(Q.get_batch(5))), [6, 7])
+        self.assertEqual(Q.pooled, 4)
+        for i in range(4):
+            Q.put_nowait(i)
+        self.assertEqual(Q.pooled, 0)
+
+    def test_get_batch_waits(self):
+        """ an empty queue's batch should wait for the first item """
+        getter = self.loop.create_task(self.Q.get_batch(5))
+        self.run_loop(asyncio.sleep(0))
+        self.assertFalse(getter.done())
+        self.Q.put_nowait("a")
+        self.Q.put_nowait("b")
+        self.assertEqual(self.values(self.run_loop(getter)), ["a", "b"])
+
+    def test_get_batch_timeout(self):
+        batch = self.run_loop(self.Q.get_batch(5, timeout=0.01))
+        self.assertEqual(batch.length, 0)
+        self.Q.put_nowait("a")
+        self.assertEqual(self.Q.get_nowait(), "a")
+
+    def test_get_batch_wakes_putters(self):
+        Q = AsyncLinkedQueue(maxsize=2)
+        Q.put_nowait(1)
+        Q.put_nowait(2)
+        putters = [self.loop.create_task(Q.put(i)) for i in range(3, 5)]
+        self.run_loop(asyncio.sleep(0))
+        self.assertEqual(self.values(self.run_loop(Q.get_batch(2))), [1, 2])
+        self.run_loop(asyncio.gather(*putters))
+        self.assertEqual([Q.get_nowait(), Q.get_nowait()], [3, 4])
+
+    def test_get_batch_ValueError(self):
+        with self.assertRaises(ValueError):
+            self.run_loop(self.Q.get_batch(0))
+
+    def test_task_done(self):
+        for i in range(3):
+            self.Q.put_nowait(i)
+        joiner = self.loop.create_task(self.Q.join())
+        batch = self.run_loop(self.Q.get_batch(3))
+        self.run_loop(asyncio.sleep(0))
+        self.assertFalse(joiner.done())
+        self.Q.task_done(batch.length)
+        self.run_loop(joiner)
+        with self.assertRaises(ValueError):
+            self.Q.task_done()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,284 @@
+import sys, os, unittest, random, threading, time
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
+from linkedlist.concurrentlinkedlist import ConcurrentLinkedList
+
+
+class CLL_base(unittest.TestCase):
+    def setUp(self):
+        self.L = ConcurrentLinkedList()
+        for i in range(10):
+            self.L.append(i)
+
+    def assertConsistent(self, L, model):
+        """ values should match model by iteration and by index """
+        self.assertEqual(list(L), model)
+        self.assertEqual(L.length, len(model))
+        self.assertEqual([L.get(i) for i in range(len(model))], model)
+        self.assertEqual([L[i] for i in range(-1, -len(model) - 1, -1)], model[::-1])
+
+    def run_threads(self, target, n):
+        threads = [threading.Thread(target=target, args=(i,)) for i in range(n)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+class CLL_single_thread(CLL_base):
+
+    def test_empty(self):
+        L = ConcurrentLinkedList()
+        self.assertConsistent(L, [])
+        with self.assertRaises(IndexError):
+            L.pop()
+        with self.assertRaises(IndexError):
+            L.popleft()
+        with self.assertRaises(IndexError):
+            L.get(0)
+
+    def test_append(self):
+        self.assertConsistent(self.L, list(range(10)))
+
+    def test_prepend(self):
+        self.L.prepend(-1)
+        self.L.prepend(-2)
+        self.assertConsistent(self.L, list(range(-2, 10)))
+
+    def test_prepend_then_append(self):
+        """ a value prepended to an empty list is also its tail """
+        L = ConcurrentLinkedList()
+        L.prepend("a")
+        L.append("b")
+        self.assertConsistent(L, ["a", "b"])
+
+    def test_popleft(self):
+        self.assertEqual([self.L.popleft() for i in range(10)], list(range(10)))
+        self.assertConsistent(self.L, [])
+        self.L.append("a")
+        self.assertConsistent(self.L, ["a"])
+
+    def test_pop(self):
+        self.assertEqual([self.L.pop() for i in range(10)], list(reversed(range(10))))
+        self.assertConsistent(self.L, [])
+        self.L.append("a")
+        self.assertConsistent(self.L, ["a"])
+
+    def test_insert(self):
+        model = list(range(10))
+        for indx in [0, 4, 12, -1]:
+            self.L.insert(indx, "tester")
+            model.insert(indx, "tester")
+        self.assertConsistent(self.L, model)
+
+    def test_insert_at_end(self):
+        """ inserting after the final item should move the tail """
+        self.L.insert(10, "tester")
+        self.L.append("a")
+        self.assertConsistent(self.L, list(range(10)) + ["tester", "a"])
+
+    def test_insert_IndexError(self):
+        with self.assertRaises(IndexError):
+            self.L.insert(12, "tester")
+
+    def test_delitem(self):
+        model = list(range(10))
+        for indx in [0, 4, -1]:
+            del self.L[indx]
+            del model[indx]
+        self.L.append("a")
+        model.append("a")
+        self.assertConsistent(self.L, model)
+
+    def test_setitem(self):
+        self.L[3] = "a"
+        self.L[-1] = "b"
+        self.assertConsistent(self.L, [0, 1, 2, "a", 4, 5, 6, 7, 8, "b"])
+        with self.assertRaises(IndexError):
+            self.L[10] = "c"
+
+    def test_remove(self):
+        self.L.remove(9)
+        self.L.remove(0)
+        self.L.append("a")
+        self.assertConsistent(self.L, list(range(1, 9)) + ["a"])
+        with self.assertRaises(ValueError):
+            self.L.remove(0)
+
+    def test_contains(self):
+        self.assertIn(3, self.L)
+        self.assertNotIn(10, self.L)
+        self.assertEqual(self.L.count(3), 1)
+
+    def test_typeError(self):
+        with self.assertRaises(TypeError):
+            self.L["a"]
+
+    def test_cache_invalidated(self):
+        """ a walk should not trust its cached node once the chain has changed """
+        self.assertEqual(self.L[5], 5)
+        self.L.popleft()
+        self.assertEqual(self.L[5], 6)
+        self.L.insert(2, "a")
+        self.assertEqual(self.L[6], 6)
+        self.assertEqual(self.L[7], 7)
+
+    def test_random(self):
+        rand = random.Random(11)
+        model = list(range(10))
+        for i in range(500):
+            op = rand.randint(0, 6)
+            if (op == 0):
+                self.L.append(i)
+                model.append(i)
+            elif (op == 1):
+                self.L.prepend(i)
+                model.insert(0, i)
+            elif (op == 2):
+                indx = rand.randint(0, len(model))
+                self.L.insert(indx, i)
+                model.insert(indx, i)
+            elif (op == 3 and model):
+                self.assertEqual(self.L.popleft(), model.pop(0))
+            elif (op == 4 and model):
+                self.assertEqual(self.L.pop(), model.pop())
+            elif (op == 5 and model):
+                indx = rand.randint(-len(model), len(model) - 1)
+                del self.L[indx]
+                del model[indx]
+            elif (op == 6 and model):
+                indx = rand.randint(-len(model), len(model) - 1)
+                self.assertEqual(self.L[indx], model[indx])
+            self.assertEqual(self.L.length, len(model))
+        self.assertConsistent(self.L, model)
+
+class CLL_threads(CLL_base):
+
+    def test_producers_consumers(self):
+        """ every appended and prepended value should be popped exactly once """
+        L = ConcurrentLinkedList()
+        popped = [[] for i in range(4)]
+
+        def produce(n):
+            for i in range(2000):
+                if (i % 2):
+                    L.append((n, i))
+                else:
+                    L.prepend((n, i))
+
+        def consume(n):
+            misses = 0
+            while (misses < 1000):
+                try:
+                    popped[n].append(L.popleft())
+                    misses = 0
+                except IndexError:
+                    misses += 1
+
+        producers = [threading.Thread(target=produce, args=(i,)) for i in range(4)]
+        consumers = [threading.Thread(target=consume, args=(i,)) for i in range(4)]
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers + consumers:
+            thread.join()
+
+        values = [v for chunk in popped for v in chunk] + list(L)
+        self.assertEqual(sorted(values), sorted((n, i) for n in range(4) for i in range(2000)))
+        self.assertEqual(L.length, len(list(L)))
+
+    def test_reads_during_writes(self):
+        """ every get should see the list as it was at some point during the
+            call, even as the indices shift under the readers' cached walks
+        """
+        L = ConcurrentLinkedList()
+        for i in range(100):
+            L.append(i)
+        # the list is always [first, first + 1, ..., 99], so get(i) - i is
+        # `first` at some moment of the call. prepends only ever lower it, and
+        # `first` is published after each one
+        first = [0]
+        errors = []
+        writing = threading.Event()
+        writing.set()
+
+        def write():
+            for value in range(-1, -501, -1):
+                L.prepend(value)
+                first[0] = value
+                time.sleep(0)
+            writing.clear()
+
+        def read(n):
+            while (writing.is_set()):
+                for indx in range(n, 60):
+                    before = first[0]
+                    value = L.get(indx)
+                    if (value - indx > before):
+                        errors.append((indx, value, before))
+
+        # switch threads as often as possible, so walks get interrupted
+        interval = getattr(sys, "getswitchinterval", lambda: None)()
+        if (interval is not None):
+            sys.setswitchinterval(1e-6)
+        try:
+            writer = threading.Thread(target=write)
+            readers = [threading.Thread(target=read, args=(n,)) for n in range(3)]
+            for thread in [writer] + readers:
+                thread.start()
+            for thread in [writer] + readers:
+                thread.join()
+        finally:
+            if (interval is not None):
+                sys.setswitchinterval(interval)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(list(L), list(range(-500, 100)))
+
+    def test_positional(self):
+        """ threads inserting and deleting at positions should leave a
+            consistent chain holding exactly what was not deleted
+        """
+        L = ConcurrentLinkedList()
+        for i in range(100):
+            L.append(("start", i))
+        added = [[] for i in range(4)]
+        deleted = [[] for i in range(4)]
+
+        def work(n):
+            rand = random.Random(n)
+            for i in range(500):
+                op = rand.randint(0, 3)
+                if (op == 0):
+                    try:
+                        L.insert(rand.randint(0, 50), (n, i))
+                        added[n].append((n, i))
+                    except IndexError:
+                        pass
+                elif (op == 1):
+                    L.append((n, i))
+                    added[n].append((n, i))
+                elif (op == 2):
+                    try:
+                        deleted[n].append(L.popleft())
+                    except IndexError:
+                        pass
+                else:
+                    try:
+                        L.get(rand.randint(0, 50))
+                    except IndexError:
+                        pass
+
+        self.run_threads(work, 4)
+
+        remaining = list(L)
+        self.assertEqual(L.length, len(remaining))
+        self.assertEqual([L[i] for i in range(len(remaining))], remaining)
+        L.append("end")
+        self.assertEqual(L[-1], "end")
+        added = [("start", i) for i in range(100)] + [v for chunk in added for v in chunk]
+        self.assertEqual(sorted(remaining + [v for chunk in deleted for v in chunk], key=repr),
+                         sorted(added, key=repr))
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+import sys, os, unittest, random
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
+from linkedlist.linkedlist import LinkedList, DoublyLinkedList, DoubleLinkElement, LinkElement
+
+
+class DoubleLinkEl_base(unittest.TestCase):
+    def setUp(self):
+        self.el = DoubleLinkElement()
+        self.el2 = DoubleLinkElement()
+
+class DoubleLinkEl_links(DoubleLinkEl_base):
+
+    def test_prev_init(self):
+        """ a new element should link back to itself """
+        self.assertIs(self.el.prev, self.el)
+
+    def test_next_sets_prev(self):
+        """ setting next should point the next element's prev back """
+        self.el.next = self.el2
+        self.assertIs(self.el.next, self.el2)
+        self.assertIs(self.el2.prev, self.el)
+
+    def test_next_typecheck(self):
+        """ a DoubleLinkElement can only link to another DoubleLinkElement """
+        with self.assertRaises(TypeError):
+            self.el.next = LinkElement()
+
+    def test_prev_typecheck(self):
+        with self.assertRaises(TypeError):
+            self.el.prev = 9
+
+
+class DLL_base(unittest.TestCase):
+    def setUp(self):
+        self.L = DoublyLinkedList()
+        for i in range(10):
+            self.L.append(i)
+
+    def assertConsistent(self, L, model):
+        """ forward and backward walks should both match model """
+        nodes = list(L)
+        self.assertEqual([el.value for el in nodes], model)
+        self.assertEqual(L.length, len(model))
+
+        prev_node = L.head
+        for el in nodes:
+            self.assertIs(el.prev, prev_node)
+            prev_node = el
+        self.assertIs(L.head.prev, prev_node)
+        self.assertIs(L.tail, prev_node)
+
+class DLL_init(unittest.TestCase):
+
+    def test_empty(self):
+        """ an empty list's head links to itself both ways """
+        L = DoublyLinkedList()
+        self.assertIsInstance(L.head, DoubleLinkElement)
+        self.assertIs(L.head.next, L.head)
+        self.assertIs(L.head.prev, L.head)
+        self.assertIs(L.tail, L.head)
+        self.assertEqual(L.length, 0)
+
+class DLL_get_nth_el(DLL_base):
+
+    def test_getNth_all(self):
+        """ every index should be reachable whatever the cache was left at """
+        nodes = list(self.L)
+        for indx in [9, 0, 5, 4, 8, 1, 7, 2, 6, 3, -1]:
+            self.assertIs(self.L._get_nth_el(indx), nodes[indx] if indx >= 0 else self.L.head)
+
+    def test_getNth_from_tail(self):
+        """ indices near the end should be walked to backwards from the tail """
+        self.L._get_nth_el(0)
+        self.assertIs(self.L._get_nth_el(8), self.L.tail.prev)
+        self.assertEqual(self.L.cache_index, 8)
+
+    def test_getNth_indexError(self):
+        with self.assertRaises(IndexError):
+            self.L._get_nth_el(10)
+
+    def test_get_negative(self):
+        """ get(-1) should be the tail """
+        self.assertIs(self.L.get(-1), self.L.tail)
+        self.assertIs(self.L.get(-2), self.L.tail.prev)
+
+class DLL_mutations(DLL_base):
+
+    def test_append(self):
+        self.L.append(10)
+        self.assertConsistent(self.L, list(range(11)))
+
+    def test_prepend(self):
+        self.L.prepend(-1)
+        self.assertConsistent(self.L, list(range(-1, 10)))
+
+    def test_pop(self):
+        """ pop should return the last element and relink the tail """
+        self.assertEqual(self.L.pop().value, 9)
+        self.assertConsistent(self.L, list(range(9)))
+
+    def test_insert(self):
+        self.L.insert(3, "tester")
+        model = list(range(10))
+        model.insert(3, "tester")
+        self.assertConsistent(self.L, model)
+
+    def test_indexed(self):
+        """ an indexed DoublyLinkedList should find every index """
+        L = DoublyLinkedList(indexed=True)
+        for i in range(100):
+            L.append(i)
+        L.insert(50, "tester")
+        del L[10]
+        model = list(range(100))
+        model.insert(50, "tester")
+        del model[10]
+        for i in range(len(model)):
+            self.assertEqual(L.get(i).value, model[i])
+        self.assertConsistent(L, model)
+
+    def test_from_iterable(self):
+        """ bulk building should set every back link """
+        L = DoublyLinkedList.from_iterable(range(20))
+        self.assertIsInstance(L, DoublyLinkedList)
+        L.extend(range(20, 25))
+        self.assertConsistent(L, list(range(25)))
+
+    def test_insert_many(self):
+        self.L.insert_many([(3, "a"), (0, "b"), (10, "c")])
+        self.assertConsistent(self.L, ["b", 0, 1, 2, "a", 3, 4, 5, 6, 7, 8, 9, "c"])
+
+    def test_delete_many(self):
+        self.L.delete_many([0, 4, 9])
+        self.assertConsistent(self.L, [1, 2, 3, 5, 6, 7, 8])
+
+    def test_remove_if(self):
+        self.L.remove_if(lambda v: v % 2)
+        self.assertConsistent(self.L, [0, 2, 4, 6, 8])
+
+    def test_slices(self):
+        """ slicing should keep back links on both lists """
+        model = list(range(10))
+        self.assertConsistent(self.L[8:1:-2], model[8:1:-2])
+        self.L[2:4] = ["a", "b", "c"]
+        model[2:4] = ["a", "b", "c"]
+        self.assertConsistent(self.L, model)
+        del self.L[::3]
+        del model[::3]
+        self.assertConsistent(self.L, model)
+
+    def test_sort(self):
+        """ sorting should relink the back links too """
+        model = [3, 9, 0, 4, 4, 1]
+        L = DoublyLinkedList.from_iterable(model)
+        L.sort()
+        self.assertConsistent(L, sorted(model))
+        L.sort(reverse=True)
+        self.assertConsistent(L, sorted(model, reverse=True))
+
+    def test_splice(self):
+        """ a spliced chain should link back to the list's tail """
+        other = DoublyLinkedList.from_iterable(range(10, 15))
+        self.L.splice(other)
+        self.assertConsistent(self.L, list(range(15)))
+        self.assertConsistent(other, [])
+
+    def test_splice_typeError(self):
+        """ a singly linked chain has no back links to splice in """
+        with self.assertRaises(TypeError):
+            self.L.splice(LinkedList.from_iterable(range(3)))
+
+    def test_split_at(self):
+        new = self.L.split_at(4)
+        self.assertConsistent(self.L, list(range(4)))
+        self.assertConsistent(new, list(range(4, 10)))
+
+    def test_partition(self):
+        even = self.L.partition(lambda v: v % 2 == 0)
+        self.assertConsistent(self.L, [1, 3, 5, 7, 9])
+        self.assertConsistent(even, [0, 2, 4, 6, 8])
+
+    def test_mul(self):
+        self.assertConsistent(self.L * 2, list(range(10)) * 2)
+
+    def test_add(self):
+        """ adding two DoublyLinkedLists gives a DoublyLinkedList """
+        L = self.L + self.L
+        self.assertIsInstance(L, DoublyLinkedList)
+        self.assertConsistent(L, list(range(10)) * 2)
+
+    def test_mixed(self):
+        """ back links should stay correct through any mix of mutations """
+        rand = random.Random(3)
+        model = list(range(10))
+        for i in range(500):
+            op = rand.randint(0, 5)
+            if (op == 0):
+                self.L.append(i)
+                model.append(i)
+            elif (op == 1):
+                self.L.prepend(i)
+                model.insert(0, i)
+            elif (op == 2):
+                indx = rand.randint(0, len(model))
+                self.L.insert(indx, i)
+                model.insert(indx, i)
+            elif (op == 3 and model):
+                self.assertEqual(self.L.pop().value, model.pop())
+            elif (op == 4 and model):
+                indx = rand.randint(0, len(model) - 1)
+                del self.L[indx]
+                del model[indx]
+            elif (op == 5 and model):
+                indx = rand.randint(-len(model), len(model) - 1)
+                self.assertEqual(self.L.get(indx).value, model[indx])
+            self.assertConsistent(self.L, model)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
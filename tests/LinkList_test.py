@@ -1,7 +1,12 @@
-import sys, os, unittest
+import sys, os, unittest, random
 if os.getcwd() not in sys.path:
     sys.path.append(os.getcwd())
-from linkedlist.linkedlist import LinkedList, LinkElement
+from linkedlist.linkedlist import LinkedList, DoublyLinkedList, LinkElement
+from operator import add
+try:
+    import concurrent.futures
+except ImportError:
+    concurrent = None
 
 
 class LinkList_base(unittest.TestCase):
@@ -253,6 +258,1113 @@ class LL_pop(LinkedList_w_els):
         self.assertEqual(self.L.length, old_length - 1)
         self.assertIs(self.L.head, self.L.head.next.next)
 
+class LL_tail(LinkList_base):
+
+    def assertConsistent(self, L, model):
+        """ the chain should hold model's values, close on head, and tail / the
+            tail's predecessor should be the last two nodes
+        """
+        nodes = list(L)
+        self.assertEqual([el.value for el in nodes], model)
+        self.assertEqual(L.length, len(model))
+        if (nodes):
+            self.assertIs(L.tail, nodes[-1])
+            self.assertIs(L._tail_predecessor(), nodes[-2] if len(nodes) > 1 else L.head)
+        else:
+            self.assertIs(L.tail, L.head)
+        self.assertIs(L.tail.next, L.head)
+
+    def test_tail_empty(self):
+        """ the tail of an empty list is the head """
+        self.assertIs(self.L.tail, self.L.head)
+
+    def test_tail_append(self):
+        """ appending should move the tail to the new element """
+        self.L.append(1)
+        self.L.append(2)
+        self.assertEqual(self.L.tail.value, 2)
+        self.assertIs(self.L.tail, self.L.head.next.next)
+
+    def test_tail_prepend_empty(self):
+        """ prepending to an empty list makes the new element the tail """
+        self.L.prepend(1)
+        self.assertIs(self.L.tail, self.L.head.next)
+
+    def test_tail_pop(self):
+        """ popping should hand the tail back to the predecessor """
+        for i in range(5):
+            self.L.append(i)
+        for i in reversed(range(5)):
+            self.assertEqual(self.L.pop().value, i)
+            self.assertConsistent(self.L, list(range(i)))
+
+    def test_tail_pop_after_prepends(self):
+        """ a list built by prepending should pop in reverse order """
+        for i in range(5):
+            self.L.prepend(i)
+        self.assertEqual([self.L.pop().value for i in range(5)], [0, 1, 2, 3, 4])
+        self.assertConsistent(self.L, [])
+
+    def test_tail_delitem_last(self):
+        """ deleting the last index should move the tail back one """
+        for i in range(3):
+            self.L.append(i)
+        del self.L[2]
+        self.assertConsistent(self.L, [0, 1])
+
+    def test_tail_setitem_last(self):
+        """ replacing the last element should make the new element the tail """
+        for i in range(3):
+            self.L.append(i)
+        self.L[2] = "last"
+        self.assertConsistent(self.L, [0, 1, "last"])
+
+    def test_trail_rebuilt_once(self):
+        """ after a relink drops the trail, the next pop should find it again
+            and the pops and appends after that should not walk
+        """
+        L = LinkedList.from_iterable(range(100), fingers=0)
+        del L[2:4]
+        rebuilds = []
+        rebuild = L._rebuild_trail
+        def counted():
+            rebuilds.append(L.length)
+            rebuild()
+        L._rebuild_trail = counted
+
+        model = [0, 1] + list(range(4, 100))
+        for i in range(20):
+            self.assertEqual(L.pop().value, model.pop())
+        for i in range(5):
+            L.append(i)
+            model.append(i)
+            self.assertEqual(L.pop().value, model.pop())
+        self.assertEqual(rebuilds, [98])
+        self.assertConsistent(L, model)
+
+    def test_trail_kept_through_middle_edits(self):
+        """ inserts and deletes in the middle should keep the tail's
+            predecessor, so pops between them never walk
+        """
+        L = LinkedList.from_iterable(range(100), fingers=0)
+        L._rebuild_trail = None # any walk to the tail would fail
+        model = list(range(100))
+        rand = random.Random(8)
+        for i in range(60):
+            indx = rand.randint(0, len(model) - 1)
+            if (i % 2):
+                L.insert(indx, "a")
+                model.insert(indx, "a")
+            else:
+                del L[indx]
+                del model[indx]
+            self.assertEqual(L.pop().value, model.pop())
+        for indx in [len(model) - 1, len(model) - 2, 0]:
+            L.insert(indx, "b")
+            model.insert(indx, "b")
+            self.assertEqual(L.pop().value, model.pop())
+            del L[indx - 1]
+            del model[indx - 1]
+            self.assertEqual(L.pop().value, model.pop())
+        self.assertConsistent(L, model)
+
+    def test_tail_manual_links(self):
+        """ setting length after relinking by hand should make the tail be found again """
+        new_el = LinkElement()
+        new_el.value = 7
+        new_el.next = self.L.head
+        self.L.head.next = new_el
+        self.L.length = 1
+        self.assertIs(self.L.tail, new_el)
+
+    def test_tail_mixed(self):
+        """ the tail should stay correct through any mix of mutations """
+        rand = random.Random(7)
+        model = []
+        for i in range(500):
+            op = rand.randint(0, 5)
+            if (op == 0):
+                self.L.append(i)
+                model.append(i)
+            elif (op == 1):
+                self.L.prepend(i)
+                model.insert(0, i)
+            elif (op == 2):
+                indx = rand.randint(0, len(model))
+                self.L.insert(indx, i)
+                model.insert(indx, i)
+            elif (op == 3 and model):
+                self.assertEqual(self.L.pop().value, model.pop())
+            elif (op == 4 and model):
+                indx = rand.randint(0, len(model) - 1)
+                del self.L[indx]
+                del model[indx]
+            elif (op == 5 and model):
+                indx = rand.randint(0, len(model) - 1)
+                self.L[indx] = i
+                model[indx] = i
+            self.assertConsistent(self.L, model)
+
+
+class LL_fingers(LinkList_base):
+    def setUp(self):
+        self.L = LinkedList(fingers=2)
+        for i in range(1000):
+            self.L.append(i)
+
+    def test_fingers_typeError(self):
+        """ the finger count should be a non-negative int """
+        with self.assertRaises(TypeError):
+            LinkedList(fingers=-1)
+
+    def test_fingers_hot_regions(self):
+        """ alternating between two regions should reuse a finger for each """
+        self.L.get(10)
+        self.L.get(900)
+        hits = self.L.cache_hits
+        misses = self.L.cache_misses
+        for i in range(10):
+            self.assertEqual(self.L.get(11 + i).value, 11 + i)
+            self.assertEqual(self.L.get(901 + i).value, 901 + i)
+        self.assertEqual(self.L.cache_hits, hits + 20)
+        self.assertEqual(self.L.cache_misses, misses)
+
+    def test_fingers_lru(self):
+        """ a third region should evict the least recently used finger """
+        self.L.get(10)
+        self.L.get(500)
+        self.L.get(900)
+        misses = self.L.cache_misses
+        self.L.get(5) # the finger at 10 was evicted, so this walks from the head
+        self.assertEqual(self.L.cache_misses, misses + 1)
+        self.L.get(600)
+        self.assertEqual(self.L.cache_misses, misses + 1)
+
+    def test_fingers_cacheNode(self):
+        """ cache_node and cache_index should be the most recently used finger """
+        el = self.L.get(400)
+        self.assertIs(self.L.cache_node, el)
+        self.assertEqual(self.L.cache_index, 400)
+
+    def test_fingers_shift_insert(self):
+        """ inserting before a finger should move the finger's index up """
+        el = self.L.get(500)
+        self.L.insert(3, "tester")
+        self.assertIs(self.L.get(501), el)
+
+    def test_fingers_shift_pop(self):
+        """ removing a fingered node should drop the finger """
+        self.L.get(500)
+        del self.L[500]
+        del self.L[3]
+        self.assertEqual(self.L.get(500).value, 502)
+
+    def test_fingers_disabled(self):
+        """ with no fingers every lookup walks from the head """
+        L = LinkedList(fingers=0)
+        for i in range(10):
+            L.append(i)
+        L.get(5)
+        L.get(6)
+        self.assertEqual(L.cache_hits, 0)
+        self.assertEqual(L.cache_index, -1)
+
+    def test_fingers_mixed(self):
+        """ lookups should stay correct through any mix of mutations """
+        rand = random.Random(11)
+        model = list(range(1000))
+        for i in range(300):
+            op = rand.randint(0, 3)
+            indx = rand.randint(0, len(model) - 1)
+            if (op == 0):
+                self.L.insert(indx, i)
+                model.insert(indx, i)
+            elif (op == 1):
+                del self.L[indx]
+                del model[indx]
+            else:
+                self.assertEqual(self.L.get(indx).value, model[indx])
+        self.assertEqual([el.value for el in self.L], model)
+
+
+class LL_indexed(LinkList_base):
+    def setUp(self):
+        self.L = LinkedList(indexed=True)
+        for i in range(300):
+            self.L.append(i)
+
+    def assertWidths(self, L):
+        """ every express link should span exactly the hops it claims """
+        index = L._skip_index()
+        position = dict((id(el), i) for i, el in enumerate(L))
+        position[id(L.head)] = -1
+        self.assertEqual(index.length, L.length)
+        for l in range(index.level):
+            tower = index.head_tower
+            while (tower.right[l] is not None):
+                self.assertEqual(position[id(tower.right[l].node)] - position[id(tower.node)], tower.width[l])
+                tower = tower.right[l]
+            self.assertEqual(L.length - position[id(tower.node)], tower.width[l])
+
+    def test_indexed_flag(self):
+        self.assertTrue(self.L.indexed)
+        self.assertFalse(LinkedList().indexed)
+
+    def test_indexed_get(self):
+        """ every index should be found through the express links """
+        nodes = list(self.L)
+        for i in range(len(nodes)):
+            self.assertIs(self.L.get(i), nodes[i])
+        self.assertWidths(self.L)
+
+    def test_indexed_enable_later(self):
+        """ turning the index on for a filled list should build it """
+        L = LinkedList()
+        for i in range(50):
+            L.prepend(i)
+        L.indexed = True
+        self.assertEqual(L.get(10).value, 39)
+        self.assertWidths(L)
+
+    def test_indexed_manual_links(self):
+        """ relinking by hand and setting length should rebuild the index """
+        new_el = LinkElement()
+        new_el.value = "tester"
+        new_el.next = self.L.head.next
+        self.L.head.next = new_el
+        self.L.length = 301
+        self.assertEqual(self.L.get(1).value, 0)
+        self.assertWidths(self.L)
+
+    def test_indexed_mixed(self):
+        """ widths should stay correct through any mix of mutations """
+        rand = random.Random(5)
+        model = list(range(300))
+        for i in range(400):
+            op = rand.randint(0, 4)
+            indx = rand.randint(0, len(model) - 1)
+            if (op == 0):
+                self.L.insert(indx, i)
+                model.insert(indx, i)
+            elif (op == 1):
+                del self.L[indx]
+                del model[indx]
+            elif (op == 2):
+                self.L.append(i)
+                model.append(i)
+            elif (op == 3):
+                self.assertEqual(self.L.pop().value, model.pop())
+            else:
+                self.assertEqual(self.L.get(indx).value, model[indx])
+        self.assertEqual([el.value for el in self.L], model)
+        self.assertWidths(self.L)
+
+
+class LL_value_indexed(LinkList_base):
+    def setUp(self):
+        self.L = LinkedList(value_indexed=True)
+        for i in range(50):
+            self.L.append(i % 10)
+
+    def assertValueIndex(self, L):
+        """ the buckets should hold exactly the elements with each value """
+        index = L._value_index()
+        expected = {}
+        for el in L:
+            expected.setdefault(el.value, set()).add(id(el))
+        self.assertEqual(dict((v, set(b)) for v, b in index.buckets.items()), expected)
+
+    def test_value_indexed_flag(self):
+        self.assertTrue(self.L.value_indexed)
+        self.assertFalse(LinkedList().value_indexed)
+        self.L.value_indexed = False
+        self.assertFalse(self.L.value_indexed)
+        self.assertTrue(3 in self.L)
+
+    def test_values_changed(self):
+        """ after a value is set on an element directly, values_changed should
+            bring the index back in line
+        """
+        V = LinkedList.from_iterable([1, 2, 3], value_indexed=True)
+        self.assertTrue(2 in V)
+        V.get(1).value = 7
+        V.values_changed()
+        self.assertTrue(7 in V)
+        self.assertFalse(2 in V)
+        self.assertEqual(V.index(7), 1)
+        self.assertValueIndex(V)
+
+    def test_value_indexed_lookups(self):
+        self.assertTrue(9 in self.L)
+        self.assertFalse(10 in self.L)
+        self.assertEqual(self.L.count(3), 5)
+        self.assertEqual(self.L.count(10), 0)
+        self.assertIs(self.L.find(3), self.L.get(3))
+        self.assertIsNone(self.L.find(10))
+        self.assertEqual(self.L.index(4), 4)
+        with self.assertRaises(ValueError):
+            self.L.index(10)
+
+    def test_value_indexed_unique(self):
+        """ a value held once is found straight from its bucket """
+        self.L.insert(20, "tester")
+        self.assertIs(self.L.find("tester"), self.L.get(20))
+        self.assertEqual(self.L.index("tester"), 20)
+
+    def test_value_indexed_unhashable(self):
+        """ unhashable values fall back to scanning """
+        self.L.append([1, 2])
+        self.assertTrue([1, 2] in self.L)
+        self.assertEqual(self.L.count([1, 2]), 1)
+        self.assertEqual(self.L.index([1, 2]), 50)
+        self.assertIs(self.L.find([1, 2]), self.L.tail)
+        self.assertEqual(self.L.count(3), 5)
+        self.assertFalse(10 in self.L)
+        self.L.pop()
+        self.assertEqual(self.L._value_index().unhashable, 0)
+
+    def test_value_indexed_setitem(self):
+        self.L[0] = "a"
+        self.L[1:4] = ["b", "c"]
+        self.L[::10] = ["x"] * 5
+        self.L[5:5] = ["d", "e"]
+        model = [i % 10 for i in range(50)]
+        model[0] = "a"
+        model[1:4] = ["b", "c"]
+        model[::10] = ["x"] * 5
+        model[5:5] = ["d", "e"]
+        for value in ["x", "a", 1, 2, "d"]:
+            self.assertEqual(self.L.count(value), model.count(value))
+        self.assertValueIndex(self.L)
+
+    def test_value_indexed_bulk(self):
+        """ the bulk paths should keep the buckets up to date """
+        self.L.extend([10, 11])
+        self.L.insert_many([(0, 12), (5, 12)])
+        self.L.delete_many([1, 2, 3])
+        self.L.remove_if(lambda v: v == 9)
+        del self.L[::7]
+        self.assertFalse(9 in self.L)
+        self.assertEqual(self.L.count(12), 1)
+        self.assertValueIndex(self.L)
+
+    def test_value_indexed_manual_links(self):
+        """ relinking by hand and setting length should rebuild the index """
+        new_el = LinkElement()
+        new_el.value = "tester"
+        new_el.next = self.L.head.next
+        self.L.head.next = new_el
+        self.L.length = 51
+        self.assertTrue("tester" in self.L)
+        self.assertValueIndex(self.L)
+
+    def test_value_indexed_mixed(self):
+        rand = random.Random(8)
+        model = [el.value for el in self.L]
+        for i in range(400):
+            op = rand.randint(0, 4)
+            indx = rand.randint(0, max(0, len(model) - 1))
+            value = rand.randint(0, 15)
+            if (not model or op == 0):
+                self.L.insert(indx, value)
+                model.insert(indx, value)
+            elif (op == 1):
+                del self.L[indx]
+                del model[indx]
+            elif (op == 2):
+                self.L[indx] = value
+                model[indx] = value
+            elif (op == 3):
+                self.assertEqual(self.L.pop().value, model.pop())
+            else:
+                self.assertEqual(value in self.L, value in model)
+                self.assertEqual(self.L.count(value), model.count(value))
+        self.assertEqual([el.value for el in self.L], model)
+        self.assertValueIndex(self.L)
+
+
+class LL_from_iterable(LinkList_base):
+
+    def test_from_iterable_list(self):
+        L = LinkedList.from_iterable([1, 2, 3])
+        self.assertEqual([el.value for el in L], [1, 2, 3])
+        self.assertEqual(L.length, 3)
+        self.assertIs(L.tail.next, L.head)
+
+    def test_from_iterable_generator(self):
+        """ a generator should be consumed in a single pass """
+        L = LinkedList.from_iterable(i * i for i in range(5))
+        self.assertEqual([el.value for el in L], [0, 1, 4, 9, 16])
+        self.assertEqual(L.tail.value, 16)
+
+    def test_from_iterable_empty(self):
+        L = LinkedList.from_iterable([])
+        self.assertEqual(L.length, 0)
+        self.assertIs(L.head.next, L.head)
+
+    def test_from_iterable_kwargs(self):
+        """ constructor options should be passed through """
+        L = LinkedList.from_iterable(range(100), indexed=True)
+        self.assertTrue(L.indexed)
+        self.assertEqual(L.get(57).value, 57)
+
+    def test_from_iterable_linkedlist(self):
+        """ building from a LinkedList copies its values, not its elements """
+        L = LinkedList.from_iterable(LinkedList.from_iterable("abc"))
+        self.assertEqual([el.value for el in L], ["a", "b", "c"])
+
+class LL_extend(LinkedList_w_els):
+
+    def test_extend(self):
+        """ extending should link the values after the last element """
+        self.L.extend([9, 10])
+        self.assertEqual([el.value for el in self.L], [7, 8, 9, 10])
+        self.assertEqual(self.L.length, 4)
+        self.assertIs(self.L.tail.next, self.L.head)
+
+    def test_extend_then_pop(self):
+        """ the tail and its predecessor should be known after extending """
+        self.L.extend(range(5))
+        self.assertEqual([self.L.pop().value for i in range(7)], [4, 3, 2, 1, 0, 8, 7])
+        self.assertEqual(self.L.length, 0)
+
+    def test_extend_self(self):
+        self.L.extend(self.L)
+        self.assertEqual([el.value for el in self.L], [7, 8, 7, 8])
+
+    def test_extend_raises(self):
+        """ an iterable failing part way should leave the values it gave linked """
+        def values():
+            yield 1
+            yield 2
+            raise ValueError()
+
+        with self.assertRaises(ValueError):
+            self.L.extend(values())
+        self.assertEqual([el.value for el in self.L], [7, 8, 1, 2])
+        self.assertEqual(self.L.length, 4)
+        self.assertIs(self.L.tail.next, self.L.head)
+
+    def test_extend_fingers(self):
+        """ remembered positions should still be right after extending """
+        L = LinkedList.from_iterable(range(10))
+        L.get(5)
+        L.extend(range(10, 20))
+        self.assertEqual([L.get(i).value for i in range(20)], list(range(20)))
+
+
+class LL_insert_many(LinkList_base):
+    def setUp(self):
+        self.L = LinkedList.from_iterable(range(10))
+
+    def test_insert_many(self):
+        """ every value should land before the element originally at its index """
+        self.L.insert_many([(5, "e"), (0, "a"), (10, "z"), (5, "f"), (3, "c")])
+        self.assertEqual([el.value for el in self.L],
+                         ["a", 0, 1, 2, "c", 3, 4, "e", "f", 5, 6, 7, 8, 9, "z"])
+        self.assertEqual(self.L.length, 15)
+        self.assertEqual(self.L.tail.value, "z")
+        self.assertIs(self.L.tail.next, self.L.head)
+
+    def test_insert_many_keeps_tail(self):
+        """ the tail should be known afterwards, whether values went at the end or not """
+        for pairs, model in [([(2, "b"), (10, "z")], [0, 1, "b"] + list(range(2, 10)) + ["z"]),
+                             ([(2, "b"), (9, "y")], [0, 1, "b"] + list(range(2, 9)) + ["y", 9])]:
+            L = LinkedList.from_iterable(range(10), fingers=0)
+            L.insert_many(pairs)
+            L._rebuild_trail = None # any walk to the tail would fail
+            self.assertEqual(L.tail.value, model[-1])
+            L.append("a")
+            self.assertEqual([el.value for el in L], model + ["a"])
+
+    def test_insert_many_negative(self):
+        """ negative indices count from the end of the original list """
+        self.L.insert_many([(-1, "x"), (-10, "y")])
+        self.assertEqual([el.value for el in self.L], ["y"] + list(range(9)) + ["x", 9])
+
+    def test_insert_many_empty(self):
+        self.L.insert_many([])
+        self.assertEqual([el.value for el in self.L], list(range(10)))
+
+    def test_insert_many_IndexError(self):
+        """ a bad index should raise before anything is inserted """
+        with self.assertRaises(IndexError):
+            self.L.insert_many([(2, "a"), (11, "b")])
+        self.assertEqual([el.value for el in self.L], list(range(10)))
+
+    def test_insert_many_random(self):
+        """ should match inserting one at a time from the back """
+        rand = random.Random(2)
+        pairs = [(rand.randint(0, 10), i) for i in range(50)]
+        model = list(range(10))
+        for indx, value in sorted(enumerate(pairs), key=lambda p: (-p[1][0], -p[0])):
+            model.insert(value[0], value[1])
+        self.L.insert_many(pairs)
+        self.assertEqual([el.value for el in self.L], model)
+        self.assertEqual([self.L.get(i).value for i in range(len(model))], model)
+        self.assertEqual(self.L.pop().value, model[-1])
+
+
+class LL_delete_many(LinkList_base):
+    def setUp(self):
+        self.L = LinkedList.from_iterable(range(10))
+
+    def test_delete_many(self):
+        """ every listed index of the original list should be removed """
+        self.assertEqual(self.L.delete_many([7, 0, 3, 9]), 4)
+        self.assertEqual([el.value for el in self.L], [1, 2, 4, 5, 6, 8])
+        self.assertEqual(self.L.length, 6)
+        self.assertIs(self.L.tail.next, self.L.head)
+        self.assertEqual(self.L.pop().value, 8)
+
+    def test_delete_many_repeats_negative(self):
+        """ repeats and negative indices should name the same element """
+        self.assertEqual(self.L.delete_many([-1, 9, 2, -8]), 2)
+        self.assertEqual([el.value for el in self.L], [0, 1, 3, 4, 5, 6, 7, 8])
+
+    def test_delete_many_IndexError(self):
+        """ a bad index should raise before anything is deleted """
+        with self.assertRaises(IndexError):
+            self.L.delete_many([1, 10])
+        self.assertEqual(self.L.length, 10)
+
+    def test_delete_many_fingers(self):
+        """ fingers should be moved past the deleted elements """
+        L = LinkedList.from_iterable(range(100), fingers=3)
+        L.get(20)
+        L.get(50)
+        L.get(90)
+        L.delete_many(range(0, 100, 2))
+        self.assertEqual([L.get(i).value for i in range(50)], list(range(1, 100, 2)))
+
+    def test_delete_many_indexed(self):
+        L = LinkedList.from_iterable(range(100), indexed=True)
+        L.delete_many(range(0, 100, 3))
+        self.assertEqual([L.get(i).value for i in range(L.length)], [i for i in range(100) if i % 3])
+
+    def test_delete_many_keeps_tail(self):
+        """ the tail should be known afterwards, whether it was deleted or not """
+        for indices, model in [([3, 9], [0, 1, 2, 4, 5, 6, 7, 8]), ([3, 5], [0, 1, 2, 4, 6, 7, 8, 9])]:
+            L = LinkedList.from_iterable(range(10), fingers=0)
+            L.delete_many(indices)
+            L._rebuild_trail = None # any walk to the tail would fail
+            self.assertEqual(L.tail.value, model[-1])
+            L.append("a")
+            self.assertEqual([el.value for el in L], model + ["a"])
+
+class LL_delitem(LinkList_base):
+
+    def test_delitem_single(self):
+        L = LinkedList.from_iterable(range(5))
+        del L[1]
+        del L[-1]
+        self.assertEqual([el.value for el in L], [0, 2, 3])
+
+    def test_delitem_typeError(self):
+        with self.assertRaises(TypeError):
+            del self.L["a"]
+
+class LL_remove_if(LinkList_base):
+    def setUp(self):
+        self.L = LinkedList.from_iterable(range(10))
+
+    def test_remove_if(self):
+        self.assertEqual(self.L.remove_if(lambda v: v % 3 == 0), 4)
+        self.assertEqual([el.value for el in self.L], [1, 2, 4, 5, 7, 8])
+        self.assertEqual(self.L.length, 6)
+        self.assertEqual(self.L.tail.value, 8)
+        self.assertIs(self.L.tail.next, self.L.head)
+
+    def test_remove_if_all(self):
+        self.assertEqual(self.L.remove_if(lambda v: True), 10)
+        self.assertEqual(self.L.length, 0)
+        self.assertIs(self.L.head.next, self.L.head)
+
+    def test_remove_if_raises(self):
+        """ a predicate raising part way should keep what it already removed """
+        def predicate(v):
+            if (v == 5):
+                raise ValueError()
+            return v % 2 == 0
+
+        with self.assertRaises(ValueError):
+            self.L.remove_if(predicate)
+        self.assertEqual([el.value for el in self.L], [1, 3, 5, 6, 7, 8, 9])
+        self.assertEqual(self.L.length, 7)
+
+    def test_remove_if_fingers(self):
+        self.L.get(7)
+        self.L.remove_if(lambda v: v < 4)
+        self.assertEqual([self.L.get(i).value for i in range(6)], [4, 5, 6, 7, 8, 9])
+
+    def test_remove_if_keeps_tail(self):
+        """ the last element kept should be known as the tail afterwards """
+        L = LinkedList.from_iterable(range(10), fingers=0)
+        L.remove_if(lambda v: v > 6 or v == 2)
+        L._rebuild_trail = None # any walk to the tail would fail
+        self.assertEqual(L.tail.value, 6)
+        L.append("a")
+        self.assertEqual([el.value for el in L], [0, 1, 3, 4, 5, 6, "a"])
+
+
+class LL_slices(LinkList_base):
+    def setUp(self):
+        self.model = list(range(12))
+        self.L = LinkedList.from_iterable(self.model)
+        self.slices = [slice(None), slice(2, 7), slice(1, None, 3), slice(None, 5),
+                       slice(None, None, -1), slice(8, 1, -2), slice(-3, None),
+                       slice(-9, -2, 2), slice(5, 2), slice(20, 30), slice(None, None, -5)]
+
+    def assertModel(self, L, model):
+        self.assertEqual([el.value for el in L], model)
+        self.assertEqual(L.length, len(model))
+        self.assertIs(L.tail.next, L.head)
+        self.assertEqual([L.get(i).value for i in range(len(model))], model)
+
+    def test_getitem_slices(self):
+        """ slicing should match python's list slicing """
+        for key in self.slices:
+            self.assertModel(self.L[key], self.model[key])
+            self.assertModel(self.L, self.model)
+
+    def test_getitem_slice_type(self):
+        self.assertIsInstance(self.L[1:3], LinkedList)
+
+    def test_setitem_extended(self):
+        """ an extended slice takes one value per index, written in place """
+        el = self.L.get(1)
+        for key in self.slices:
+            count = len(self.model[key])
+            if (key.step in (None, 1)):
+                continue
+            values = ["v{}".format(i) for i in range(count)]
+            self.L[key] = values
+            self.model[key] = values
+            self.assertModel(self.L, self.model)
+        self.assertIs(self.L.get(1), el)
+
+    def test_setitem_extended_size(self):
+        with self.assertRaises(ValueError):
+            self.L[::2] = [1, 2]
+
+    def test_setitem_plain_resize(self):
+        """ a plain slice can be replaced by more or fewer values """
+        for key, values in [(slice(2, 5), ["a"]), (slice(0, 1), ["b", "c", "d"]),
+                            (slice(4, 4), ["e", "f"]), (slice(-2, None), []),
+                            (slice(None), list(range(3))), (slice(3, None), ["g"])]:
+            self.L[key] = values
+            self.model[key] = values
+            self.assertModel(self.L, self.model)
+
+    def test_setitem_single(self):
+        self.L[3] = "a"
+        self.L[-1] = "b"
+        self.model[3] = "a"
+        self.model[-1] = "b"
+        self.assertModel(self.L, self.model)
+
+    def test_setitem_from_self(self):
+        self.L[::2] = self.L[1::2]
+        self.model[::2] = self.model[1::2]
+        self.assertModel(self.L, self.model)
+
+    def test_delitem_slices(self):
+        """ deleting a slice should match python's list """
+        for key in self.slices:
+            L = LinkedList.from_iterable(self.model)
+            L.get(6)
+            model = list(self.model)
+            del L[key]
+            del model[key]
+            self.assertModel(L, model)
+
+    def test_slices_random(self):
+        rand = random.Random(8)
+        for i in range(200):
+            start = rand.randint(-15, 15)
+            stop = rand.randint(-15, 15)
+            step = rand.choice([None, 1, 2, 3, -1, -2, -4])
+            key = slice(start, stop, step)
+            self.assertModel(self.L[key], self.model[key])
+
+            L = LinkedList.from_iterable(self.model)
+            model = list(self.model)
+            del L[key]
+            del model[key]
+            self.assertModel(L, model)
+
+
+class LL_sort(LinkList_base):
+
+    def assertSorted(self, L, model):
+        self.assertEqual([el.value for el in L], model)
+        self.assertEqual(L.length, len(model))
+        self.assertIs(L.tail.next, L.head)
+
+    def test_sort(self):
+        rand = random.Random(4)
+        for length in [0, 1, 2, 3, 10, 257]:
+            model = [rand.randint(0, 50) for i in range(length)]
+            L = LinkedList.from_iterable(model)
+            L.sort()
+            self.assertSorted(L, sorted(model))
+
+    def test_sort_keeps_tail(self):
+        """ the last node of the merge should be known as the tail afterwards """
+        for reverse in [False, True]:
+            for model in [[], [2], [3, 1, 2, 5, 4]]:
+                L = LinkedList.from_iterable(model, fingers=0)
+                L.sort(reverse=reverse)
+                L._rebuild_trail = None # any walk to the tail would fail
+                L.append("a")
+                self.assertEqual([el.value for el in L], sorted(model, reverse=reverse) + ["a"])
+                self.assertEqual(L.tail.value, "a")
+
+    def test_sort_relinks(self):
+        """ the same LinkElements should be reused """
+        L = LinkedList.from_iterable([3, 1, 2])
+        nodes = dict((el.value, el) for el in L)
+        L.sort()
+        for el in L:
+            self.assertIs(el, nodes[el.value])
+
+    def test_sort_stable(self):
+        rand = random.Random(6)
+        model = [(rand.randint(0, 5), i) for i in range(200)]
+        L = LinkedList.from_iterable(model)
+        L.sort(key=lambda v: v[0])
+        self.assertSorted(L, sorted(model, key=lambda v: v[0]))
+
+        L = LinkedList.from_iterable(model)
+        L.sort(key=lambda v: v[0], reverse=True)
+        self.assertSorted(L, sorted(model, key=lambda v: v[0], reverse=True))
+
+    def test_sort_key_once(self):
+        calls = []
+        def key(v):
+            calls.append(v)
+            return -v
+        L = LinkedList.from_iterable(range(30))
+        L.sort(key=key)
+        self.assertEqual(sorted(calls), list(range(30)))
+        self.assertSorted(L, list(reversed(range(30))))
+
+    def test_sort_positions(self):
+        """ fingers and the tail should be found again after sorting """
+        L = LinkedList.from_iterable([5, 4, 3, 2, 1])
+        L.get(3)
+        L.sort()
+        self.assertEqual(L.get(3).value, 4)
+        self.assertEqual(L.tail.value, 5)
+        L.append(6)
+        self.assertEqual(L.pop().value, 6)
+
+    def test_sort_raises(self):
+        """ an uncomparable value should leave every element in the list """
+        model = [3, 1, None, "a", 2, 0, "b"]
+        L = LinkedList.from_iterable(model)
+        try:
+            L.sort()
+        except TypeError:
+            self.assertEqual(sorted([el.value for el in L], key=repr), sorted(model, key=repr))
+            self.assertEqual(L.length, len(model))
+            self.assertIs(L.tail.next, L.head)
+
+
+class LL_splice(LinkList_base):
+    def setUp(self):
+        self.L = LinkedList.from_iterable(range(5))
+        self.other = LinkedList.from_iterable(range(5, 9))
+
+    def test_splice(self):
+        """ other's own LinkElements should end the list, other left empty """
+        nodes = list(self.other)
+        self.L.splice(self.other)
+        self.assertEqual([el.value for el in self.L], list(range(9)))
+        self.assertEqual(self.L.length, 9)
+        self.assertIs(self.L.get(5), nodes[0])
+        self.assertIs(self.L.tail, nodes[-1])
+        self.assertIs(self.L.tail.next, self.L.head)
+        self.assertEqual(self.other.length, 0)
+        self.assertEqual(list(self.other), [])
+        self.assertIs(self.other.head.next, self.other.head)
+
+    def test_splice_then_use(self):
+        """ both lists should keep working after a splice """
+        self.L.get(3)
+        self.L.splice(self.other)
+        self.L.append(9)
+        self.assertEqual(self.L.get(3).value, 3)
+        self.assertEqual(self.L.pop().value, 9)
+        self.assertEqual(self.L.pop().value, 8)
+        self.other.append("a")
+        self.assertEqual([el.value for el in self.other], ["a"])
+
+    def test_splice_empty(self):
+        self.L.splice(LinkedList())
+        self.assertEqual(self.L.length, 5)
+        L = LinkedList()
+        L.splice(self.L)
+        self.assertEqual([el.value for el in L], list(range(5)))
+
+    def test_splice_self(self):
+        with self.assertRaises(ValueError):
+            self.L.splice(self.L)
+
+    def test_splice_typeError(self):
+        with self.assertRaises(TypeError):
+            self.L.splice([1, 2])
+
+    def test_iadd(self):
+        """ += should extend in place with copies """
+        L = self.L
+        L += self.other
+        self.assertIs(L, self.L)
+        self.assertEqual([el.value for el in L], list(range(9)))
+        self.assertEqual(self.other.length, 4)
+        L += [9]
+        self.assertEqual(L.tail.value, 9)
+
+    def test_mul(self):
+        self.assertEqual([el.value for el in self.other * 3], list(range(5, 9)) * 3)
+        self.assertEqual((self.other * 3).length, 12)
+        self.assertEqual(list(self.other * 0), [])
+        with self.assertRaises(TypeError):
+            self.other * "a"
+
+    def test_copies_keep_options(self):
+        """ +, * and slices should make lists with the same options """
+        L = LinkedList.from_iterable(range(6), fingers=2, indexed=True, fingerprinted=True, pool_size=4)
+        for copy in [L * 2, L + L, L[1:4], L[::-2]]:
+            self.assertEqual(copy._options(), L._options())
+        self.assertEqual([el.value for el in L + L], list(range(6)) * 2)
+        self.assertEqual([(L * 2).get(i).value for i in range(12)], list(range(6)) * 2)
+
+
+class LL_split(LinkList_base):
+    def setUp(self):
+        self.L = LinkedList.from_iterable(range(10))
+
+    def assertClosed(self, L, model):
+        self.assertEqual([el.value for el in L], model)
+        self.assertEqual(L.length, len(model))
+        self.assertIs(L.tail.next, L.head)
+        for i in range(len(model)):
+            self.assertEqual(L.get(i).value, model[i])
+
+    def test_split_at(self):
+        """ the moved elements are the same LinkElements """
+        nodes = list(self.L)
+        new = self.L.split_at(6)
+        self.assertIsInstance(new, LinkedList)
+        self.assertIs(new.get(0), nodes[6])
+        self.assertClosed(self.L, list(range(6)))
+        self.assertClosed(new, list(range(6, 10)))
+
+    def test_split_at_ends(self):
+        new = self.L.split_at(10)
+        self.assertClosed(new, [])
+        self.assertClosed(self.L, list(range(10)))
+        new = self.L.split_at(0)
+        self.assertClosed(new, list(range(10)))
+        self.assertClosed(self.L, [])
+
+    def test_split_at_negative(self):
+        new = self.L.split_at(-3)
+        self.assertClosed(new, [7, 8, 9])
+        self.assertClosed(self.L, list(range(7)))
+
+    def test_split_at_IndexError(self):
+        with self.assertRaises(IndexError):
+            self.L.split_at(11)
+        with self.assertRaises(TypeError):
+            self.L.split_at("a")
+
+    def test_split_at_positions(self):
+        """ fingers past the cut are dropped, both tails are known """
+        self.L.get(2)
+        self.L.get(8)
+        new = self.L.split_at(5)
+        self.assertTrue(self.L.cache_index < 5)
+        self.assertIs(self.L.cache_node, list(self.L)[self.L.cache_index])
+        self.L.append("a")
+        new.append("b")
+        self.assertEqual(self.L.pop().value, "a")
+        self.assertEqual(self.L.pop().value, 4)
+        self.assertEqual(new.pop().value, "b")
+        self.assertEqual(new.pop().value, 9)
+
+    def test_split_at_options(self):
+        L = LinkedList.from_iterable(range(10), indexed=True, value_indexed=True)
+        new = L.split_at(4)
+        self.assertTrue(new.indexed and new.value_indexed)
+        self.assertFalse(2 in new)
+        self.assertTrue(5 in new)
+        self.assertFalse(5 in L)
+        self.assertEqual(new.get(3).value, 7)
+
+    def test_partition(self):
+        nodes = list(self.L)
+        odd = self.L.partition(lambda v: v % 2)
+        self.assertClosed(odd, [1, 3, 5, 7, 9])
+        self.assertClosed(self.L, [0, 2, 4, 6, 8])
+        self.assertIs(odd.get(0), nodes[1])
+
+    def test_partition_tails(self):
+        """ both lists should append and pop after a partition """
+        big = self.L.partition(lambda v: v > 6)
+        self.L.append("a")
+        big.append("b")
+        self.assertClosed(self.L, list(range(7)) + ["a"])
+        self.assertClosed(big, [7, 8, 9, "b"])
+
+    def test_partition_none(self):
+        self.assertClosed(self.L.partition(lambda v: False), [])
+        self.assertClosed(self.L.partition(lambda v: True), list(range(10)))
+        self.assertClosed(self.L, [])
+
+    def test_partition_raises(self):
+        """ elements moved before predicate raised stay moved, both lists closed """
+        def predicate(v):
+            if (v == 5):
+                raise RuntimeError()
+            return v % 2
+
+        with self.assertRaises(RuntimeError):
+            self.L.partition(predicate)
+        self.assertClosed(self.L, [0, 2, 4, 5, 6, 7, 8, 9])
+
+
+class LL_comparisons(LinkList_base):
+
+    def make(self, values, **kwargs):
+        return LinkedList.from_iterable(values, **kwargs)
+
+    def test_compare_like_list(self):
+        """ every operator should agree with list's """
+        cases = [[], [1], [1, 2], [1, 3], [2], [1, 2, 3], [0, 9, 9]]
+        for a in cases:
+            for b in cases:
+                A, B = self.make(a), self.make(b)
+                self.assertEqual(A == B, a == b)
+                self.assertEqual(A != B, a != b)
+                self.assertEqual(A < B, a < b)
+                self.assertEqual(A <= B, a <= b)
+                self.assertEqual(A > B, a > b)
+                self.assertEqual(A >= B, a >= b)
+
+    def test_compare_subclass(self):
+        """ any two LinkedLists compare by value """
+        D = DoublyLinkedList.from_iterable([1, 2])
+        self.assertTrue(self.make([1, 2]) == D)
+        self.assertTrue(D == self.make([1, 2]))
+        self.assertTrue(D < self.make([1, 3]))
+
+    def test_compare_diffType(self):
+        """ other types are unequal, and ordered by type name without recursing """
+        L = self.make([1])
+        self.assertFalse(L == [1])
+        self.assertTrue(L != [1])
+        self.assertEqual(L < [1], str(type(L)) < str(type([1])))
+        self.assertEqual(L > [1], str(type(L)) > str(type([1])))
+
+    def test_eq_length(self):
+        """ lists of different lengths should not be walked """
+        compared = []
+        class Value(object):
+            def __eq__(self, other):
+                compared.append(other)
+                return True
+        self.assertFalse(self.make([Value()]) == self.make([Value(), Value()]))
+        self.assertEqual(compared, [])
+
+class LL_fingerprint(LinkList_base):
+
+    def assertFresh(self, L):
+        """ the incrementally kept fingerprint matches one built from scratch """
+        fresh = LinkedList.from_iterable([el.value for el in L], fingerprinted=True)
+        fresh._fingerprint()
+        self.assertEqual(L.fingerprint, fresh.fingerprint)
+
+    def test_fingerprint_flag(self):
+        L = LinkedList(fingerprinted=True)
+        self.assertTrue(L.fingerprinted)
+        self.assertIsNone(LinkedList().fingerprint)
+        L.fingerprinted = False
+        self.assertIsNone(L.fingerprint)
+
+    def test_fingerprint_order(self):
+        A = LinkedList.from_iterable([1, 2, 3], fingerprinted=True)
+        B = LinkedList.from_iterable([3, 2, 1], fingerprinted=True)
+        C = LinkedList.from_iterable([1, 2, 3], fingerprinted=True)
+        self.assertNotEqual(A.fingerprint, B.fingerprint)
+        self.assertEqual(A.fingerprint, C.fingerprint)
+        self.assertTrue(A == C)
+        self.assertFalse(A == B)
+
+    def test_values_changed(self):
+        """ after a value is set on an element directly, values_changed should
+            keep == right
+        """
+        L = LinkedList.from_iterable([1, 2, 3], fingerprinted=True)
+        L.fingerprint
+        L[0].value = 9
+        L.values_changed()
+        self.assertTrue(L == LinkedList.from_iterable([9, 2, 3], fingerprinted=True))
+        self.assertFresh(L)
+
+    def test_fingerprint_short_circuit(self):
+        """ unequal fingerprints should decide without comparing values """
+        compared = []
+        class Value(object):
+            def __init__(self, n):
+                self.n = n
+            def __hash__(self):
+                return self.n
+            def __eq__(self, other):
+                compared.append(other)
+                return self.n == other.n
+        A = LinkedList.from_iterable([Value(1), Value(2)], fingerprinted=True)
+        B = LinkedList.from_iterable([Value(1), Value(3)], fingerprinted=True)
+        self.assertFalse(A == B)
+        self.assertEqual(compared, [])
+
+    def test_fingerprint_incremental(self):
+        """ end operations keep it up to date, the rest rebuild it lazily """
+        L = LinkedList(fingerprinted=True)
+        L.fingerprint
+        for i in range(10):
+            L.append(i)
+            L.prepend(-i)
+        self.assertFresh(L)
+        L.pop()
+        del L[0]
+        L[3] = "a"
+        self.assertFresh(L)
+        L.insert(4, "b")
+        del L[2]
+        L.extend(range(3))
+        self.assertFresh(L)
+        L[1:3] = [7]
+        L.remove_if(lambda v: v == 7)
+        L.splice(LinkedList.from_iterable([1, 2], fingerprinted=True))
+        self.assertFresh(L)
+        L.splice(LinkedList.from_iterable([3]))
+        L.sort(key=str)
+        self.assertFresh(L)
+        L.split_at(5)
+        self.assertFresh(L)
+
+    def test_fingerprint_unhashable(self):
+        """ unhashable values leave no fingerprint, comparisons still work """
+        A = LinkedList.from_iterable([[1], 2], fingerprinted=True)
+        B = LinkedList.from_iterable([[1], 2], fingerprinted=True)
+        self.assertIsNone(A.fingerprint)
+        self.assertTrue(A == B)
+        del A[0]
+        self.assertIsNotNone(A.fingerprint)
+
+
 class LL_insert(LinkedList_w_els):
 
     def test_insert_empty(self):
@@ -318,6 +1430,149 @@ class LL_getItemSingle(LinkedList_w_els):
         self.assertIs(self.L._getitem__single(-2), self.L.head.next)
 
 
+class LL_pool(unittest.TestCase):
+    def setUp(self):
+        self.L = LinkedList(pool_size=4)
+        for i in range(10):
+            self.L.append(i)
+
+    def test_pool_typeError(self):
+        with self.assertRaises(TypeError):
+            LinkedList(pool_size=-1)
+
+    def test_no_pool(self):
+        """ without a pool nothing is kept or counted """
+        L = LinkedList.from_iterable(range(5))
+        del L[0]
+        L.append(5)
+        self.assertEqual((L.pooled, L.pool_hits, L.pool_misses), (0, 0, 0))
+
+    def test_reuse(self):
+        """ deleted LinkElements should be reset and handed to the next inserts """
+        misses = self.L.pool_misses
+        el = self.L.get(0)
+        del self.L[0]
+        self.assertEqual(self.L.pooled, 1)
+        self.assertIsNone(el.value)
+        self.assertIs(el.next, el)
+
+        self.L.append(10)
+        self.assertIs(self.L.tail, el)
+        self.assertEqual(self.L.pool_hits, 1)
+        self.assertEqual(self.L.pool_misses, misses)
+        self.assertEqual([x.value for x in self.L], list(range(1, 11)))
+
+    def test_bounded(self):
+        """ the pool should never hold more than pool_size LinkElements """
+        del self.L[:]
+        self.assertEqual(self.L.pooled, 4)
+        self.L.extend(range(6))
+        self.assertEqual(self.L.pooled, 0)
+        self.assertEqual(self.L.pool_hits, 4)
+        self.assertEqual([x.value for x in self.L], list(range(6)))
+
+    def test_bulk_deletes(self):
+        self.L.delete_many([0, 1])
+        self.L.remove_if(lambda v: v > 7)
+        self.assertEqual(self.L.pooled, 4)
+        self.L.insert_many([(0, "a"), (3, "b")])
+        self.L.prepend("c")
+        self.assertEqual(self.L.pooled, 1)
+        self.assertEqual([x.value for x in self.L], ["c", "a", 2, 3, 4, "b", 5, 6, 7])
+
+    def test_pop_not_pooled(self):
+        """ a popped LinkElement is the caller's, so it is not reused """
+        el = self.L.pop()
+        self.assertEqual(self.L.pooled, 0)
+        self.L.append("a")
+        self.assertEqual(el.value, 9)
+
+    def test_pop_value_pooled(self):
+        """ popping values, not LinkElements, should refill the pool """
+        values = [self.L._pop_value_after(-1) for i in range(6)]
+        self.assertEqual(values, list(range(6)))
+        self.assertEqual(self.L.pooled, 4)
+        self.L.extend(range(10, 14))
+        self.assertEqual(self.L.pool_hits, 4)
+        self.assertEqual([x.value for x in self.L], [6, 7, 8, 9, 10, 11, 12, 13])
+
+    def test_indexed(self):
+        """ reused LinkElements should be indexed like new ones """
+        L = LinkedList(indexed=True, value_indexed=True, pool_size=8)
+        model = list(range(50))
+        L.extend(model)
+        rand = random.Random(5)
+        for i in range(200):
+            if (model and rand.random() < 0.5):
+                indx = rand.randint(0, len(model) - 1)
+                del L[indx]
+                del model[indx]
+            else:
+                indx = rand.randint(0, len(model))
+                L.insert(indx, i % 7)
+                model.insert(indx, i % 7)
+        self.assertEqual([L.get(i).value for i in range(len(model))], model)
+        self.assertEqual(L.count(3), model.count(3))
+        self.assertGreater(L.pool_hits, 0)
+
+    def test_doubly(self):
+        L = DoublyLinkedList(pool_size=2)
+        L.extend(range(5))
+        del L[1]
+        L.append(5)
+        self.assertEqual(L.pool_hits, 1)
+        self.assertIs(L.head.prev, L.tail)
+        self.assertIs(L.tail.prev.next, L.tail)
+        self.assertEqual([x.value for x in L], [0, 2, 3, 4, 5])
+
+    def test_options(self):
+        """ lists split off should pool too """
+        self.assertEqual(self.L.split_at(5).pool_size, 4)
+        self.assertEqual(self.L.partition(lambda v: v % 2).pool_size, 4)
+
+
+def square(value):
+    return value * value
+
+@unittest.skipIf(concurrent is None, "concurrent.futures is not installed")
+class LL_parallel(unittest.TestCase):
+    def setUp(self):
+        self.L = LinkedList.from_iterable(range(1000))
+
+    def test_parallel_map(self):
+        L = self.L.parallel_map(square, workers=2, chunk=64)
+        self.assertIsInstance(L, LinkedList)
+        self.assertEqual([el.value for el in L], [v * v for v in range(1000)])
+        self.assertEqual(L.length, 1000)
+        L.append("a")
+        self.assertEqual(L.tail.value, "a")
+
+    def test_parallel_map_mixed(self):
+        """ chunks that are not all ints travel pickled """
+        L = LinkedList.from_iterable(["a", 1.5, "bc", 2])
+        self.assertEqual([el.value for el in L.parallel_map(str, workers=2, chunk=3)],
+                         ["a", "1.5", "bc", "2"])
+
+    def test_parallel_map_type(self):
+        L = DoublyLinkedList.from_iterable(range(10)).parallel_map(square, workers=1)
+        self.assertIsInstance(L, DoublyLinkedList)
+        self.assertIs(L.head.prev, L.tail)
+
+    def test_parallel_map_empty(self):
+        self.assertEqual(LinkedList().parallel_map(square, workers=1).length, 0)
+
+    def test_parallel_reduce(self):
+        self.assertEqual(self.L.parallel_reduce(add, workers=2, chunk=100), sum(range(1000)))
+        self.assertEqual(self.L.parallel_reduce(add, 5, workers=2, chunk=300), sum(range(1000)) + 5)
+
+    def test_parallel_reduce_empty(self):
+        self.assertEqual(LinkedList().parallel_reduce(add, 0, workers=1), 0)
+        with self.assertRaises(TypeError):
+            LinkedList().parallel_reduce(add, workers=1)
+
+    def test_chunk_ValueError(self):
+        with self.assertRaises(ValueError):
+            self.L.parallel_map(square, chunk=0)
 
 
 
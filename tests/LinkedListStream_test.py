@@ -0,0 +1,91 @@
+import sys, os, unittest, operator
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
+from linkedlist.linkedlist import LinkedList, DoublyLinkedList
+from linkedlist.stream import LinkedListStream
+
+
+class LLS_base(unittest.TestCase):
+    def setUp(self):
+        self.L = LinkedList.from_iterable(range(20))
+
+class LLS_transforms(LLS_base):
+
+    def test_stream_type(self):
+        self.assertIsInstance(self.L.stream(), LinkedListStream)
+        self.assertIsInstance(self.L.stream().map(abs), LinkedListStream)
+
+    def test_map_filter(self):
+        result = self.L.stream().map(lambda v: v * 3).filter(lambda v: v % 2).to_list()
+        self.assertEqual(result, [v * 3 for v in range(20) if (v * 3) % 2])
+
+    def test_take(self):
+        self.assertEqual(self.L.stream().take(3).to_list(), [0, 1, 2])
+        self.assertEqual(self.L.stream().take(0).to_list(), [])
+        self.assertEqual(self.L.stream().take(50).to_list(), list(range(20)))
+
+    def test_take_ValueError(self):
+        with self.assertRaises(ValueError):
+            self.L.stream().take(-1)
+
+    def test_chunk(self):
+        self.assertEqual(self.L.stream().take(7).chunk(3).to_list(), [[0, 1, 2], [3, 4, 5], [6]])
+
+    def test_chunk_ValueError(self):
+        with self.assertRaises(ValueError):
+            self.L.stream().chunk(0)
+
+    def test_lazy(self):
+        """ nothing should be read before a terminal, and take should stop reading """
+        seen = []
+        def record(v):
+            seen.append(v)
+            return v
+
+        s = self.L.stream().map(record).take(4)
+        self.assertEqual(seen, [])
+        s.to_list()
+        self.assertEqual(seen, [0, 1, 2, 3])
+
+    def test_single_use(self):
+        s = self.L.stream()
+        self.assertEqual(len(s.to_list()), 20)
+        self.assertEqual(s.to_list(), [])
+
+class LLS_terminals(LLS_base):
+
+    def test_to_linkedlist(self):
+        L = self.L.stream().filter(lambda v: v > 15).to_linkedlist()
+        self.assertIsInstance(L, LinkedList)
+        self.assertEqual([el.value for el in L], [16, 17, 18, 19])
+        self.assertEqual(L.length, 4)
+        self.assertEqual(L.tail.value, 19)
+
+    def test_to_linkedlist_type(self):
+        """ the source's type is kept unless another is asked for """
+        D = DoublyLinkedList.from_iterable(range(5))
+        self.assertIsInstance(D.stream().to_linkedlist(), DoublyLinkedList)
+        self.assertIsInstance(D.stream().to_linkedlist(LinkedList), LinkedList)
+
+    def test_to_linkedlist_no_type(self):
+        with self.assertRaises(TypeError):
+            LinkedListStream([1, 2]).to_linkedlist()
+
+    def test_reduce(self):
+        self.assertEqual(self.L.stream().reduce(operator.add), sum(range(20)))
+        self.assertEqual(self.L.stream().take(0).reduce(operator.add, 7), 7)
+        with self.assertRaises(TypeError):
+            self.L.stream().take(0).reduce(operator.add)
+
+    def test_for_each(self):
+        seen = []
+        self.L.stream().filter(lambda v: v < 3).for_each(seen.append)
+        self.assertEqual(seen, [0, 1, 2])
+
+    def test_iter(self):
+        self.assertEqual(list(self.L.stream().take(2)), [0, 1])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import sys, os, unittest, operator
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
+from linkedlist.linkedlist import LinkedList, LinkedListView
+
+
+class LLV_base(unittest.TestCase):
+    def setUp(self):
+        self.model = list(range(20))
+        self.L = LinkedList.from_iterable(self.model)
+
+class LLV_init(LLV_base):
+
+    def test_view_type(self):
+        self.assertIsInstance(self.L.view(), LinkedListView)
+        self.assertIs(self.L.view().parent, self.L)
+
+    def test_view_negative_step(self):
+        """ a view only walks forwards """
+        with self.assertRaises(ValueError):
+            self.L.view(step=-1)
+
+    def test_view_no_copy(self):
+        """ a view should hand back the parent's own LinkElements """
+        V = self.L.view(3, 9, 2)
+        self.assertIs(V[0], self.L.get(3))
+        self.assertIs(V[2], self.L.get(7))
+
+class LLV_read(LLV_base):
+
+    def test_view_iter(self):
+        """ iterating a view should match slicing """
+        for start, stop, step in [(None, None, None), (3, 9, 2), (-5, None, 1), (5, 2, None),
+                                  (None, None, 7), (0, 100, 3)]:
+            V = self.L.view(start, stop, step)
+            model = self.model[start:stop:step]
+            self.assertEqual([el.value for el in V], model)
+            self.assertEqual(len(V), len(model))
+            self.assertEqual(V.length, len(model))
+
+    def test_view_getitem(self):
+        V = self.L.view(1, 19, 3)
+        model = self.model[1:19:3]
+        for i in [0, 4, 2, 5, -1, -6, 3]:
+            self.assertEqual(V[i].value, model[i])
+
+    def test_view_getitem_IndexError(self):
+        with self.assertRaises(IndexError):
+            self.L.view(1, 5)[4]
+
+    def test_view_slice(self):
+        """ slicing a view gives a narrower view of the same parent """
+        V = self.L.view(1, 19, 2)[2:7:2]
+        self.assertIsInstance(V, LinkedListView)
+        self.assertEqual([el.value for el in V], self.model[1:19:2][2:7:2])
+
+    def test_view_count(self):
+        L = LinkedList.from_iterable([1, 2, 1, 3, 1])
+        self.assertEqual(L.view(1).count(1), 2)
+        self.assertEqual(L.view().count(4), 0)
+
+    def test_view_reduce(self):
+        V = self.L.view(2, 6)
+        self.assertEqual(V.reduce(operator.add), 2 + 3 + 4 + 5)
+        self.assertEqual(V.reduce(operator.add, 100), 100 + 2 + 3 + 4 + 5)
+        self.assertEqual(self.L.view(5, 5).reduce(operator.add, 0), 0)
+        with self.assertRaises(TypeError):
+            self.L.view(5, 5).reduce(operator.add)
+
+    def test_view_contains(self):
+        V = self.L.view(2, 6)
+        self.assertTrue(4 in V)
+        self.assertFalse(6 in V)
+
+class LLV_stale(LLV_base):
+
+    def test_view_stale_insert(self):
+        """ relinking the parent should make the view unusable """
+        V = self.L.view(2, 6)
+        self.assertFalse(V.stale)
+        self.L.append(20)
+        self.assertTrue(V.stale)
+        with self.assertRaises(RuntimeError):
+            list(V)
+        with self.assertRaises(RuntimeError):
+            V[0]
+
+    def test_view_stale_bulk(self):
+        for mutate in [lambda L: L.pop(), lambda L: L.extend([1]), lambda L: L.delete_many([0]),
+                       lambda L: L.remove_if(lambda v: v == 3), lambda L: L.insert_many([(0, 1)])]:
+            L = LinkedList.from_iterable(self.model)
+            V = L.view()
+            mutate(L)
+            self.assertTrue(V.stale)
+
+    def test_view_stale_during_iteration(self):
+        V = self.L.view()
+        with self.assertRaises(RuntimeError):
+            for el in V:
+                self.L.prepend(0)
+
+    def test_view_value_change(self):
+        """ setting values in place keeps the view usable, and visible """
+        V = self.L.view(2, 6)
+        self.L[3] = "a"
+        self.assertFalse(V.stale)
+        self.assertEqual(V[1].value, "a")
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import sys, os, unittest, random, shutil, tempfile
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
+from linkedlist.mmaplinkedlist import MmapLinkedList
+
+
+class MLL_base(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "list.mll")
+        self.L = MmapLinkedList(self.path, capacity=4)
+        for i in range(10):
+            self.L.append(i)
+
+    def tearDown(self):
+        self.L.close()
+        shutil.rmtree(self.dir)
+
+class MLL_init(MLL_base):
+
+    def test_empty(self):
+        L = MmapLinkedList(os.path.join(self.dir, "empty.mll"))
+        self.assertEqual(L.length, 0)
+        self.assertEqual(list(L), [])
+        self.assertEqual(L.dtype, "q")
+        L.close()
+
+    def test_grow(self):
+        """ the file should have grown to fit the values """
+        self.assertTrue(self.L.capacity >= 10)
+        self.assertEqual(list(self.L), list(range(10)))
+
+    def test_reopen(self):
+        """ reopening the file should find the list as it was """
+        self.L.prepend(-1)
+        self.L.pop()
+        self.L.close()
+        self.L = MmapLinkedList(self.path)
+        self.assertEqual(list(self.L), list(range(-1, 9)))
+        self.assertEqual(self.L.length, 10)
+        self.L.append(9)
+        self.assertEqual(self.L.get(-1), 9)
+
+    def test_reopen_dtype(self):
+        self.L.close()
+        with self.assertRaises(ValueError):
+            MmapLinkedList(self.path, dtype="d")
+        self.L = MmapLinkedList(self.path, dtype="q")
+
+    def test_not_a_list(self):
+        path = os.path.join(self.dir, "other")
+        with open(path, "wb") as f:
+            f.write(b"x" * 100)
+        with self.assertRaises(ValueError):
+            MmapLinkedList(path)
+
+    def test_dtype_TypeError(self):
+        with self.assertRaises(TypeError):
+            MmapLinkedList(os.path.join(self.dir, "bad.mll"), dtype="x")
+        with self.assertRaises(TypeError):
+            self.L.append("a")
+        self.assertEqual(list(self.L), list(range(10)))
+
+    def test_context_manager(self):
+        with MmapLinkedList(os.path.join(self.dir, "ctx.mll")) as L:
+            L.append(1)
+        with MmapLinkedList(os.path.join(self.dir, "ctx.mll")) as L:
+            self.assertEqual(list(L), [1])
+
+class MLL_dtypes(MLL_base):
+
+    def test_floats(self):
+        with MmapLinkedList(os.path.join(self.dir, "f.mll"), dtype="d") as L:
+            L.append(1.5)
+            L.prepend(-0.25)
+            self.assertEqual(list(L), [-0.25, 1.5])
+
+    def test_objects(self):
+        """ objects are pickled into the heap file, and survive reopening """
+        path = os.path.join(self.dir, "o.mll")
+        with MmapLinkedList(path, dtype="O") as L:
+            L.append({"a": 1})
+            L.append("text")
+            L.insert(1, (1, 2))
+            L[0] = None
+        with MmapLinkedList(path) as L:
+            self.assertEqual(L.dtype, "O")
+            self.assertEqual(list(L), [None, (1, 2), "text"])
+
+    def test_unpicklable(self):
+        """ a value that cannot be pickled should not use up a slot """
+        with MmapLinkedList(os.path.join(self.dir, "u.mll"), dtype="O", capacity=3) as L:
+            L.append(1)
+            for i in range(3):
+                with self.assertRaises(Exception):
+                    L.append(lambda: 0)
+            L.append(2)
+            L.append(3)
+            self.assertEqual(L.capacity, 3)
+            self.assertEqual(list(L), [1, 2, 3])
+
+class MLL_mutations(MLL_base):
+
+    def test_get(self):
+        for i in range(-10, 10):
+            self.assertEqual(self.L.get(i), list(range(10))[i])
+        with self.assertRaises(IndexError):
+            self.L.get(10)
+
+    def test_pop(self):
+        self.assertEqual([self.L.pop() for i in range(10)], list(reversed(range(10))))
+        with self.assertRaises(IndexError):
+            self.L.pop()
+
+    def test_reuse_slots(self):
+        """ freed slots should be used again before the file grows """
+        capacity = self.L.capacity
+        for i in range(5):
+            del self.L[0]
+        for i in range(5):
+            self.L.append(i)
+        self.assertEqual(self.L.capacity, capacity)
+
+    def test_contains_repr(self):
+        self.assertTrue(9 in self.L)
+        self.assertFalse(10 in self.L)
+        self.assertEqual(repr(self.L), repr(list(range(10))))
+
+    def test_mixed(self):
+        rand = random.Random(11)
+        model = list(range(10))
+        for i in range(500):
+            op = rand.randint(0, 5)
+            if (op == 0):
+                self.L.append(i)
+                model.append(i)
+            elif (op == 1):
+                self.L.prepend(i)
+                model.insert(0, i)
+            elif (op == 2):
+                indx = rand.randint(0, len(model))
+                self.L.insert(indx, i)
+                model.insert(indx, i)
+            elif (op == 3 and model):
+                self.assertEqual(self.L.pop(), model.pop())
+            elif (op == 4 and model):
+                indx = rand.randint(0, len(model) - 1)
+                del self.L[indx]
+                del model[indx]
+            elif (op == 5 and model):
+                indx = rand.randint(-len(model), len(model) - 1)
+                self.assertEqual(self.L[indx], model[indx])
+        self.assertEqual(list(self.L), model)
+        self.L.close()
+        self.L = MmapLinkedList(self.path)
+        self.assertEqual(list(self.L), model)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import sys, os, unittest, io, pickle
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
+from linkedlist.linkedlist import LinkedList, DoublyLinkedList
+from linkedlist.sortedlinkedlist import SortedLinkedList
+from linkedlist import snapshot
+
+
+class Snapshot_base(unittest.TestCase):
+
+    def roundtrip(self, L, **kwargs):
+        f = io.BytesIO()
+        L.dump(f)
+        f.seek(0)
+        return type(L).load(f, **kwargs), f.getvalue()
+
+class Snapshot_dump_load(Snapshot_base):
+
+    def test_ints(self):
+        """ a chunk of ints is packed 8 bytes to the value """
+        L = LinkedList.from_iterable(range(-5, 100))
+        new, data = self.roundtrip(L)
+        self.assertEqual([el.value for el in new], list(range(-5, 100)))
+        self.assertEqual(len(data), snapshot._HEADER.size + snapshot._CHUNK.size + 8 * 105)
+
+    def test_floats(self):
+        values = [i / 3.0 for i in range(50)]
+        new, data = self.roundtrip(LinkedList.from_iterable(values))
+        self.assertEqual([el.value for el in new], values)
+        self.assertEqual(len(data), snapshot._HEADER.size + snapshot._CHUNK.size + 8 * 50)
+
+    def test_objects(self):
+        """ anything else is pickled, a chunk at a time """
+        values = ["a", None, (1, 2), 2 ** 70, True, 1.5, 3]
+        new, data = self.roundtrip(LinkedList.from_iterable(values))
+        self.assertEqual([el.value for el in new], values)
+        self.assertEqual([type(el.value) for el in new], [type(v) for v in values])
+
+    def test_chunks(self):
+        """ chunks are packed independently """
+        values = list(range(snapshot.CHUNK_SIZE)) + ["a"] + [0.5] * 10
+        new, data = self.roundtrip(LinkedList.from_iterable(values))
+        self.assertEqual([el.value for el in new], values)
+        self.assertEqual(new.length, len(values))
+        self.assertIs(new.tail.next, new.head)
+
+    def test_empty(self):
+        new, data = self.roundtrip(LinkedList())
+        self.assertEqual(new.length, 0)
+        self.assertEqual(len(data), snapshot._HEADER.size)
+
+    def test_load_type(self):
+        new, data = self.roundtrip(DoublyLinkedList.from_iterable(range(3)), indexed=True)
+        self.assertIsInstance(new, DoublyLinkedList)
+        self.assertTrue(new.indexed)
+        self.assertIs(new.head.prev, new.tail)
+
+    def test_load_sorted(self):
+        f = io.BytesIO()
+        LinkedList.from_iterable([3, 1, 2]).dump(f)
+        f.seek(0)
+        self.assertEqual([el.value for el in SortedLinkedList.load(f)], [1, 2, 3])
+
+    def test_load_stream(self):
+        """ two snapshots can follow each other in one file """
+        f = io.BytesIO()
+        LinkedList.from_iterable([1, 2]).dump(f)
+        LinkedList.from_iterable(["a"]).dump(f)
+        f.seek(0)
+        self.assertEqual([el.value for el in LinkedList.load(f)], [1, 2])
+        self.assertEqual([el.value for el in LinkedList.load(f)], ["a"])
+
+class Snapshot_errors(Snapshot_base):
+
+    def test_bad_magic(self):
+        with self.assertRaises(ValueError):
+            LinkedList.load(io.BytesIO(b"NOPE" + b"\0" * 20))
+
+    def test_bad_version(self):
+        f = io.BytesIO(snapshot._HEADER.pack(snapshot.MAGIC, snapshot.VERSION + 1, 0))
+        with self.assertRaises(ValueError):
+            LinkedList.load(f)
+
+    def test_truncated(self):
+        f = io.BytesIO()
+        LinkedList.from_iterable(range(10)).dump(f)
+        with self.assertRaises(ValueError):
+            LinkedList.load(io.BytesIO(f.getvalue()[:-3]))
+
+class Snapshot_pickle(unittest.TestCase):
+
+    def test_pickle(self):
+        L = LinkedList.from_iterable(range(10), value_indexed=True)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            new = pickle.loads(pickle.dumps(L, protocol))
+            self.assertEqual([el.value for el in new], list(range(10)))
+            self.assertTrue(new.value_indexed)
+
+    def test_pickle_long(self):
+        """ pickling should not recurse down the chain """
+        L = LinkedList.from_iterable(range(sys.getrecursionlimit() * 3))
+        new = pickle.loads(pickle.dumps(L, 2))
+        self.assertEqual(new.length, L.length)
+        self.assertTrue(new == L)
+
+    def test_pickle_types(self):
+        for L in [DoublyLinkedList.from_iterable("abc"), SortedLinkedList.from_iterable([3, 1, 2])]:
+            new = pickle.loads(pickle.dumps(L))
+            self.assertIs(type(new), type(L))
+            self.assertEqual([el.value for el in new], [el.value for el in L])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+import sys, os, unittest, random, bisect
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
+from linkedlist.linkedlist import LinkedList
+from linkedlist.sortedlinkedlist import SortedLinkedList
+
+
+class SLL_base(unittest.TestCase):
+    def setUp(self):
+        rand = random.Random(2)
+        self.model = [rand.randint(0, 40) for i in range(100)]
+        self.L = SortedLinkedList()
+        for value in self.model:
+            self.L.add(value)
+        self.model.sort()
+
+    def assertConsistent(self, L, model):
+        """ values should match model, and the index should find every position """
+        self.assertEqual([el.value for el in L], model)
+        self.assertEqual(L.length, len(model))
+        nodes = list(L)
+        for i in range(len(nodes)):
+            self.assertIs(L.get(i), nodes[i])
+
+class SLL_init(unittest.TestCase):
+
+    def test_empty(self):
+        L = SortedLinkedList()
+        self.assertEqual(L.length, 0)
+        self.assertTrue(L.indexed)
+        self.assertIsNone(L.key)
+        self.assertEqual(L.bisect_left(3), 0)
+        self.assertFalse(3 in L)
+
+    def test_from_iterable(self):
+        L = SortedLinkedList.from_iterable([5, 1, 4, 1], key=lambda v: -v)
+        self.assertEqual([el.value for el in L], [5, 4, 1, 1])
+        self.assertIsInstance(L, SortedLinkedList)
+
+class SLL_write(SLL_base):
+
+    def test_add(self):
+        self.assertConsistent(self.L, self.model)
+
+    def test_add_stable(self):
+        """ values with equal keys keep the order they were added in """
+        L = SortedLinkedList(key=lambda v: v[0])
+        for value in [(1, "a"), (0, "b"), (1, "c"), (0, "d")]:
+            L.add(value)
+        self.assertEqual([el.value for el in L], [(0, "b"), (0, "d"), (1, "a"), (1, "c")])
+
+    def test_remove(self):
+        for value in [0, 40, 20, self.model[50]]:
+            if (value in self.model):
+                self.L.remove(value)
+                self.model.remove(value)
+        self.assertConsistent(self.L, self.model)
+
+    def test_remove_ValueError(self):
+        with self.assertRaises(ValueError):
+            self.L.remove(41)
+
+    def test_remove_key(self):
+        """ remove should find its value among those sharing a key """
+        L = SortedLinkedList(key=lambda v: v[0])
+        L.extend([(1, "a"), (1, "b"), (1, "c")])
+        L.remove((1, "b"))
+        self.assertEqual([el.value for el in L], [(1, "a"), (1, "c")])
+
+    def test_extend(self):
+        """ values after the tail are linked on in one go, others added """
+        self.L.extend([50, 45, 60])
+        self.L.extend([3, -1, 70])
+        self.model = sorted(self.model + [50, 45, 60, 3, -1, 70])
+        self.assertConsistent(self.L, self.model)
+
+    def test_positional_writes(self):
+        for write in [lambda L: L.append(1), lambda L: L.prepend(1), lambda L: L.insert(0, 1),
+                      lambda L: L.insert_many([(0, 1)]), lambda L: L.sort()]:
+            with self.assertRaises(NotImplementedError):
+                write(self.L)
+        with self.assertRaises(NotImplementedError):
+            self.L[0] = 1
+
+    def test_delete(self):
+        """ deletes and pops keep the order """
+        del self.L[3]
+        del self.model[3]
+        self.assertEqual(self.L.pop().value, self.model.pop())
+        del self.L[::4]
+        del self.model[::4]
+        self.assertConsistent(self.L, self.model)
+
+class SLL_read(SLL_base):
+
+    def test_bisect(self):
+        for value in range(-1, 42):
+            self.assertEqual(self.L.bisect_left(value), bisect.bisect_left(self.model, value))
+            self.assertEqual(self.L.bisect_right(value), bisect.bisect_right(self.model, value))
+
+    def test_bisect_key(self):
+        L = SortedLinkedList.from_iterable(range(10), key=lambda v: -v)
+        self.assertEqual(L.bisect_left(7), 2)
+        self.assertEqual(L.bisect_right(7), 3)
+
+    def test_irange(self):
+        for lo, hi in [(None, None), (5, 20), (None, 10), (30, None), (20, 5), (-5, 100)]:
+            for inclusive in [(True, True), (False, True), (True, False), (False, False)]:
+                expected = [v for v in self.model
+                            if (lo is None or v > lo or (inclusive[0] and v == lo))
+                            and (hi is None or v < hi or (inclusive[1] and v == hi))]
+                self.assertEqual([el.value for el in self.L.irange(lo, hi, inclusive)], expected)
+
+    def test_nsmallest(self):
+        self.assertEqual([el.value for el in self.L.nsmallest(5)], self.model[:5])
+        self.assertEqual(len(self.L.nsmallest(500)), 100)
+        self.assertEqual(self.L.nsmallest(0), [])
+
+    def test_lookups(self):
+        for value in range(-1, 42):
+            self.assertEqual(value in self.L, value in self.model)
+            self.assertEqual(self.L.count(value), self.model.count(value))
+            if (value in self.model):
+                self.assertEqual(self.L.index(value), self.model.index(value))
+                self.assertIs(self.L.find(value), self.L.get(self.model.index(value)))
+            else:
+                self.assertIsNone(self.L.find(value))
+                with self.assertRaises(ValueError):
+                    self.L.index(value)
+
+    def test_unindexed(self):
+        """ with the index dropped, bisects walk the chain instead """
+        self.L.indexed = False
+        self.assertEqual(self.L.bisect_left(20), bisect.bisect_left(self.model, 20))
+        self.L.add(20)
+        self.assertEqual(self.L.count(20), self.model.count(20) + 1)
+
+class SLL_copies(SLL_base):
+
+    def test_slice(self):
+        L = self.L[10:30:2]
+        self.assertIsInstance(L, SortedLinkedList)
+        self.assertConsistent(L, self.model[10:30:2])
+        L.add(25)
+        self.assertEqual([el.value for el in L], sorted(self.model[10:30:2] + [25]))
+
+    def test_slice_backwards(self):
+        L = self.L[::-1]
+        self.assertNotIsInstance(L, SortedLinkedList)
+        self.assertEqual([el.value for el in L], self.model[::-1])
+
+    def test_slice_key(self):
+        L = SortedLinkedList.from_iterable(range(10), key=lambda v: -v)
+        self.assertIs(L[2:5].key, L.key)
+
+    def test_add_lists(self):
+        other = LinkedList.from_iterable([100, -3, 7])
+        L = self.L + other
+        self.assertIsInstance(L, SortedLinkedList)
+        self.assertConsistent(L, sorted(self.model + [100, -3, 7]))
+
+    def test_splice(self):
+        """ spliced values are added in order, other left empty """
+        other = LinkedList.from_iterable([100, -3, 7])
+        self.L.splice(other)
+        self.assertConsistent(self.L, sorted(self.model + [100, -3, 7]))
+        self.assertEqual(other.length, 0)
+
+    def test_iadd(self):
+        L = self.L
+        L += [100, -3]
+        self.assertIs(L, self.L)
+        self.assertConsistent(self.L, sorted(self.model + [100, -3]))
+
+    def test_split_partition(self):
+        """ both halves stay sorted lists with the same key """
+        L = SortedLinkedList.from_iterable(range(10), key=lambda v: -v)
+        new = L.split_at(4)
+        self.assertIsInstance(new, SortedLinkedList)
+        self.assertIs(new.key, L.key)
+        new.add(20)
+        self.assertConsistent(new, [20, 5, 4, 3, 2, 1, 0])
+        odd = L.partition(lambda v: v % 2)
+        self.assertIs(odd.key, L.key)
+        self.assertConsistent(odd, [9, 7])
+        self.assertConsistent(L, [8, 6])
+
+    def test_mul(self):
+        L = SortedLinkedList.from_iterable([2, 1]) * 2
+        self.assertConsistent(L, [1, 1, 2, 2])
+
+class SLL_mixed(SLL_base):
+
+    def test_mixed(self):
+        """ order and positions should hold through any mix of adds and removes """
+        rand = random.Random(12)
+        for i in range(500):
+            value = rand.randint(-10, 50)
+            if (rand.random() < 0.6):
+                self.L.add(value)
+                bisect.insort(self.model, value)
+            elif (value in self.model):
+                self.L.remove(value)
+                self.model.remove(value)
+        self.assertConsistent(self.L, self.model)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import sys, os, unittest
+from array import array
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
+from linkedlist.typedlinkedlist import TypedLinkedList
+from linkedlist import typedlinkedlist
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TLL_base(unittest.TestCase):
+    def setUp(self):
+        self.model = [((i * 37) % 11) / 4.0 for i in range(30)]
+        self.L = TypedLinkedList("d", capacity=4)
+        for value in self.model:
+            self.L.append(value)
+
+class TLL_init(TLL_base):
+
+    def test_blocks_are_arrays(self):
+        """ every block should be a typed array """
+        block = self.L.head.next
+        while (block is not self.L.head):
+            self.assertIsInstance(block.value, array)
+            self.assertEqual(block.value.typecode, "d")
+            block = block.next
+
+    def test_dtype_TypeError(self):
+        with self.assertRaises(TypeError):
+            TypedLinkedList("x")
+
+    def test_store_TypeError(self):
+        """ only numbers fit in the arrays """
+        with self.assertRaises(TypeError):
+            self.L.append("a")
+
+    def test_mutations(self):
+        """ the UnrolledLinkedList operations keep working on arrays """
+        self.L.insert(3, 100.0)
+        self.model.insert(3, 100.0)
+        self.L.prepend(-1.0)
+        self.model.insert(0, -1.0)
+        del self.L[10]
+        del self.model[10]
+        del self.L[::3]
+        del self.model[::3]
+        self.assertEqual(self.L.pop(), self.model.pop())
+        self.assertEqual(list(self.L), self.model)
+
+    def test_slice(self):
+        L = self.L[2:20:3]
+        self.assertIsInstance(L, TypedLinkedList)
+        self.assertEqual(L.dtype, "d")
+        self.assertEqual(L.capacity, 4)
+        self.assertEqual(list(L), self.model[2:20:3])
+
+class TLL_reductions(TLL_base):
+
+    def test_reductions(self):
+        self.assertAlmostEqual(self.L.sum(), sum(self.model))
+        self.assertEqual(self.L.min(), min(self.model))
+        self.assertEqual(self.L.max(), max(self.model))
+        self.assertAlmostEqual(self.L.mean(), sum(self.model) / len(self.model))
+        self.assertEqual(self.L.argmax(), self.model.index(max(self.model)))
+
+    def test_ints(self):
+        L = TypedLinkedList("l", capacity=3)
+        for value in [3, 9, 2, 9, -4]:
+            L.append(value)
+        self.assertEqual(L.sum(), 19)
+        self.assertEqual(L.argmax(), 1)
+        self.assertEqual(L.min(), -4)
+
+    def test_empty(self):
+        L = TypedLinkedList()
+        self.assertEqual(L.sum(), 0)
+        for reduction in [L.min, L.max, L.mean, L.argmax]:
+            with self.assertRaises(ValueError):
+                reduction()
+
+    def test_without_numpy(self):
+        """ the builtins take over when numpy is missing """
+        saved = typedlinkedlist.numpy
+        typedlinkedlist.numpy = None
+        try:
+            self.assertAlmostEqual(self.L.sum(), sum(self.model))
+            self.assertEqual(self.L.argmax(), self.model.index(max(self.model)))
+            with self.assertRaises(ImportError):
+                self.L.to_numpy()
+        finally:
+            typedlinkedlist.numpy = saved
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TLL_numpy(TLL_base):
+
+    def test_to_numpy(self):
+        out = self.L.to_numpy()
+        self.assertEqual(out.dtype, numpy.dtype("d"))
+        self.assertEqual(out.tolist(), self.model)
+
+    def test_apply_ufunc(self):
+        L = self.L.apply_ufunc(numpy.multiply, 2)
+        self.assertIsInstance(L, TypedLinkedList)
+        self.assertEqual(list(L), [v * 2 for v in self.model])
+        self.assertEqual(list(self.L), self.model)
+
+    def test_apply_ufunc_dtype(self):
+        L = TypedLinkedList("l")
+        for i in range(5):
+            L.append(i)
+        self.assertEqual(L.apply_ufunc(numpy.sqrt).dtype, "d")
+
+    def test_apply_ufunc_empty(self):
+        """ an empty list should still give the ufunc's result dtype """
+        self.assertEqual(TypedLinkedList("l").apply_ufunc(numpy.sqrt).dtype, "d")
+        self.assertEqual(TypedLinkedList("l").apply_ufunc(numpy.sqrt).length, 0)
+
+    def test_python_numbers(self):
+        """ reductions should give python numbers, as without numpy """
+        self.assertIs(type(self.L.sum()), float)
+        self.assertIs(type(self.L.min()), float)
+        self.assertIs(type(self.L.max()), float)
+
+    def test_apply_ufunc_bool(self):
+        """ bool results have no typecode of their own, so are stored as bytes """
+        L = self.L.apply_ufunc(numpy.greater, self.model[3])
+        self.assertEqual(L.dtype, "B")
+        self.assertEqual(list(L), [int(v > self.model[3]) for v in self.model])
+
+    def test_apply_ufunc_typeError(self):
+        """ results no array typecode can hold should raise TypeError """
+        with self.assertRaises(TypeError):
+            self.L.apply_ufunc(numpy.multiply, 1j)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
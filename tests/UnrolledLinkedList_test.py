@@ -0,0 +1,212 @@
+import sys, os, unittest, random
+if os.getcwd() not in sys.path:
+    sys.path.append(os.getcwd())
+from linkedlist.unrolledlinkedlist import UnrolledLinkedList
+
+
+class ULL_base(unittest.TestCase):
+    def setUp(self):
+        self.L = UnrolledLinkedList(capacity=4)
+        for i in range(10):
+            self.L.append(i)
+
+    def assertConsistent(self, L, model):
+        """ values should match model, and blocks should be non-empty, within
+            capacity, and link back to each other
+        """
+        self.assertEqual(list(L), model)
+        self.assertEqual(L.length, len(model))
+        self.assertEqual(len(L), len(model))
+
+        block = L.head.next
+        total = 0
+        while (block is not L.head):
+            self.assertTrue(0 < len(block.value) <= L.capacity)
+            self.assertIs(block.next.prev, block)
+            total += len(block.value)
+            block = block.next
+        self.assertEqual(total, len(model))
+
+class ULL_init(unittest.TestCase):
+
+    def test_empty(self):
+        L = UnrolledLinkedList()
+        self.assertEqual(L.length, 0)
+        self.assertEqual(list(L), [])
+        self.assertEqual(L.capacity, 64)
+
+    def test_capacity_typeError(self):
+        with self.assertRaises(TypeError):
+            UnrolledLinkedList(capacity=1)
+
+class ULL_write(ULL_base):
+
+    def test_append(self):
+        """ appending should fill the last block before starting a new one """
+        self.assertConsistent(self.L, list(range(10)))
+        self.assertEqual(self.L.head.prev.value, [8, 9])
+
+    def test_prepend(self):
+        self.L.prepend(-1)
+        self.assertConsistent(self.L, list(range(-1, 10)))
+
+    def test_insert_split(self):
+        """ inserting into a full block should split it """
+        self.L.insert(1, "tester")
+        self.assertConsistent(self.L, [0, "tester"] + list(range(1, 10)))
+        self.assertEqual(self.L.head.next.value, [0, "tester", 1])
+
+    def test_insert_end(self):
+        self.L.insert(10, "tester")
+        self.assertConsistent(self.L, list(range(10)) + ["tester"])
+
+    def test_pop(self):
+        """ pop should return values from the end, dropping emptied blocks """
+        self.assertEqual([self.L.pop() for i in range(10)], list(reversed(range(10))))
+        self.assertConsistent(self.L, [])
+
+    def test_pop_empty(self):
+        with self.assertRaises(IndexError):
+            UnrolledLinkedList().pop()
+
+    def test_delitem_merge(self):
+        """ a block falling under half full should merge with the next block """
+        del self.L[4]
+        del self.L[4]
+        del self.L[4]
+        self.assertConsistent(self.L, [0, 1, 2, 3, 7, 8, 9])
+        self.assertEqual(self.L.head.prev.value, [7, 8, 9])
+
+class ULL_read(ULL_base):
+
+    def test_get(self):
+        for i in range(-10, 10):
+            self.assertEqual(self.L.get(i), list(range(10))[i])
+
+    def test_get_IndexError(self):
+        with self.assertRaises(IndexError):
+            self.L.get(10)
+
+    def test_contains(self):
+        self.assertTrue(9 in self.L)
+        self.assertFalse(10 in self.L)
+
+    def test_repr(self):
+        self.assertEqual(repr(self.L), repr(list(range(10))))
+
+class ULL_slice(ULL_base):
+
+    def test_getitem_slices(self):
+        """ slicing should match python's list slicing """
+        model = list(range(10))
+        for key in [slice(None), slice(2, 7), slice(1, None, 3), slice(None, None, -1),
+                    slice(8, 1, -2), slice(-3, None), slice(5, 2)]:
+            self.assertEqual(list(self.L[key]), model[key])
+
+    def test_setitem_slice(self):
+        model = list(range(10))
+        self.L[1:8:3] = ["a", "b", "c"]
+        model[1:8:3] = ["a", "b", "c"]
+        self.L[::-4] = ["x", "y", "z"]
+        model[::-4] = ["x", "y", "z"]
+        self.assertConsistent(self.L, model)
+
+    def test_setitem_slice_size(self):
+        with self.assertRaises(ValueError):
+            self.L[::2] = [1]
+
+    def test_delitem_slice(self):
+        model = list(range(10))
+        del self.L[1::3]
+        del model[1::3]
+        self.assertConsistent(self.L, model)
+
+    def test_delitem_slices(self):
+        """ deleting should match python's list, whatever the slice """
+        for key in [slice(None), slice(2, 7), slice(1, None, 3), slice(None, None, -1),
+                    slice(8, 1, -2), slice(-3, None), slice(5, 2), slice(3, 4), slice(0, 9, 4)]:
+            L = UnrolledLinkedList(capacity=4)
+            for i in range(30):
+                L.append(i)
+            model = list(range(30))
+            del L[key]
+            del model[key]
+            self.assertConsistent(L, model)
+            L.insert(len(model) // 2, "a")
+            model.insert(len(model) // 2, "a")
+            self.assertConsistent(L, model)
+
+    def test_delitem_slice_local(self):
+        """ only the blocks the slice covers should change """
+        blocks = []
+        block = self.L.head.next
+        while (block is not self.L.head):
+            blocks.append((block, list(block.value)))
+            block = block.next
+        del self.L[5:7]
+        self.assertIs(self.L.head.next, blocks[0][0])
+        self.assertEqual(self.L.head.next.value, blocks[0][1])
+        self.assertConsistent(self.L, [0, 1, 2, 3, 4, 7, 8, 9])
+
+    def test_setitem_slice_resize(self):
+        """ as with list, a plain slice can be given more or fewer values """
+        model = list(range(10))
+        for key, values in [(slice(2, 4), list("abcdefghij")), (slice(1, 12), ["x"]),
+                            (slice(3, 3), ["y", "z"]), (slice(None), list(range(7))),
+                            (slice(7, None), ["end"]), (slice(0, 2), [])]:
+            self.L[key] = values
+            model[key] = values
+            self.assertConsistent(self.L, model)
+            self.assertEqual([self.L[i] for i in range(len(model))], model)
+
+class ULL_mixed(ULL_base):
+
+    def test_mixed(self):
+        """ blocks should stay consistent through any mix of mutations """
+        rand = random.Random(9)
+        model = list(range(10))
+        for i in range(600):
+            op = rand.randint(0, 5)
+            if (op == 0):
+                self.L.append(i)
+                model.append(i)
+            elif (op == 1):
+                self.L.prepend(i)
+                model.insert(0, i)
+            elif (op == 2):
+                indx = rand.randint(0, len(model))
+                self.L.insert(indx, i)
+                model.insert(indx, i)
+            elif (op == 3 and model):
+                self.assertEqual(self.L.pop(), model.pop())
+            elif (op == 4 and model):
+                indx = rand.randint(0, len(model) - 1)
+                del self.L[indx]
+                del model[indx]
+            elif (op == 5 and model):
+                indx = rand.randint(-len(model), len(model) - 1)
+                self.assertEqual(self.L[indx], model[indx])
+            self.assertConsistent(self.L, model)
+
+    def test_mixed_slices(self):
+        """ blocks should stay consistent through slice deletes and assignments """
+        rand = random.Random(12)
+        model = list(range(10))
+        for i in range(300):
+            start = rand.randint(-3, len(model) + 2)
+            stop = rand.randint(-3, len(model) + 2)
+            if (rand.random() < 0.5):
+                key = slice(start, stop, rand.choice([None, 1, 2, 3, -1, -2]))
+                del self.L[key]
+                del model[key]
+            else:
+                key = slice(start, stop)
+                values = [(i, j) for j in range(rand.randint(0, 9))]
+                self.L[key] = values
+                model[key] = values
+            self.assertConsistent(self.L, model)
+
+
+
+if __name__ == '__main__':
+    unittest.main()